@@ -4,7 +4,7 @@ from .models import Student
 
 @admin.register(Student)
 class StudentAdmin(admin.ModelAdmin):
-    list_display = ['name', 'phone_number', 'telegram_id', 'created_at']
+    list_display = ['name', 'phone_number', 'telegram_id', 'language', 'created_at']
     search_fields = ['name', 'phone_number', 'telegram_id']
-    list_filter = ['created_at']
+    list_filter = ['language', 'created_at']
     readonly_fields = ['created_at', 'auth_token', 'token_created_at']
\ No newline at end of file
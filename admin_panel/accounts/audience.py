@@ -0,0 +1,77 @@
+# accounts/audience.py
+from datetime import datetime, time
+
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+from payment.models import Payment
+
+from .models import Student
+
+
+def _parse_moment(name, value):
+    """ISO date (midnight) or datetime as an aware datetime, so the
+    ``created_at`` index can serve the range"""
+    try:
+        moment = parse_datetime(value)
+        day = parse_date(value) if moment is None else None
+    except ValueError:
+        moment = day = None
+    if moment is None:
+        if day is None:
+            raise ValidationError({name: "Expected an ISO date or datetime."})
+        moment = datetime.combine(day, time.min)
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def filter_audience(queryset, params):
+    """
+    Narrow a Student queryset to a broadcast audience.
+
+    - ``course``: students with a payment for this course; only confirmed
+      ones (buyers) unless ``payment_status`` says otherwise
+    - ``payment_status``: students with a payment in this status
+    - ``registered_after`` / ``registered_before``: ISO date or datetime
+      bounds on ``created_at`` (after is inclusive, before exclusive)
+    - ``language``: one of Student.LANGUAGE_CHOICES
+
+    Payment filters are a correlated EXISTS, so students with several
+    matching payments appear once and the id ordering of the cursor
+    pagination is kept without DISTINCT.
+    """
+    course = params.get("course")
+    payment_status = params.get("payment_status")
+    if course is not None or payment_status is not None:
+        payments = Payment.objects.filter(student=OuterRef("pk"))
+        if course is not None:
+            if not course.isdigit():
+                raise ValidationError({"course": "Expected a course id."})
+            payments = payments.filter(course_id=int(course))
+            payment_status = payment_status or Payment.CONFIRMED
+        if payment_status not in dict(Payment.STATUS_CHOICES):
+            raise ValidationError({"payment_status": "Unknown payment status."})
+        payments = payments.filter(status=payment_status)
+        queryset = queryset.filter(Exists(payments))
+
+    registered_after = params.get("registered_after")
+    if registered_after is not None:
+        queryset = queryset.filter(
+            created_at__gte=_parse_moment("registered_after", registered_after)
+        )
+    registered_before = params.get("registered_before")
+    if registered_before is not None:
+        queryset = queryset.filter(
+            created_at__lt=_parse_moment("registered_before", registered_before)
+        )
+
+    language = params.get("language")
+    if language is not None:
+        if language not in dict(Student.LANGUAGE_CHOICES):
+            raise ValidationError({"language": "Unknown language."})
+        queryset = queryset.filter(language=language)
+
+    return queryset
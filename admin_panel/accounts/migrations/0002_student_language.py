@@ -0,0 +1,18 @@
+# Generated by Django 5.1.3 on 2026-10-17 21:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='student',
+            name='language',
+            field=models.CharField(choices=[('uz', "O'zbek"), ('en', 'English')], default='uz', max_length=2),
+        ),
+    ]
@@ -8,9 +8,17 @@ from hashlib import sha256
 
 
 class Student(models.Model):
+    UZBEK = "uz"
+    ENGLISH = "en"
+    LANGUAGE_CHOICES = [
+        (UZBEK, "O'zbek"),
+        (ENGLISH, "English"),
+    ]
+
     name = models.CharField(max_length=255)
     phone_number = models.CharField(max_length=255, null=True, blank=True)
     telegram_id = models.CharField(max_length=255, unique=True)
+    language = models.CharField(max_length=2, choices=LANGUAGE_CHOICES, default=UZBEK)
     created_at = models.DateTimeField(auto_now_add=True)  # Add this field
 
     auth_token = models.CharField(max_length=255, null=True, blank=True, unique=True)
@@ -32,11 +40,17 @@ class Student(models.Model):
         self.save()
         return self.auth_token  # return hashed token
 
+    def token_expires_at(self):
+        """When the current token stops being valid (24 hours after issue)"""
+        if not self.token_created_at:
+            return None
+        return self.token_created_at + timezone.timedelta(hours=24)
+
     def is_token_valid(self):
         """Check if token is still valid (within 24 hours)"""
         if not self.token_created_at:
             return False
-        return timezone.now() < self.token_created_at + timezone.timedelta(hours=24)
+        return timezone.now() < self.token_expires_at()
 
     def __str__(self):
         return self.name
@@ -44,3 +58,8 @@ class Student(models.Model):
     class Meta:
         verbose_name = "Student"
         verbose_name_plural = "Students"
+        indexes = [
+            # Back broadcast audience filters walked in id (cursor) order
+            models.Index(fields=["language", "id"], name="student_language_id_idx"),
+            models.Index(fields=["created_at"], name="student_created_at_idx"),
+        ]
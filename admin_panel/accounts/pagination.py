@@ -0,0 +1,14 @@
+# accounts/pagination.py
+from rest_framework.pagination import CursorPagination
+
+
+class StudentCursorPagination(CursorPagination):
+    """
+    Keyset pagination over the primary key: every page is an indexed range
+    scan, however deep into the table the cursor is.
+    """
+
+    ordering = "id"
+    page_size = 500
+    page_size_query_param = "page_size"
+    max_page_size = 2000
@@ -8,10 +8,19 @@ class StudentSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Student
-        fields = ["id", "name", "telegram_id", "phone_number", "purchased_courses"]
+        fields = [
+            "id",
+            "name",
+            "telegram_id",
+            "phone_number",
+            "language",
+            "purchased_courses",
+        ]
 
     def get_purchased_courses(self, obj):
-        confirmed_payments = obj.payments.filter(status="confirmed")
+        confirmed_payments = obj.payments.filter(status="confirmed").select_related(
+            "course"
+        )
         return [
             {
                 "id": payment.course.id,
@@ -20,3 +29,11 @@ class StudentSerializer(serializers.ModelSerializer):
             }
             for payment in confirmed_payments
         ]
+
+
+class StudentCompactSerializer(serializers.ModelSerializer):
+    """Just what broadcasts need; no per-student payment queries"""
+
+    class Meta:
+        model = Student
+        fields = ["id", "telegram_id", "language"]
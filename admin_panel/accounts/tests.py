@@ -1,3 +1,194 @@
-from django.test import TestCase
+from datetime import timedelta
 
-# Create your tests here.
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from courses.models import Course
+from mentors.models import Mentor
+from payment.models import Payment
+
+from .models import Student
+
+
+def ids(response):
+    return [student["id"] for student in response.data["results"]]
+
+
+class CompactStudentsTests(APITestCase):
+    def setUp(self):
+        self.students = [
+            Student.objects.create(name=f"Student {i}", telegram_id=str(1000 + i))
+            for i in range(5)
+        ]
+
+    def test_pages_in_id_order(self):
+        url = reverse("student-compact")
+        response = self.client.get(url, {"page_size": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            set(response.data["results"][0]), {"id", "telegram_id", "language"}
+        )
+
+        seen = ids(response)
+        while response.data["next"]:
+            response = self.client.get(response.data["next"])
+            seen += ids(response)
+        self.assertEqual(seen, [student.id for student in self.students])
+
+    def test_after_starts_past_the_cursor(self):
+        after = self.students[2].id
+        response = self.client.get(reverse("student-compact"), {"after": after})
+        self.assertEqual(ids(response), [s.id for s in self.students[3:]])
+
+    def test_after_must_be_an_id(self):
+        response = self.client.get(reverse("student-compact"), {"after": "abc"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class AudienceTests(APITestCase):
+    def setUp(self):
+        mentor = Mentor.objects.create(name="Mentor")
+        self.course = Course.objects.create(mentor=mentor, title="Course")
+        self.other_course = Course.objects.create(mentor=mentor, title="Other")
+        self.buyer = Student.objects.create(name="Buyer", telegram_id="1")
+        self.pending = Student.objects.create(name="Pending", telegram_id="2")
+        self.english = Student.objects.create(
+            name="English", telegram_id="3", language=Student.ENGLISH
+        )
+        Payment.objects.create(
+            student=self.buyer,
+            course=self.course,
+            amount=100,
+            status=Payment.CONFIRMED,
+        )
+        # Two payments must not list the student twice
+        Payment.objects.create(
+            student=self.buyer,
+            course=self.other_course,
+            amount=100,
+            status=Payment.CONFIRMED,
+        )
+        Payment.objects.create(student=self.pending, course=self.course, amount=100)
+        Student.objects.filter(pk=self.english.pk).update(
+            created_at=timezone.now() - timedelta(days=30)
+        )
+
+    def audience(self, **params):
+        return self.client.get(reverse("student-audience"), params)
+
+    def count(self, **params):
+        return self.client.get(reverse("student-audience-count"), params)
+
+    def test_course_means_confirmed_buyers(self):
+        self.assertEqual(ids(self.audience(course=self.course.id)), [self.buyer.id])
+
+    def test_course_with_payment_status(self):
+        response = self.audience(course=self.course.id, payment_status="pending")
+        self.assertEqual(ids(response), [self.pending.id])
+
+    def test_payment_status(self):
+        self.assertEqual(
+            ids(self.audience(payment_status="pending")), [self.pending.id]
+        )
+        self.assertEqual(
+            ids(self.audience(payment_status="confirmed")), [self.buyer.id]
+        )
+
+    def test_language(self):
+        self.assertEqual(ids(self.audience(language="en")), [self.english.id])
+
+    def test_registered_range(self):
+        since = (timezone.now() - timedelta(days=7)).date().isoformat()
+        self.assertEqual(
+            ids(self.audience(registered_after=since)),
+            [self.buyer.id, self.pending.id],
+        )
+        self.assertEqual(ids(self.audience(registered_before=since)), [self.english.id])
+
+    def test_after(self):
+        response = self.audience(payment_status="confirmed", after=self.buyer.id)
+        self.assertEqual(ids(response), [])
+
+    def test_count_matches_the_audience(self):
+        self.assertEqual(self.count().data, {"count": 3})
+        self.assertEqual(self.count(course=self.course.id).data, {"count": 1})
+        self.assertEqual(self.count(payment_status="pending").data, {"count": 1})
+
+    def test_invalid_filters_are_rejected(self):
+        for params in (
+            {"registered_after": "yesterday"},
+            {"registered_before": "2024-13-01"},
+            {"payment_status": "refunded"},
+            {"course": "abc"},
+            {"language": "ru"},
+        ):
+            with self.subTest(params=params):
+                self.assertEqual(
+                    self.audience(**params).status_code, status.HTTP_400_BAD_REQUEST
+                )
+                self.assertEqual(
+                    self.count(**params).status_code, status.HTTP_400_BAD_REQUEST
+                )
+
+
+class BootstrapTests(APITestCase):
+    def setUp(self):
+        self.url = reverse("student-bootstrap")
+
+    def test_unknown_student(self):
+        response = self.client.post(self.url, {"telegram_id": "42"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"student": None, "token": None})
+
+    def test_telegram_id_is_required(self):
+        response = self.client.post(self.url, {}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_issues_a_token(self):
+        student = Student.objects.create(name="Student", telegram_id="42")
+        response = self.client.post(self.url, {"telegram_id": "42"}, format="json")
+        student.refresh_from_db()
+        self.assertEqual(response.data["student"]["id"], student.id)
+        self.assertEqual(response.data["token"], student.auth_token)
+        self.assertEqual(
+            response.data["expires_at"], student.token_expires_at().isoformat()
+        )
+
+    def test_reused_token_keeps_its_expiry(self):
+        student = Student.objects.create(name="Student", telegram_id="42")
+        token = student.generate_token()
+        issued = timezone.now() - timedelta(hours=20)
+        Student.objects.filter(pk=student.pk).update(token_created_at=issued)
+
+        response = self.client.post(self.url, {"telegram_id": "42"}, format="json")
+        self.assertEqual(response.data["token"], token)
+        self.assertEqual(
+            response.data["expires_at"], (issued + timedelta(hours=24)).isoformat()
+        )
+
+    def test_expired_token_is_replaced(self):
+        student = Student.objects.create(name="Student", telegram_id="42")
+        token = student.generate_token()
+        Student.objects.filter(pk=student.pk).update(
+            token_created_at=timezone.now() - timedelta(hours=25)
+        )
+        response = self.client.post(self.url, {"telegram_id": "42"}, format="json")
+        self.assertNotEqual(response.data["token"], token)
+
+    def test_stores_the_language(self):
+        student = Student.objects.create(name="Student", telegram_id="42")
+        response = self.client.post(
+            self.url, {"telegram_id": "42", "language": "en"}, format="json"
+        )
+        student.refresh_from_db()
+        self.assertEqual(student.language, Student.ENGLISH)
+        self.assertEqual(response.data["student"]["language"], Student.ENGLISH)
+
+    def test_rejects_unknown_language(self):
+        Student.objects.create(name="Student", telegram_id="42")
+        response = self.client.post(
+            self.url, {"telegram_id": "42", "language": "ru"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
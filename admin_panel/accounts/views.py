@@ -3,8 +3,10 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
+from .audience import filter_audience
 from .models import Student
-from .serializers import StudentSerializer
+from .pagination import StudentCursorPagination
+from .serializers import StudentCompactSerializer, StudentSerializer
 from hashlib import sha256
 
 
@@ -13,6 +15,112 @@ class StudentViewSet(viewsets.ModelViewSet):
     serializer_class = StudentSerializer
     permission_classes = [AllowAny]
 
+    def get_queryset(self):
+        queryset = Student.objects.all()
+        telegram_id = self.request.query_params.get("telegram_id")
+        if telegram_id is not None:
+            queryset = queryset.filter(telegram_id=telegram_id)
+        return queryset
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path=r"by-telegram/(?P<telegram_id>[^/.]+)",
+    )
+    def by_telegram(self, request, telegram_id=None):
+        """Fetch a single student via the unique telegram_id index"""
+        try:
+            student = Student.objects.get(telegram_id=telegram_id)
+        except Student.DoesNotExist:
+            return Response(
+                {"error": "Student not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+        return Response(self.get_serializer(student).data)
+
+    def _compact_page(self, request, queryset):
+        """One cursor page of id/telegram_id/language, optionally past ``after``"""
+        queryset = queryset.only("id", "telegram_id", "language")
+        after = request.query_params.get("after")
+        if after is not None:
+            if not after.isdigit():
+                return Response(
+                    {"error": "after must be a student id"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            queryset = queryset.filter(id__gt=int(after))
+        paginator = StudentCursorPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = StudentCompactSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=["get"])
+    def compact(self, request):
+        """
+        Cursor-paginated ``id``/``telegram_id``/``language`` of every student,
+        for broadcasts. Follow ``next`` until it is null. ``after`` starts
+        past a student id, to resume an interrupted broadcast.
+        """
+        return self._compact_page(request, Student.objects.all())
+
+    @action(detail=False, methods=["get"])
+    def audience(self, request):
+        """
+        Like ``compact``, but only the students matching the audience
+        filters (``course``, ``payment_status``, ``registered_after``,
+        ``registered_before``, ``language``; see accounts/audience.py).
+        """
+        queryset = filter_audience(Student.objects.all(), request.query_params)
+        return self._compact_page(request, queryset)
+
+    @action(detail=False, methods=["get"], url_path="audience/count")
+    def audience_count(self, request):
+        """Number of students an audience query would return"""
+        queryset = filter_audience(Student.objects.all(), request.query_params)
+        return Response({"count": queryset.count()})
+
+    @action(detail=False, methods=["post"])
+    def bootstrap(self, request):
+        """
+        Everything the bot needs on /start in one response: the student
+        profile (with confirmed purchases and language) and a valid token.
+        Passing ``language`` also stores the user's language choice.
+        ``expires_at`` is when the returned token stops being valid.
+        """
+        telegram_id = request.data.get("telegram_id")
+        language = request.data.get("language")
+
+        if not telegram_id:
+            return Response(
+                {"error": "telegram_id is required"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        student = Student.objects.filter(telegram_id=telegram_id).first()
+        if student is None:
+            return Response({"student": None, "token": None})
+
+        if language and language != student.language:
+            if language not in dict(Student.LANGUAGE_CHOICES):
+                return Response(
+                    {"error": "Unsupported language"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            student.language = language
+            student.save(update_fields=["language"])
+
+        if student.is_token_valid():
+            token = student.auth_token
+        else:
+            token = student.refresh_token()
+
+        # An existing token may be close to expiry; the bot caches it until then
+        return Response(
+            {
+                "student": self.get_serializer(student).data,
+                "token": token,
+                "expires_at": student.token_expires_at().isoformat(),
+            }
+        )
+
     @action(detail=False, methods=["post"])
     def refresh_token(self, request):
         """Refresh authentication token for a student"""
@@ -0,0 +1,63 @@
+# admin_panel/conditional.py
+from functools import partial
+from hashlib import sha256
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+class ConditionalGetMixin:
+    """
+    Strong ETag and Last-Modified support for read-only catalog actions.
+
+    Validators are computed from row counts and the newest update timestamp
+    of the response's rows and of every nested resource it embeds, so an
+    unchanged catalog is answered with 304 without being serialized.
+    Viewsets describe what they embed via ``get_validator_sources``.
+    """
+
+    def get_validator_sources(self, queryset):
+        """
+        Return ``(queryset, timestamp_field)`` pairs whose rows make up the
+        response body, including nested resources.
+        """
+        return [(queryset, "updated_at")]
+
+    def _validators(self, request, queryset):
+        parts = [request.get_full_path()]
+        last_modified = None
+        for source, field in self.get_validator_sources(queryset):
+            agg = source.aggregate(rows=Count("pk"), newest=Max(field))
+            newest = agg["newest"]
+            parts.append(f"{agg['rows']}:{newest.isoformat() if newest else '-'}")
+            if newest and (last_modified is None or newest > last_modified):
+                last_modified = newest
+        etag = f'"{sha256("|".join(parts).encode()).hexdigest()[:32]}"'
+        return etag, last_modified
+
+    def _conditional(self, request, queryset, render):
+        etag, last_modified = self._validators(request, queryset)
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        not_modified = get_conditional_response(
+            request, etag=etag, last_modified=timestamp
+        )
+        response = not_modified or render()
+        if response.status_code in (200, 304):
+            response["ETag"] = etag
+            if timestamp is not None:
+                response["Last-Modified"] = http_date(timestamp)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        render = partial(super().list, request, *args, **kwargs)
+        return self._conditional(request, queryset, render)
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.get_queryset().filter(
+            **{self.lookup_field: kwargs[lookup_url_kwarg]}
+        )
+        render = partial(super().retrieve, request, *args, **kwargs)
+        return self._conditional(request, queryset, render)
@@ -18,6 +18,7 @@ class Course(models.Model):
         help_text="Course price in UZS",
     )
     created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.title
@@ -56,6 +57,7 @@ class Quiz(models.Model):
     lesson = models.ForeignKey(Lesson, on_delete=models.CASCADE, related_name="quizzes")
     questions = models.JSONField()
     answers = models.JSONField()
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"Quiz for {self.lesson.title}"
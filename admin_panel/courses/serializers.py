@@ -43,4 +43,7 @@ class CourseSerializer(serializers.ModelSerializer):
         ]
 
     def get_total_students(self, obj):
+        # Annotated by CourseViewSet; fall back to a query for other callers
+        if hasattr(obj, "confirmed_students"):
+            return obj.confirmed_students
         return obj.payments.filter(status="confirmed").count()
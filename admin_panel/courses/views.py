@@ -1,19 +1,52 @@
 # courses/views.py
+from django.db.models import Count, Q
 from rest_framework import viewsets
 from rest_framework.permissions import AllowAny
+from admin_panel.conditional import ConditionalGetMixin
+from payment.models import Payment
 from .models import Course, Lesson, Quiz
 from .serializers import CourseSerializer, LessonSerializer, QuizSerializer
 
-class CourseViewSet(viewsets.ModelViewSet):
+class CourseViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = Course.objects.all()
     serializer_class = CourseSerializer
     permission_classes = [AllowAny]  # Allow unauthenticated access
 
-class LessonViewSet(viewsets.ModelViewSet):
+    def get_queryset(self):
+        queryset = Course.objects.prefetch_related("lessons__quizzes").annotate(
+            confirmed_students=Count(
+                "payments", filter=Q(payments__status="confirmed")
+            )
+        )
+        mentor_id = self.request.query_params.get("mentor", None)
+        if mentor_id is not None:
+            # Uses the index on the mentor foreign key
+            queryset = queryset.filter(mentor_id=mentor_id)
+        return queryset
+
+    def get_validator_sources(self, queryset):
+        # Course bodies embed lessons, quizzes and the confirmed student count
+        return [
+            (queryset, "updated_at"),
+            (Lesson.objects.filter(course__in=queryset), "updated_at"),
+            (Quiz.objects.filter(lesson__course__in=queryset), "updated_at"),
+            (
+                Payment.objects.filter(course__in=queryset, status=Payment.CONFIRMED),
+                "confirmed_at",
+            ),
+        ]
+
+class LessonViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = Lesson.objects.all()
     serializer_class = LessonSerializer
     permission_classes = [AllowAny]
 
+    def get_validator_sources(self, queryset):
+        return [
+            (queryset, "updated_at"),
+            (Quiz.objects.filter(lesson__in=queryset), "updated_at"),
+        ]
+
 class QuizViewSet(viewsets.ModelViewSet):
     queryset = Quiz.objects.all()
     serializer_class = QuizSerializer
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.3 on 2026-10-17 21:27
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mentors', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='mentor',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='mentor_name_lower_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.3 on 2026-10-17 21:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mentors', '0002_mentor_mentor_name_lower_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mentor',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='mentoravailability',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
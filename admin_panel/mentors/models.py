@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils import timezone
 
 # Create your models here.
@@ -14,6 +15,7 @@ class Mentor(models.Model):
         help_text="Profile picture ID from Telegram",
         verbose_name="Mentor picture ID",
     )
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
@@ -21,6 +23,10 @@ class Mentor(models.Model):
     class Meta:
         verbose_name = "Mentor"
         verbose_name_plural = "Mentors"
+        indexes = [
+            # Backs case-insensitive lookups by name from the bot
+            models.Index(Lower("name"), name="mentor_name_lower_idx"),
+        ]
 
 
 class MentorAvailability(models.Model):
@@ -31,6 +37,7 @@ class MentorAvailability(models.Model):
     end_time = models.DateTimeField()
     is_available = models.BooleanField(default=True)
     created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.mentor.name} - {self.start_time.strftime('%Y-%m-%d %H:%M')} to {self.end_time.strftime('%Y-%m-%d %H:%M')}"
@@ -1,5 +1,7 @@
 # admin_panel/mentors/views.py
+from django.db.models.functions import Lower
 from rest_framework import viewsets
+from admin_panel.conditional import ConditionalGetMixin
 from rest_framework.permissions import AllowAny
 from .models import Mentor, MentorAvailability
 from .serializers import MentorSerializer, MentorAvailabilitySerializer
@@ -7,11 +9,27 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-class MentorViewSet(viewsets.ModelViewSet):
+class MentorViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = Mentor.objects.all()
     serializer_class = MentorSerializer
     permission_classes = [AllowAny]  # Allow unauthenticated access
 
+    def get_queryset(self):
+        queryset = Mentor.objects.prefetch_related("availability")
+        name = self.request.query_params.get("name", None)
+        if name is not None:
+            # Compare on lower(name) so the functional index is used
+            queryset = queryset.annotate(name_lower=Lower("name")).filter(
+                name_lower=name.lower()
+            )
+        return queryset
+
+    def get_validator_sources(self, queryset):
+        return [
+            (queryset, "updated_at"),
+            (MentorAvailability.objects.filter(mentor__in=queryset), "updated_at"),
+        ]
+
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.3 on 2026-10-17 21:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0003_student_student_language_id_idx_and_more"),
+        ("courses", "0002_course_updated_at_quiz_updated_at"),
+        ("payment", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="payment",
+            index=models.Index(
+                fields=["course", "status", "student"], name="payment_course_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="payment",
+            index=models.Index(
+                fields=["status", "student"], name="payment_status_student_idx"
+            ),
+        ),
+    ]
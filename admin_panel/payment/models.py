@@ -31,6 +31,15 @@ class Payment(models.Model):
         verbose_name_plural = "Payments"
         ordering = ["-created_at"]
         unique_together = ["student", "course"]
+        indexes = [
+            # Back broadcast audience filters: buyers of a course and
+            # students by payment status
+            models.Index(
+                fields=["course", "status", "student"],
+                name="payment_course_status_idx",
+            ),
+            models.Index(fields=["status", "student"], name="payment_status_student_idx"),
+        ]
 
     def confirm_payment(self):
         if self.status != self.PENDING:
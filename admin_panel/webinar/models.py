@@ -24,6 +24,7 @@ class Webinar(models.Model):
     duration = models.PositiveIntegerField(help_text="Duration in minutes", null=True, blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='scheduled')
     created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.title
@@ -1,9 +1,11 @@
 from rest_framework import viewsets
 from rest_framework.permissions import AllowAny
+from admin_panel.conditional import ConditionalGetMixin
+from mentors.models import Mentor, MentorAvailability
 from .models import Webinar
 from .serializers import WebinarSerializer
 
-class WebinarViewSet(viewsets.ModelViewSet):
+class WebinarViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = Webinar.objects.all()
     serializer_class = WebinarSerializer
     permission_classes = [AllowAny]
@@ -13,4 +15,17 @@ class WebinarViewSet(viewsets.ModelViewSet):
         mentor_id = self.request.query_params.get('mentor', None)
         if mentor_id is not None:
             queryset = queryset.filter(mentor_id=mentor_id)
-        return queryset.order_by('-created_at')
\ No newline at end of file
+        return queryset.order_by('-created_at')
+
+    def get_validator_sources(self, queryset):
+        # Webinar bodies embed the mentor and its availability
+        return [
+            (queryset, 'updated_at'),
+            (Mentor.objects.filter(webinars__in=queryset).distinct(), 'updated_at'),
+            (
+                MentorAvailability.objects.filter(
+                    mentor__webinars__in=queryset
+                ).distinct(),
+                'updated_at',
+            ),
+        ]
\ No newline at end of file
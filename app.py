@@ -5,7 +5,10 @@ from aiogram import Bot, Dispatcher, types, Router
 from aiogram.filters import Command
 from aiogram.types import Message
 import asyncio
-from data.api_client import APIClient
+from data.api_client import get_api_client
+from data.http_pool import get_pool
+from data.token_renewal import TokenRenewalScheduler
+from data.metrics import MetricsServer, get_metrics
 from loader import dp, bot, i18n
 from config import API_TOKEN
 from handlers import (
@@ -21,6 +24,13 @@ from handlers import (
 )
 from utils.set_bot_commands import set_commands
 from middlewares.auth import AuthMiddleware
+from middlewares.rate_governor import TelegramRateGovernor
+from middlewares.throttling import ThrottlingMiddleware
+from middlewares.tracing import (
+    BotAPITimer,
+    HandlerLabelMiddleware,
+    TracingMiddleware,
+)
 from config import ADMIN_IDS
 
 
@@ -29,12 +39,40 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 ADMIN_IDS = [int(id) for id in ADMIN_IDS.split(",")]
-# Create single APIClient instance
-api_client = APIClient()
+# The process-wide APIClient, shared with data/db.py
+api_client = get_api_client()
+token_renewal = TokenRenewalScheduler(api_client)
+# Prometheus /metrics endpoint, enabled by METRICS_PORT
+metrics_server = MetricsServer(get_metrics())
+
+# Tracing times each update from the outside; the first inner middleware
+# names the trace after the matched handler. See /stats.
+tracing_middleware = TracingMiddleware()
+dp.message.outer_middleware(tracing_middleware)
+dp.callback_query.outer_middleware(tracing_middleware)
+# Throttling is an outer middleware so flooded updates are dropped before
+# any filter, auth check or handler can call the API; one instance so
+# messages and callbacks share the backend. Its route middleware applies
+# per-handler rate_limit flags once a handler has matched.
+throttling_middleware = ThrottlingMiddleware()
+dp.message.outer_middleware(throttling_middleware)
+dp.callback_query.outer_middleware(throttling_middleware)
+handler_label_middleware = HandlerLabelMiddleware()
+dp.message.middleware(handler_label_middleware)
+dp.callback_query.middleware(handler_label_middleware)
+bot.session.middleware(BotAPITimer())
+# Pace every outbound message within Telegram's global and per-chat limits;
+# registered after the timer so queueing counts as Bot API time
+telegram_governor = TelegramRateGovernor()
+bot.session.middleware(telegram_governor)
 
-# Register middleware with APIClient instance
-dp.message.middleware(AuthMiddleware(api_client))
-dp.callback_query.middleware(AuthMiddleware(api_client))
+# Register middleware with APIClient instance; one instance each so messages
+# and callbacks share route limits and the failed-auth cache
+dp.message.middleware(throttling_middleware.route_middleware)
+dp.callback_query.middleware(throttling_middleware.route_middleware)
+auth_middleware = AuthMiddleware(api_client)
+dp.message.middleware(auth_middleware)
+dp.callback_query.middleware(auth_middleware)
 
 # Include routers
 dp.include_router(admin.router)
@@ -71,6 +109,10 @@ async def main():
 
         await set_commands(bot)
         logger.info("Bot commands set successfully.")
+        token_renewal.start()
+        # Continue broadcasts interrupted by a restart from their checkpoint
+        await admin.resume_broadcasts(api_client)
+        await metrics_server.start()
         logger.info("Starting bot polling...")
         await dp.start_polling(bot)
         await notify_admin("Bot has shut down.")
@@ -78,9 +120,12 @@ async def main():
     except Exception as e:
         logger.critical(f"Unhandled exception in bot: {e}", exc_info=True)
     finally:
-        if "api_client" in locals() and api_client:
-            await api_client.close()
-            logger.info("Bot shutdown complete.")
+        await token_renewal.stop()
+        await metrics_server.stop()
+        await api_client.close()
+        # Every APIClient shares this pool, so it is closed only here
+        await get_pool().close()
+        logger.info("Bot shutdown complete.")
 
 
 if __name__ == "__main__":
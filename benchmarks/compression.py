@@ -0,0 +1,72 @@
+# benchmarks/compression.py
+"""
+Bytes on the wire and CPU cost of compressing each API response.
+
+Run with ``python -m benchmarks.compression`` from the repository root.
+Use the output to pick API_COMPRESSION_MIN_SIZE, API_GZIP_LEVEL and
+API_BROTLI_QUALITY.
+"""
+
+import argparse
+import gzip
+import json
+import time
+
+from benchmarks.fixtures import payloads
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+GZIP_LEVELS = (1, 6, 9)
+BROTLI_QUALITIES = (1, 5, 11)
+
+
+def _timed(fn, repeat: int):
+    """Return the result of ``fn`` and its mean wall time in milliseconds"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return result, (time.perf_counter() - start) * 1000 / repeat
+
+
+def codecs():
+    for level in GZIP_LEVELS:
+        yield (
+            f"gzip-{level}",
+            lambda body, level=level: gzip.compress(body, level, mtime=0),
+            gzip.decompress,
+        )
+    if brotli is not None:
+        for quality in BROTLI_QUALITIES:
+            yield (
+                f"br-{quality}",
+                lambda body, quality=quality: brotli.compress(body, quality=quality),
+                brotli.decompress,
+            )
+
+
+def run(repeat: int):
+    header = f"{'endpoint':32} {'codec':8} {'bytes':>9} {'ratio':>6} {'comp ms':>8} {'decomp ms':>9}"
+    print(header)
+    print("-" * len(header))
+    for endpoint, payload in payloads().items():
+        body = json.dumps(payload).encode()
+        print(f"{endpoint:32} {'raw':8} {len(body):>9}")
+        for name, compress, decompress in codecs():
+            compressed, comp_ms = _timed(lambda: compress(body), repeat)
+            _, decomp_ms = _timed(lambda: decompress(compressed), repeat)
+            ratio = len(body) / len(compressed)
+            print(
+                f"{'':32} {name:8} {len(compressed):>9} {ratio:>6.1f}"
+                f" {comp_ms:>8.3f} {decomp_ms:>9.3f}"
+            )
+    if brotli is None:
+        print("\nbrotli is not installed; only gzip was measured")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    run(parser.parse_args().repeat)
@@ -0,0 +1,322 @@
+# benchmarks/fake_backend.py
+"""
+Stand-in for the admin_panel API, for load-testing APIClient offline.
+
+Serves the fixture payloads from benchmarks/fixtures.py under ``/api`` with
+the routes, auth and ETag behaviour the bot relies on, plus configurable
+latency and error injection. Run on its own with
+``python -m benchmarks.fake_backend --port 8000`` and point TEST_API_URL
+at ``http://127.0.0.1:8000/api``, or start it in-process via ``FakeBackend``.
+"""
+
+import argparse
+import asyncio
+import gzip
+import hashlib
+import random
+from typing import Dict, List, Optional
+
+from aiohttp import web
+
+from benchmarks import fixtures
+from data import jsonlib
+
+
+class FakeBackend:
+    """
+    Args:
+        latency: Base delay added to every response, in seconds.
+        jitter: Extra uniformly random delay of up to this many seconds.
+        error_rate: Share of requests answered with 503.
+        unauthorized_rate: Share of authenticated requests answered with
+            401, to exercise token refreshes.
+        students: Number of fixture students.
+        seed: Seed for fixtures and injected failures.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        unauthorized_rate: float = 0.0,
+        students: int = 1000,
+        seed: int = 42,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.unauthorized_rate = unauthorized_rate
+        self._random = random.Random(seed)
+        rng = random.Random(seed)
+        self.mentors = [fixtures.mentor(rng, i) for i in range(1, 11)]
+        self.courses = [fixtures.course(rng, i) for i in range(1, 21)]
+        self.webinars = [fixtures.webinar(rng, i) for i in range(1, 31)]
+        self.students = [fixtures.student(rng, i) for i in range(1, students + 1)]
+        self.payments = [fixtures.payment(rng, i) for i in range(1, 51)]
+        self._students_by_telegram = {
+            str(student["telegram_id"]): student for student in self.students
+        }
+        self._tokens: Dict[str, str] = {}
+        self._encoded: Dict[str, tuple] = {}
+        self.requests = 0
+        self._runner: Optional[web.AppRunner] = None
+
+    # -- plumbing ---------------------------------------------------------
+
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self._inject])
+        routes = [
+            web.get("/api/students/", self.list_students),
+            web.get("/api/students/compact/", self.compact_students),
+            web.get(
+                "/api/students/by-telegram/{telegram_id}/", self.student_by_telegram
+            ),
+            web.post("/api/students/bootstrap/", self.bootstrap),
+            web.post("/api/students/refresh_token/", self.refresh_token),
+            web.post("/api/students/authenticate/", self.authenticate),
+            web.get("/api/mentors/", self.list_mentors),
+            web.get("/api/mentors/{id}/", self.mentor_detail),
+            web.get("/api/webinars/", self.list_webinars),
+            web.get("/api/courses/", self.list_courses),
+            web.get("/api/courses/{id}/", self.course_detail),
+            web.get("/api/payments/", self.list_payments),
+            web.get("/api/payments/{id}/", self.payment_detail),
+        ]
+        app.add_routes(routes)
+        return app
+
+    @web.middleware
+    async def _inject(self, request: web.Request, handler):
+        self.requests += 1
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.error_rate and self._random.random() < self.error_rate:
+            return web.json_response(
+                {"detail": "Injected failure"}, status=503, dumps=jsonlib.dumps
+            )
+        return await handler(request)
+
+    def _json(
+        self, request: web.Request, data, status: int = 200, static: bool = False
+    ) -> web.Response:
+        """
+        JSON response with ETag revalidation and gzip like Django. Encoded
+        and compressed fixtures (``static``) are memoized per URL, so the
+        fake backend spends its CPU on I/O rather than re-encoding.
+        """
+        key = request.path_qs
+        if static and key in self._encoded:
+            body, compressed, etag = self._encoded[key]
+        else:
+            body = jsonlib.dumps(data).encode()
+            compressed = gzip.compress(body, 6, mtime=0) if len(body) >= 1024 else None
+            etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+            if static:
+                self._encoded[key] = (body, compressed, etag)
+        if status == 200 and etag in request.headers.get("If-None-Match", ""):
+            return web.Response(status=304, headers={"ETag": etag})
+        headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+        if compressed is not None and "gzip" in request.headers.get(
+            "Accept-Encoding", ""
+        ):
+            body = compressed
+            headers["Content-Encoding"] = "gzip"
+        return web.Response(
+            body=body, status=status, content_type="application/json", headers=headers
+        )
+
+    def _authorized(self, request: web.Request) -> bool:
+        header = request.headers.get("Authorization", "")
+        if not header.startswith("Bearer ") or header[7:] not in self._tokens.values():
+            return False
+        return not (
+            self.unauthorized_rate and self._random.random() < self.unauthorized_rate
+        )
+
+    def _issue_token(self, telegram_id: str) -> str:
+        token = hashlib.sha256(
+            f"{telegram_id}:{self._random.random()}".encode()
+        ).hexdigest()
+        self._tokens[telegram_id] = token
+        return token
+
+    @staticmethod
+    def _filter(items: List[dict], request: web.Request, param: str, field: str):
+        value = request.query.get(param)
+        if value is None:
+            return items
+        return [item for item in items if str(item[field]) == value]
+
+    @staticmethod
+    def _by_id(items: List[dict], request: web.Request) -> Optional[dict]:
+        item_id = int(request.match_info["id"])
+        return next((item for item in items if item["id"] == item_id), None)
+
+    # -- students ---------------------------------------------------------
+
+    async def list_students(self, request):
+        return self._json(
+            request,
+            self._filter(self.students, request, "telegram_id", "telegram_id"),
+            static=True,
+        )
+
+    async def compact_students(self, request):
+        page_size = int(request.query.get("page_size", 500))
+        after = int(request.query.get("cursor", request.query.get("after", 0)))
+        page = [s for s in self.students if s["id"] > after][:page_size]
+        next_url = None
+        if page and page[-1]["id"] < self.students[-1]["id"]:
+            next_url = str(
+                request.url.update_query(cursor=page[-1]["id"], page_size=page_size)
+            )
+        results = [
+            {"id": s["id"], "telegram_id": s["telegram_id"], "language": s["language"]}
+            for s in page
+        ]
+        return self._json(
+            request, {"next": next_url, "previous": None, "results": results}
+        )
+
+    async def student_by_telegram(self, request):
+        student = self._students_by_telegram.get(request.match_info["telegram_id"])
+        if student is None:
+            return self._json(request, {"error": "Student not found"}, status=404)
+        return self._json(request, student, static=True)
+
+    async def bootstrap(self, request):
+        telegram_id = str((await request.json(loads=jsonlib.loads))["telegram_id"])
+        student = self._students_by_telegram.get(telegram_id)
+        token = self._issue_token(telegram_id) if student else None
+        return self._json(request, {"student": student, "token": token})
+
+    async def refresh_token(self, request):
+        telegram_id = str((await request.json(loads=jsonlib.loads))["telegram_id"])
+        student = self._students_by_telegram.get(telegram_id)
+        if student is None:
+            return self._json(request, {"error": "Student not found"}, status=404)
+        return self._json(
+            request,
+            {
+                "token": self._issue_token(telegram_id),
+                "student_id": student["id"],
+                "name": student["name"],
+            },
+        )
+
+    async def authenticate(self, request):
+        data = await request.json(loads=jsonlib.loads)
+        telegram_id = str(data["telegram_id"])
+        student = self._students_by_telegram.get(telegram_id) or {"id": None}
+        return self._json(
+            request,
+            {
+                "student_id": student["id"],
+                "name": data.get("name"),
+                "telegram_id": telegram_id,
+                "token": self._issue_token(telegram_id),
+            },
+        )
+
+    # -- catalog ----------------------------------------------------------
+
+    async def list_mentors(self, request):
+        name = request.query.get("name")
+        mentors = self.mentors
+        if name is not None:
+            mentors = [m for m in mentors if m["name"].lower() == name.lower()]
+        return self._json(request, mentors, static=True)
+
+    async def mentor_detail(self, request):
+        mentor = self._by_id(self.mentors, request)
+        if mentor is None:
+            return self._json(request, {"detail": "Not found."}, status=404)
+        return self._json(request, mentor, static=True)
+
+    async def list_webinars(self, request):
+        return self._json(
+            request,
+            self._filter(self.webinars, request, "mentor", "mentor"),
+            static=True,
+        )
+
+    async def list_courses(self, request):
+        return self._json(
+            request,
+            self._filter(self.courses, request, "mentor", "mentor"),
+            static=True,
+        )
+
+    async def course_detail(self, request):
+        course = self._by_id(self.courses, request)
+        if course is None:
+            return self._json(request, {"detail": "Not found."}, status=404)
+        return self._json(request, course, static=True)
+
+    # -- payments (authenticated) -----------------------------------------
+
+    async def list_payments(self, request):
+        if not self._authorized(request):
+            return self._json(request, {"detail": "Invalid token."}, status=401)
+        return self._json(request, {"results": self.payments}, static=True)
+
+    async def payment_detail(self, request):
+        if not self._authorized(request):
+            return self._json(request, {"detail": "Invalid token."}, status=401)
+        payment = self._by_id(self.payments, request)
+        if payment is None:
+            return self._json(request, {"detail": "Not found."}, status=404)
+        return self._json(request, payment, static=True)
+
+    # -- lifecycle --------------------------------------------------------
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving and return the API base URL"""
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        return f"http://{host}:{port}/api"
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+async def _serve(args):
+    backend = FakeBackend(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        unauthorized_rate=args.unauthorized_rate,
+        students=args.students,
+    )
+    url = await backend.start(args.host, args.port)
+    print(f"Fake API listening on {url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await backend.stop()
+
+
+def add_backend_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--unauthorized-rate", type=float, default=0.0)
+    parser.add_argument("--students", type=int, default=1000)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    add_backend_arguments(parser)
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
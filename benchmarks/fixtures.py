@@ -0,0 +1,162 @@
+# benchmarks/fixtures.py
+"""
+Payload generators shaped like the admin_panel serializers.
+
+Sizes are deterministic for a given seed so benchmark runs are
+comparable across machines and commits.
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+WORDS = (
+    "python django telegram bot course lesson mentor webinar quiz student "
+    "payment async request response cache database model view serializer "
+    "function class module package deploy docker server client token"
+).split()
+
+EPOCH = datetime(2024, 9, 1, 9, 0, tzinfo=timezone.utc)
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _timestamp(rng: random.Random) -> str:
+    return (EPOCH + timedelta(minutes=rng.randint(0, 500_000))).isoformat()
+
+
+def _file_id(rng: random.Random) -> str:
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+    return "BAACAgIAAxkBAAI" + "".join(rng.choice(alphabet) for _ in range(56))
+
+
+def availability(rng: random.Random, mentor_id: int, slots: int = 6) -> list:
+    result = []
+    for slot in range(slots):
+        start = EPOCH + timedelta(days=slot, hours=rng.randint(8, 18))
+        result.append(
+            {
+                "id": mentor_id * 100 + slot,
+                "start_time": start.isoformat(),
+                "end_time": (start + timedelta(hours=1)).isoformat(),
+                "is_available": rng.random() > 0.3,
+            }
+        )
+    return result
+
+
+def mentor(rng: random.Random, mentor_id: int) -> dict:
+    return {
+        "id": mentor_id,
+        "name": f"Mentor {mentor_id}",
+        "bio": _text(rng, 40),
+        "profile_picture_id": _file_id(rng),
+        "availability": availability(rng, mentor_id),
+    }
+
+
+def quiz(rng: random.Random, quiz_id: int, lesson_id: int) -> dict:
+    questions = [
+        {"question": _text(rng, 12), "options": [_text(rng, 3) for _ in range(4)]}
+        for _ in range(5)
+    ]
+    return {
+        "id": quiz_id,
+        "lesson": lesson_id,
+        "questions": questions,
+        "answers": [rng.randint(0, 3) for _ in questions],
+    }
+
+
+def lesson(rng: random.Random, lesson_id: int, course_id: int) -> dict:
+    return {
+        "id": lesson_id,
+        "course": course_id,
+        "title": f"Lesson {lesson_id}: {_text(rng, 4)}",
+        "content": _text(rng, 250),
+        "is_free": lesson_id % 5 == 0,
+        "telegram_video_id": _file_id(rng),
+        "created_at": _timestamp(rng),
+        "updated_at": _timestamp(rng),
+        "quizzes": [quiz(rng, lesson_id * 10 + i, lesson_id) for i in range(2)],
+    }
+
+
+def course(rng: random.Random, course_id: int, lessons: int = 12) -> dict:
+    return {
+        "id": course_id,
+        "mentor": course_id % 10 + 1,
+        "title": f"Course {course_id}: {_text(rng, 3)}",
+        "description": _text(rng, 80),
+        "price": str(Decimal(rng.randint(100, 2000)) * 1000),
+        "lessons": [
+            lesson(rng, course_id * 100 + i, course_id) for i in range(lessons)
+        ],
+        "total_students": rng.randint(0, 500),
+    }
+
+
+def student(rng: random.Random, student_id: int, purchased: int = 2) -> dict:
+    return {
+        "id": student_id,
+        "name": f"Student {student_id}",
+        "telegram_id": 100_000_000 + student_id,
+        "phone_number": f"+9989{rng.randint(10_000_000, 99_999_999)}",
+        "language": rng.choice(("uz", "en")),
+        "purchased_courses": [
+            {
+                "id": rng.randint(1, 20),
+                "title": _text(rng, 3),
+                "purchased_at": _timestamp(rng),
+            }
+            for _ in range(purchased)
+        ],
+    }
+
+
+def webinar(rng: random.Random, webinar_id: int) -> dict:
+    mentor_id = webinar_id % 10 + 1
+    return {
+        "id": webinar_id,
+        "mentor": mentor_id,
+        "mentor_details": mentor(rng, mentor_id),
+        "title": f"Webinar {webinar_id}: {_text(rng, 4)}",
+        "video_telegram_id": _file_id(rng),
+        "created_at": _timestamp(rng),
+    }
+
+
+def payment(rng: random.Random, payment_id: int) -> dict:
+    course_id = payment_id % 20 + 1
+    student_id = payment_id % 300 + 1
+    details = course(rng, course_id)
+    return {
+        "id": payment_id,
+        "student": student_id,
+        "course": course_id,
+        "amount": details["price"],
+        "status": rng.choice(("pending", "confirmed", "rejected")),
+        "created_at": _timestamp(rng),
+        "confirmed_at": _timestamp(rng),
+        "course_details": details,
+        "student_details": student(rng, student_id),
+        "screenshot_file_id": _file_id(rng),
+    }
+
+
+def payloads(seed: int = 42) -> dict:
+    """One response body per endpoint, keyed by the logical endpoint name"""
+    rng = random.Random(seed)
+    courses = [course(rng, i) for i in range(1, 21)]
+    return {
+        "GET /students/": [student(rng, i) for i in range(1, 301)],
+        "GET /students/by-telegram/{id}/": student(rng, 1),
+        "GET /mentors/": [mentor(rng, i) for i in range(1, 11)],
+        "GET /webinars/": [webinar(rng, i) for i in range(1, 31)],
+        "GET /courses/": courses,
+        "GET /courses/{id}/": courses[0],
+        "GET /lessons/?course={id}": courses[0]["lessons"],
+        "GET /payments/": [payment(rng, i) for i in range(1, 51)],
+    }
@@ -0,0 +1,84 @@
+# benchmarks/json_codec.py
+"""
+stdlib json vs orjson on the bot's real payload shapes.
+
+Measures the server side (DRF JSONRenderer vs FastJSONRenderer, on data
+holding native Decimal and datetime values) and the client side
+(``data.jsonlib`` decoding), and checks the renderers' output is identical.
+Run with ``python -m benchmarks.json_codec`` from the repository root.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from decimal import Decimal
+
+import django
+from django.conf import settings
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "admin_panel"))
+settings.configure(USE_TZ=True)
+django.setup()
+
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from admin_panel.fastjson import FastJSONRenderer, orjson  # noqa: E402
+from benchmarks.fixtures import payloads  # noqa: E402
+from data import jsonlib  # noqa: E402
+
+
+def _native(value):
+    """Turn serialized prices and timestamps back into Decimal/datetime"""
+    if isinstance(value, dict):
+        return {key: _native(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_native(item) for item in value]
+    if isinstance(value, str):
+        if value[:4].isdigit() and "T" in value:
+            return datetime.fromisoformat(value)
+        if value.isdigit():
+            return Decimal(value)
+    return value
+
+
+def _timed(fn, repeat: int) -> float:
+    """Mean wall time of ``fn`` in milliseconds"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def run(repeat: int):
+    if orjson is None:
+        print("orjson is not installed; nothing to compare")
+        return
+    stock, fast = JSONRenderer(), FastJSONRenderer()
+    header = (
+        f"{'endpoint':32} {'bytes':>9} {'render json':>11} {'orjson':>8}"
+        f" {'parse json':>10} {'orjson':>8} {'same':>5}"
+    )
+    print(header)
+    print("-" * len(header))
+    for endpoint, payload in payloads().items():
+        data = _native(payload)
+        body = stock.render(data)
+        same = fast.render(data) == body
+        render_stdlib = _timed(lambda: stock.render(data), repeat)
+        render_fast = _timed(lambda: fast.render(data), repeat)
+        parse_stdlib = _timed(lambda: json.loads(body), repeat)
+        parse_fast = _timed(lambda: jsonlib.loads(body), repeat)
+        print(
+            f"{endpoint:32} {len(body):>9} {render_stdlib:>11.3f} {render_fast:>8.3f}"
+            f" {parse_stdlib:>10.3f} {parse_fast:>8.3f} {'yes' if same else 'NO':>5}"
+        )
+    print("\ntimes are mean milliseconds per call")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    run(parser.parse_args().repeat)
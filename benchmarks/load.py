@@ -0,0 +1,158 @@
+# benchmarks/load.py
+"""
+Drive concurrent simulated users through APIClient and report throughput
+and latency percentiles per operation.
+
+Each user walks the same calls the handlers make (/start, mentors, a
+mentor's card, webinars, lessons, payment details) against an in-process
+fake backend, so no Django or Postgres is needed. Run with
+``python -m benchmarks.load --users 100 --iterations 20`` from the
+repository root; ``--url`` targets a running API instead.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from collections import defaultdict
+
+from benchmarks.fake_backend import FakeBackend, add_backend_arguments
+
+FIRST_TELEGRAM_ID = 100_000_001  # telegram_id of fixture student 1
+
+
+def _percentile(samples, q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def _timed(timings, name: str, coro):
+    started = time.perf_counter()
+    try:
+        return await coro
+    finally:
+        timings[name].append(time.perf_counter() - started)
+
+
+async def simulate_user(client, telegram_id: int, args, timings, rng):
+    await _timed(timings, "bootstrap", client.bootstrap(telegram_id))
+    for _ in range(args.iterations):
+        mentors = await _timed(timings, "get_mentors", client.get_mentors(telegram_id))
+        if mentors:
+            name = rng.choice(mentors).name
+            await _timed(
+                timings,
+                "get_mentor_by_name",
+                client.get_mentor_by_name(name, telegram_id=telegram_id),
+            )
+        await _timed(
+            timings, "get_webinars", client.get_webinars(telegram_id=telegram_id)
+        )
+        await _timed(
+            timings,
+            "get_lessons_by_course_id",
+            client.get_lessons_by_course_id(rng.randint(1, 20), telegram_id),
+        )
+        await _timed(
+            timings,
+            "get_payment_details",
+            client.get_payment_details(rng.randint(1, 50), telegram_id),
+        )
+        if args.think:
+            await asyncio.sleep(rng.uniform(0, args.think))
+
+
+async def run(args):
+    backend = None
+    url = args.url
+    if url is None:
+        backend = FakeBackend(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            unauthorized_rate=args.unauthorized_rate,
+            students=max(args.students, args.users),
+        )
+        url = await backend.start()
+
+    # data/ reads its configuration from the environment at import time
+    os.environ["TEST_API_URL"] = url
+    os.environ.setdefault("TOKEN_STORE", "memory")
+    if args.no_cache:
+        for name in ("MENTORS", "WEBINARS", "COURSES", "LESSONS"):
+            os.environ[f"CATALOG_TTL_{name}"] = "0"
+        os.environ["CATALOG_STALE_TTL"] = "0"
+    from data.api_client import APIClient
+    from data.http_pool import get_pool
+
+    client = APIClient()
+    timings = defaultdict(list)
+    rng = random.Random(args.seed)
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(
+            *(
+                simulate_user(
+                    client,
+                    FIRST_TELEGRAM_ID + i,
+                    args,
+                    timings,
+                    random.Random(rng.random()),
+                )
+                for i in range(args.users)
+            )
+        )
+        elapsed = time.perf_counter() - started
+
+        broadcast_started = time.perf_counter()
+        streamed = 0
+        async for _ in client.iter_users(page_size=500):
+            streamed += 1
+        broadcast_elapsed = time.perf_counter() - broadcast_started
+    finally:
+        await client.close()
+        await get_pool().close()
+        if backend is not None:
+            await backend.stop()
+
+    total = sum(len(samples) for samples in timings.values())
+    print(
+        f"{args.users} users x {args.iterations} iterations: {total} calls in "
+        f"{elapsed:.2f}s ({total / elapsed:.0f} calls/s)\n"
+    )
+    header = f"{'operation':26} {'calls':>7} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+    print(header)
+    print("-" * len(header))
+    for name, samples in timings.items():
+        print(
+            f"{name:26} {len(samples):>7} {_percentile(samples, 0.5) * 1000:>8.2f}"
+            f" {_percentile(samples, 0.9) * 1000:>8.2f}"
+            f" {_percentile(samples, 0.99) * 1000:>8.2f} {max(samples) * 1000:>8.2f}"
+        )
+
+    stats = client.request_stats()
+    print(
+        f"\n{'endpoint':34} {'requests':>8} {'p50 ms':>8} {'p99 ms':>8} {'retries':>7}"
+    )
+    for endpoint, data in stats["endpoints"].items():
+        print(
+            f"{endpoint:34} {data['count']:>8} {data['p50'] * 1000:>8.2f}"
+            f" {data['p99'] * 1000:>8.2f} {data['retries']:>7}"
+        )
+    print(f"\ncache: {client.cache_stats()}")
+    print(f"coalesced: {client.singleflight_stats()}")
+    print(f"token refreshes: {stats['token_refreshes']}")
+    print(f"iter_users: {streamed} users streamed in {broadcast_elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--think", type=float, default=0.0, help="max pause, seconds")
+    parser.add_argument("--no-cache", action="store_true", help="disable catalog TTLs")
+    parser.add_argument("--url", help="API base URL; default starts a fake backend")
+    parser.add_argument("--seed", type=int, default=1)
+    add_backend_arguments(parser)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,71 @@
+# benchmarks/models_memory.py
+"""
+Memory held by cached catalogs as raw dicts vs data.models instances,
+plus the cost of reading a field from each.
+
+Run with ``python -m benchmarks.models_memory`` from the repository root.
+"""
+
+import argparse
+import gc
+import timeit
+import tracemalloc
+
+from benchmarks.fixtures import payloads
+from data import jsonlib
+from data.models import Course, Lesson, Mentor, Student, Webinar, parse_many
+
+CATALOGS = {
+    "GET /mentors/": Mentor,
+    "GET /webinars/": Webinar,
+    "GET /courses/": Course,
+    "GET /lessons/?course={id}": Lesson,
+    "GET /students/": Student,
+}
+
+
+def _retained(build) -> int:
+    """Bytes still allocated by the object ``build`` returns"""
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del obj
+    return size
+
+
+def run(number: int):
+    bodies = {
+        endpoint: jsonlib.dumps(payload).encode()
+        for endpoint, payload in payloads().items()
+        if endpoint in CATALOGS
+    }
+    header = (
+        f"{'catalog':28} {'items':>6} {'dicts KiB':>10} {'models KiB':>11} {'ratio':>6}"
+    )
+    print(header)
+    print("-" * len(header))
+    for endpoint, model in CATALOGS.items():
+        body = bodies[endpoint]
+        raw = _retained(lambda: jsonlib.loads(body))
+        compact = _retained(lambda: parse_many(model, jsonlib.loads(body)))
+        items = len(jsonlib.loads(body))
+        print(
+            f"{endpoint:28} {items:>6} {raw / 1024:>10.1f} {compact / 1024:>11.1f}"
+            f" {raw / compact:>6.1f}"
+        )
+
+    mentor = jsonlib.loads(bodies["GET /mentors/"])[0]
+    model = Mentor.from_api(mentor)
+    dict_ns = timeit.timeit("m['name']", globals={"m": mentor}, number=number)
+    attr_ns = timeit.timeit("m.name", globals={"m": model}, number=number)
+    dict_ns, attr_ns = dict_ns / number * 1e9, attr_ns / number * 1e9
+    print(f"\nfield read: dict {dict_ns:.1f} ns, model attribute {attr_ns:.1f} ns")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=1_000_000)
+    run(parser.parse_args().number)
@@ -3,35 +3,79 @@ import asyncio
 import aiohttp
 import os
 import logging
-from typing import Any, List, Dict, Optional
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, List, Dict, Optional
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
 from rich import print
+from data.cache import CatalogCache
+from data.singleflight import SingleFlight
+from data.http_pool import ConnectionPool, get_pool
+from data.token_store import MemoryTokenStore, create_token_store
+from data.resilience import (
+    CircuitBreaker,
+    RequestFailedError,
+    RetryableError,
+    RetryPolicy,
+)
+from data.jsonlib import loads as json_loads
+from data.metrics import APIMetrics, endpoint_name, get_metrics
+from data.models import Course, Lesson, Mentor, Student, Webinar, parse_many
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# Resources served identically to every user (AllowAny catalog viewsets)
+PUBLIC_RESOURCES = frozenset({"mentors", "webinars", "courses", "lessons"})
+
 
 class APIClient:
-    def __init__(self):
+    def __init__(
+        self,
+        pool: Optional[ConnectionPool] = None,
+        token_store: Optional[MemoryTokenStore] = None,
+    ):
         self.base_url = os.getenv("TEST_API_URL")
-        self._session: Optional[aiohttp.ClientSession] = None
-        self._auth_cache = {}
-        self._token_refresh_lock = asyncio.Lock()
+        self._pool = pool or get_pool()
+        self._token_store = token_store or create_token_store()
+        # Striped refresh locks: one user's refresh never blocks other users
+        self._refresh_locks = [
+            asyncio.Lock() for _ in range(int(os.getenv("REFRESH_LOCK_STRIPES", 64)))
+        ]
+        self._refresh_lock_waits = 0
+        self._refresh_lock_wait_total = 0.0
+        self._refresh_lock_wait_max = 0.0
         self._token_expiry_hours = int(
             os.getenv("TOKEN_EXPIRY_HOURS", 23)
         )  # configurable token expiry
+        self._catalog_cache = CatalogCache()
+        self._singleflight = SingleFlight()
+        # Lower-cased mentor name -> mentor, rebuilt when the catalog changes
+        self._mentor_name_index: Dict[str, Mentor] = {}
+        self._mentor_index_source: Optional[list] = None
+        # telegram_id -> last activity (epoch seconds), oldest first
+        self._last_active: "OrderedDict[int, float]" = OrderedDict()
+        self._metrics: APIMetrics = get_metrics()
+        self._retry_policy = RetryPolicy()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        # (url, params) -> (ETag, raw body) for conditional catalog GETs; the
+        # body is kept as bytes and only parsed again on a 304
+        self._validators: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._max_validators = 256
+        self.not_modified_responses = 0
+        self._max_tracked_users = int(os.getenv("TOKEN_STORE_MAXSIZE", 10000))
 
     async def get_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
-        return self._session
+        """Return the shared pooled session (timeouts are set on the pool)"""
+        return await self._pool.get_session()
 
-    def _get_headers(self, telegram_id: int = None) -> dict:
+    async def _get_headers(self, telegram_id: int = None) -> dict:
         """Get headers with auth token if available"""
         headers = {"Content-Type": "application/json"}
         if telegram_id:
-            token = self._get_cached_token(telegram_id)
+            token = await self._get_cached_token(telegram_id)
             if token:
                 headers["Authorization"] = (
                     f"Bearer {token}"  # Changed from Token to Bearer
@@ -41,71 +85,130 @@ class APIClient:
                 logger.warning(f"No token found for user {telegram_id}")
         return headers
 
-    def _get_cached_token(self, telegram_id: int) -> Optional[str]:
-        if telegram_id in self._auth_cache:
-            token_data = self._auth_cache[telegram_id]
-            if datetime.now() < token_data["expires_at"]:
-                return token_data["token"]
-            else:
-                logger.debug(f"Token expired for user {telegram_id}")
-                del self._auth_cache[telegram_id]
-        return None
+    def _mark_active(self, telegram_id: int):
+        self._last_active[telegram_id] = time.time()
+        self._last_active.move_to_end(telegram_id)
+        while len(self._last_active) > self._max_tracked_users:
+            self._last_active.popitem(last=False)
+
+    def recently_active_users(self, window: float) -> List[int]:
+        """Telegram IDs seen within the last ``window`` seconds"""
+        cutoff = time.time() - window
+        active = []
+        for telegram_id, last_seen in reversed(self._last_active.items()):
+            if last_seen < cutoff:
+                break
+            active.append(telegram_id)
+        return active
+
+    async def token_expires_at(self, telegram_id: int) -> Optional[float]:
+        """Epoch seconds at which the cached token expires, if any"""
+        return await self._token_store.expires_at(telegram_id)
+
+    async def has_token(self, telegram_id: int) -> bool:
+        """Whether an unexpired token is cached for the user"""
+        return await self._get_cached_token(telegram_id) is not None
+
+    async def _get_cached_token(self, telegram_id: int) -> Optional[str]:
+        return await self._token_store.get(telegram_id)
+
+    async def _store_token(
+        self, telegram_id: int, token: str, expires_at: Optional[float] = None
+    ):
+        """
+        Store token with expiration; ``expires_at`` (epoch seconds) is the
+        server's expiry when known, otherwise a freshly issued token is
+        assumed
+        """
+        if expires_at is None:
+            expires_at = (
+                datetime.now() + timedelta(hours=self._token_expiry_hours)
+            ).timestamp()
+        await self._token_store.set(telegram_id, token, expires_at)
+        logger.debug(f"Stored new token for user {telegram_id}")
 
-    def _store_token(self, telegram_id: int, token: str):
-        """Store token with expiration"""
-        self._auth_cache[telegram_id] = {
-            "token": token,
-            "expires_at": datetime.now() + timedelta(hours=self._token_expiry_hours),
+    def cache_stats(self) -> Dict[str, int]:
+        """Hit/miss counters of the catalog cache and ETag revalidations"""
+        return {
+            **self._catalog_cache.stats(),
+            "not_modified": self.not_modified_responses,
         }
-        logger.debug(f"Stored new token for user {telegram_id}")
+
+    def singleflight_stats(self) -> Dict[str, int]:
+        """Number of reads coalesced onto an in-flight request"""
+        return self._singleflight.stats()
+
+    def request_stats(self) -> Dict[str, Dict]:
+        """Latency percentiles, statuses, errors, retries and bytes per endpoint"""
+        return self._metrics.snapshot()
+
+    def prometheus_metrics(self) -> str:
+        """Request metrics in Prometheus text exposition format"""
+        return self._metrics.to_prometheus()
+
+    def pool_stats(self) -> Dict[str, int]:
+        """Open, idle and waiting connections of the shared HTTP pool"""
+        return self._pool.stats()
 
     async def close(self):
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """
+        Close a pool passed in for this client only. The process-wide pool
+        is shared by every client and is closed once, on app shutdown.
+        """
+        if self._pool is not get_pool():
+            await self._pool.close()
+
+    def _refresh_lock_for(self, telegram_id: int) -> asyncio.Lock:
+        return self._refresh_locks[hash(str(telegram_id)) % len(self._refresh_locks)]
+
+    def refresh_lock_stats(self) -> Dict[str, float]:
+        """Time spent waiting on token refresh locks, in seconds"""
+        waits = self._refresh_lock_waits
+        return {
+            "waits": waits,
+            "total_wait": self._refresh_lock_wait_total,
+            "avg_wait": self._refresh_lock_wait_total / waits if waits else 0.0,
+            "max_wait": self._refresh_lock_wait_max,
+        }
 
     async def refresh_token(self, telegram_id: int) -> bool:
-        async with self._token_refresh_lock:
+        stale_token = await self._get_cached_token(telegram_id)
+        started = time.monotonic()
+        async with self._refresh_lock_for(telegram_id):
+            waited = time.monotonic() - started
+            self._refresh_lock_waits += 1
+            self._refresh_lock_wait_total += waited
+            self._refresh_lock_wait_max = max(self._refresh_lock_wait_max, waited)
+
+            # A concurrent caller already refreshed this user's token
+            current_token = await self._get_cached_token(telegram_id)
+            if current_token and current_token != stale_token:
+                self._metrics.record_refresh("reused")
+                return True
+
             try:
                 session = await self.get_session()
                 url = f"{self.base_url}/students/refresh_token/"
                 payload = {"telegram_id": str(telegram_id)}
 
-                async with session.post(url, json=payload, timeout=10) as response:
+                async with session.post(url, json=payload) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await response.json(loads=json_loads)
                         if token := data.get("token"):
-                            self._store_token(telegram_id, token)
+                            await self._store_token(telegram_id, token)
                             logger.info(
                                 f"Successfully refreshed token for user {telegram_id}"
                             )
+                            self._metrics.record_refresh("success")
                             return True
                     logger.error(
                         f"Token refresh failed: {response.status} - {await response.text()}"
                     )
+                    self._metrics.record_refresh("failure")
                     return False
             except Exception as e:
                 logger.error(f"Token refresh error: {e}")
-                return False
-
-        async with self._token_refresh_lock:
-            try:
-                session = await self.get_session()
-                url = f"{self.base_url}/students/refresh_token/"
-                payload = {"telegram_id": str(telegram_id)}
-
-                async with session.post(url, json=payload, timeout=10) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if token := data.get("token"):
-                            self._store_token(telegram_id, token)
-                            return True
-                    else:
-                        logger.error(
-                            f"Token refresh failed with status: {response.status} - {await response.text()}"
-                        )
-                    return False
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                logger.error(f"Token refresh error: {e}")
+                self._metrics.record_refresh("failure")
                 return False
 
     async def ensure_authenticated(self, telegram_id: int, name: str = None) -> bool:
@@ -114,8 +217,10 @@ class APIClient:
             logger.error("Missing telegram_id for authentication")
             return False
 
+        self._mark_active(telegram_id)
+
         # Check cached token first
-        if self._get_cached_token(telegram_id):
+        if await self._get_cached_token(telegram_id):
             return True
 
         if not name:
@@ -127,11 +232,11 @@ class APIClient:
             url = f"{self.base_url}/students/authenticate/"
             payload = {"telegram_id": str(telegram_id), "name": name}
 
-            async with session.post(url, json=payload, timeout=10) as response:
+            async with session.post(url, json=payload) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=json_loads)
                     if token := data.get("token"):
-                        self._store_token(telegram_id, token)
+                        await self._store_token(telegram_id, token)
                         return True
                 logger.error(f"Authentication failed: {await response.text()}")
                 return False
@@ -139,6 +244,53 @@ class APIClient:
             logger.error(f"Authentication error: {e}")
             return False
 
+    def _resource_of(self, url: str) -> str:
+        path = url[len(self.base_url or "") :].strip("/")
+        return path.split("/", 1)[0]
+
+    @staticmethod
+    def _normalize_params(params: Optional[dict]) -> tuple:
+        return tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+
+    def _singleflight_key(
+        self, method: str, url: str, telegram_id: int, params: Optional[dict]
+    ) -> tuple:
+        """Key identical reads; public resources are shared across users"""
+        resource = self._resource_of(url)
+        identity = None if resource in PUBLIC_RESOURCES else telegram_id
+        return (method.upper(), url, self._normalize_params(params), identity)
+
+    def _validator_key(
+        self, method: str, url: str, params: Optional[dict]
+    ) -> Optional[tuple]:
+        """Only public catalog reads are revalidated with ETags"""
+        if method.upper() != "GET" or self._resource_of(url) not in PUBLIC_RESOURCES:
+            return None
+        return (url, self._normalize_params(params))
+
+    async def _read_validated(
+        self, response: aiohttp.ClientResponse, key: Optional[tuple], cached
+    ) -> Any:
+        """
+        Parse a 200 or 304 response. A 304 reuses the body stored with the
+        ETag we sent; a 200 with an ETag is remembered for the next request.
+        """
+        if response.status == 304 and cached is not None:
+            self.not_modified_responses += 1
+            # Re-insert: a concurrent request may have evicted the entry
+            self._remember_validator(key, cached)
+            return json_loads(cached[1])
+        data = await response.json(loads=json_loads)
+        if key is not None and (etag := response.headers.get("ETag")):
+            self._remember_validator(key, (etag, await response.read()))
+        return data
+
+    def _remember_validator(self, key: tuple, validator: tuple):
+        self._validators[key] = validator
+        self._validators.move_to_end(key)
+        while len(self._validators) > self._max_validators:
+            self._validators.popitem(last=False)
+
     async def make_authenticated_request(
         self, method: str, url: str, telegram_id: int, **kwargs
     ):
@@ -146,57 +298,165 @@ class APIClient:
             logger.error("No telegram_id provided for authenticated request")
             return None
 
+        self._mark_active(telegram_id)
+
+        if method.upper() != "GET":
+            return await self._send_authenticated_request(
+                method, url, telegram_id, **kwargs
+            )
+
+        key = self._singleflight_key(method, url, telegram_id, kwargs.get("params"))
+        return await self._singleflight.do(
+            key,
+            lambda: self._send_authenticated_request(
+                method, url, telegram_id, **kwargs
+            ),
+        )
+
+    def _endpoint_name(self, method: str, url: str) -> str:
+        """Logical endpoint, e.g. ``GET /courses/{id}/``"""
+        return endpoint_name(method, urlsplit(url).path)
+
+    def _breaker_for(self, endpoint: str) -> CircuitBreaker:
+        if endpoint not in self._breakers:
+            self._breakers[endpoint] = CircuitBreaker()
+        return self._breakers[endpoint]
+
+    def breaker_states(self) -> Dict[str, str]:
+        """Circuit breaker state per logical endpoint"""
+        return {endpoint: b.state for endpoint, b in self._breakers.items()}
+
+    async def _send_authenticated_request(
+        self, method: str, url: str, telegram_id: int, **kwargs
+    ):
+        try:
+            return await self._call_resilient(
+                method,
+                url,
+                lambda: self._request_once(method, url, telegram_id, **kwargs),
+            )
+        except RequestFailedError:
+            return None
+
+    async def _call_resilient(self, method: str, url: str, send):
+        """
+        Await ``send()`` through the endpoint's circuit breaker, retrying
+        idempotent reads on RetryableError with backoff.
+
+        Raises:
+            RequestFailedError: When the circuit is open, retries are used
+                up or ``send`` fails otherwise.
+        """
+        endpoint = self._endpoint_name(method, url)
+        breaker = self._breaker_for(endpoint)
+        # Only idempotent reads are retried
+        attempts = self._retry_policy.max_attempts if method.upper() == "GET" else 1
+
+        for attempt in range(attempts):
+            if not breaker.allow_request():
+                logger.warning(f"Circuit open for {endpoint}, failing fast")
+                raise RequestFailedError(f"Circuit open for {endpoint}")
+            try:
+                result = await send()
+            except RequestFailedError as e:
+                # The server answered (e.g. 4xx); not a sign it is down
+                breaker.record_success()
+                logger.error(f"Request failed: {e}")
+                raise
+            except RetryableError as e:
+                breaker.record_failure()
+                if attempt + 1 < attempts:
+                    self._metrics.record_retry(endpoint)
+                    delay = self._retry_policy.delay(attempt)
+                    logger.warning(
+                        f"Request to {endpoint} failed ({e}), retrying in {delay:.2f}s"
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                logger.error(f"Request failed: {e}")
+                raise RequestFailedError(str(e)) from e
+            except Exception as e:
+                breaker.record_failure()
+                logger.error(f"Request failed: {e}")
+                raise RequestFailedError(str(e)) from e
+            except BaseException:
+                # Cancelled: no outcome, but a half-open probe must not stick
+                breaker.release()
+                raise
+            breaker.record_success()
+            return result
+        raise RequestFailedError(f"No attempts made for {endpoint}")
+
+    async def _request_once(self, method: str, url: str, telegram_id: int, **kwargs):
+        """
+        Send one request, refreshing the token once on 401.
+
+        Raises:
+            RetryableError: On timeouts, connection errors and 5xx responses.
+        """
         session = await self.get_session()
-        headers = self._get_headers(telegram_id)
-        kwargs["headers"] = headers
+        key = self._validator_key(method, url, kwargs.get("params"))
+        cached = self._validators.get(key) if key else None
+        # Catalog reads are public: no token lookup (or missing-token warning)
+        public = key is not None
+        kwargs["headers"] = await self._get_headers(None if public else telegram_id)
+        if cached:
+            kwargs["headers"]["If-None-Match"] = cached[0]
 
         try:
-            async with session.request(method, url, **kwargs, timeout=10) as response:
+            async with session.request(method, url, **kwargs) as response:
                 if response.status == 401:
                     logger.info(f"Attempting token refresh for user {telegram_id}")
                     if await self.refresh_token(telegram_id):
                         # Get fresh headers after token refresh
-                        kwargs["headers"] = self._get_headers(telegram_id)
+                        kwargs["headers"] = await self._get_headers(telegram_id)
                         async with session.request(
-                            method, url, **kwargs, timeout=10
+                            method, url, **kwargs
                         ) as retry_response:
                             if retry_response.status == 200:
-                                return await retry_response.json()
+                                return await self._read_validated(
+                                    retry_response, key, None
+                                )
+                            if retry_response.status >= 500:
+                                raise RetryableError(
+                                    f"{retry_response.status} after token refresh"
+                                )
                             logger.error(
                                 f"Request failed after token refresh: {retry_response.status} - {await retry_response.text()}"
                             )
                             return None
                     return None
 
-                if response.status == 200:
-                    return await response.json()
+                if response.status in (200, 304):
+                    return await self._read_validated(response, key, cached)
+
+                if response.status >= 500:
+                    raise RetryableError(f"{response.status} - {await response.text()}")
 
                 logger.error(
                     f"Request failed: {response.status} - {await response.text()}"
                 )
                 return None
-
-        except Exception as e:
-            logger.error(f"Request failed: {e}")
-            return None
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            raise RetryableError(str(e) or type(e).__name__) from e
 
     async def authenticate_user(self, telegram_id: int, name: str = None) -> bool:
         try:
             session = await self.get_session()
             url = f"{self.base_url}/students/authenticate/"
 
-            if self._get_cached_token(telegram_id):
+            if await self._get_cached_token(telegram_id):
                 return True
 
             payload = {"telegram_id": str(telegram_id)}
             if name:
                 payload["name"] = name
 
-            async with session.post(url, json=payload, timeout=10) as response:
+            async with session.post(url, json=payload) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=json_loads)
                     if token := data.get("token"):
-                        self._store_token(telegram_id, token)
+                        await self._store_token(telegram_id, token)
                         logger.info(f"User {telegram_id} authenticated successfully")
                         return True
                 logger.error(f"Authentication failed: {await response.text()}")
@@ -205,6 +465,55 @@ class APIClient:
             logger.error(f"Authentication error: {e}")
             return False
 
+    async def bootstrap(
+        self, telegram_id: int, language: str = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load the student profile and a valid token in one round-trip.
+
+        Args:
+            telegram_id: The user's Telegram ID.
+            language: Optional language choice to store for the student.
+
+        Returns:
+            A dict with ``student`` (a Student, None if not registered),
+            ``token`` and its ``expires_at``,
+            or None if the request failed. The token is cached, so the
+            auth middleware does not authenticate the user again.
+        """
+        try:
+            session = await self.get_session()
+            url = f"{self.base_url}/students/bootstrap/"
+            payload = {"telegram_id": str(telegram_id)}
+            if language:
+                payload["language"] = language
+
+            async with session.post(url, json=payload) as response:
+                if response.status == 200:
+                    data = await response.json(loads=json_loads)
+                    if token := data.get("token"):
+                        # The server may hand back an existing, older token
+                        expires_at = data.get("expires_at")
+                        await self._store_token(
+                            telegram_id,
+                            token,
+                            (
+                                datetime.fromisoformat(expires_at).timestamp()
+                                if expires_at
+                                else None
+                            ),
+                        )
+                    if data.get("student"):
+                        data["student"] = Student.from_api(data["student"])
+                    return data
+                logger.error(
+                    f"Bootstrap failed: {response.status} - {await response.text()}"
+                )
+                return None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Bootstrap error: {e}")
+            return None
+
     async def is_user_registered(self, telegram_id: int) -> bool:
         """
         Check if a user is already registered in the database.
@@ -222,23 +531,38 @@ class APIClient:
             logger.error(f"Error checking user registration: {e}")
             return False
 
-    async def get_mentors(self, telegram_id: int) -> list:
+    async def get_mentors(self, telegram_id: int) -> List[Mentor]:
         """Get mentors with proper session management"""
         if not telegram_id:
             logger.error("telegram_id is required for get_mentors")
             return []
 
+        async def load_mentors():
+            mentors = await self.make_authenticated_request(
+                "GET", f"{self.base_url}/mentors/", telegram_id=telegram_id
+            )
+            return parse_many(Mentor, mentors)
+
         try:
-            return (
-                await self.make_authenticated_request(
-                    "GET", f"{self.base_url}/mentors/", telegram_id=telegram_id
-                )
-                or []
+            mentors = await self._catalog_cache.get_or_load(
+                "mentors", None, load_mentors
             )
+            if mentors:
+                self._index_mentors(mentors)
+            return mentors or []
         except Exception as e:
             logger.error(f"Error fetching mentors: {e}")
             return []
 
+    def _index_mentors(self, mentors: list):
+        """Rebuild the name index only when the cache hands out a new catalog"""
+        if mentors is self._mentor_index_source:
+            return
+        self._mentor_name_index = {
+            mentor.name.lower(): mentor for mentor in mentors if mentor.name
+        }
+        self._mentor_index_source = mentors
+
     # Add context manager support
     async def __aenter__(self):
         await self.get_session()
@@ -262,10 +586,10 @@ class APIClient:
             url = f"{self.base_url}/students/"
             logger.info(f"Sending request to {url} with data: {student_data}")
 
-            async with session.post(url, json=student_data, timeout=10) as response:
+            async with session.post(url, json=student_data) as response:
                 if response.status == 201:
                     logger.info(
-                        f"Student created successfully: {await response.json()}"
+                        f"Student created successfully: {await response.json(loads=json_loads)}"
                     )
                     return True
                 else:
@@ -300,7 +624,7 @@ class APIClient:
             logger.error(f"Error creating user: {e}")
             return False
 
-    async def get_student_by_telegram_id(self, telegram_id: str) -> Optional[Dict]:
+    async def get_student_by_telegram_id(self, telegram_id: str) -> Optional[Student]:
         """
         Get student details by Telegram ID.
 
@@ -308,40 +632,23 @@ class APIClient:
             telegram_id: The student's Telegram ID.
 
         Returns:
-            A dictionary containing the student's information, or None if not found.
+            The student, or None if not found.
         """
         try:
             session = await self.get_session()
-            url = f"{self.base_url}/students/?telegram_id={telegram_id}"
+            url = f"{self.base_url}/students/by-telegram/{telegram_id}/"
             logger.info(f"Fetching student with telegram_id={telegram_id} from {url}")
 
-            async with session.get(url, timeout=10) as response:
+            async with session.get(url) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Received response: {data}")
-
-                    # Handle different response formats
-                    if isinstance(data, list):
-                        # Iterate through the list to find the student with the matching telegram_id
-                        for student in data:
-                            if str(student.get("telegram_id")) == str(telegram_id):
-                                return student
-                        logger.info(f"No student found with telegram_id={telegram_id}")
-                        return None
-                    elif isinstance(data, dict):
-                        # If the response is a single object, check if it matches the telegram_id
-                        if str(data.get("telegram_id")) == str(telegram_id):
-                            return data
-                        logger.info(f"No student found with telegram_id={telegram_id}")
-                        return None
-                    else:
-                        logger.error(f"Unexpected response format: {type(data)}")
-                        return None
-                else:
-                    logger.error(
-                        f"Failed to get student: {response.status} - {await response.text()}"
-                    )
+                    return Student.from_api(await response.json(loads=json_loads))
+                if response.status == 404:
+                    logger.info(f"No student found with telegram_id={telegram_id}")
                     return None
+                logger.error(
+                    f"Failed to get student: {response.status} - {await response.text()}"
+                )
+                return None
         except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Error getting student: {e}")
             return None
@@ -366,10 +673,10 @@ class APIClient:
             if "telegram_id" in update_data:
                 del update_data["telegram_id"]
 
-            async with session.patch(url, json=update_data, timeout=10) as response:
+            async with session.patch(url, json=update_data) as response:
                 if response.status == 200:
                     logger.info(
-                        f"Student updated successfully: {await response.json()}"
+                        f"Student updated successfully: {await response.json(loads=json_loads)}"
                     )
                     return True
                 else:
@@ -381,15 +688,30 @@ class APIClient:
             logger.error(f"Error updating student: {e}")
             return False
 
-    async def get_mentor_by_name(self, name: str) -> Optional[Dict]:
+    async def get_mentor_by_name(
+        self, name: str, telegram_id: int = None
+    ) -> Optional[Mentor]:
+        """
+        Resolve a mentor by name, case-insensitively.
+
+        Args:
+            name: Mentor name, e.g. taken from a keyboard button.
+            telegram_id: If given, the cached mentor catalog is loaded if
+                needed and treated as authoritative.
+        """
+        if telegram_id and await self.get_mentors(telegram_id):
+            return self._mentor_name_index.get(name.lower())
+        if mentor := self._mentor_name_index.get(name.lower()):
+            return mentor
+
         session = await self.get_session()
         try:
-            async with session.get(f"{self.base_url}/mentors/", timeout=10) as response:
+            async with session.get(
+                f"{self.base_url}/mentors/", params={"name": name}
+            ) as response:
                 if response.status == 200:
-                    mentors = await response.json()
-                    return next(
-                        (m for m in mentors if m["name"].lower() == name.lower()), None
-                    )
+                    mentors = await response.json(loads=json_loads)
+                    return Mentor.from_api(mentors[0]) if mentors else None
                 logger.error(
                     f"Failed to get mentor by name: {response.status} - {await response.text()}"
                 )
@@ -398,7 +720,7 @@ class APIClient:
             logger.error(f"Error fetching mentor by name: {e}")
             return None
 
-    async def get_mentor_by_telegram_id(self, telegram_id: str) -> Optional[Dict]:
+    async def get_mentor_by_telegram_id(self, telegram_id: str) -> Optional[Mentor]:
         """
         Get mentor details by Telegram ID.
 
@@ -406,15 +728,15 @@ class APIClient:
             telegram_id: The mentor's Telegram ID.
 
         Returns:
-            A dictionary containing the mentor's information, or None if not found.
+            The mentor, or None if not found.
         """
         try:
             session = await self.get_session()
             url = f"{self.base_url}/mentors/?telegram_id={telegram_id}"
-            async with session.get(url, timeout=10) as response:
+            async with session.get(url) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    return data[0] if data else None
+                    data = await response.json(loads=json_loads)
+                    return Mentor.from_api(data[0]) if data else None
                 logger.error(
                     f"Failed to get mentor: {response.status} - {await response.text()}"
                 )
@@ -423,44 +745,62 @@ class APIClient:
             logger.error(f"Error getting mentor: {e}")
             return None
 
-    async def get_mentor_by_id(self, mentor_id: int) -> Optional[Dict]:
+    async def get_mentor_by_id(self, mentor_id: int) -> Optional[Mentor]:
         """Get a mentor by ID."""
         session = await self.get_session()
         try:
             async with session.get(
                 f"{self.base_url}/mentors/{mentor_id}/",
-                headers=self._get_headers(),
-                timeout=10,
+                headers=await self._get_headers(),
             ) as response:
                 response.raise_for_status()
-                return await response.json()
+                return Mentor.from_api(await response.json(loads=json_loads))
         except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Error fetching mentor {mentor_id}: {e}")
             return None
 
     async def get_mentor_id_by_name(self, name: str) -> Optional[int]:
         mentor = await self.get_mentor_by_name(name)
-        return mentor.get("id") if mentor else None
+        return mentor.id if mentor else None
+
+    async def get_courses(self) -> Optional[List[Course]]:
+        """Get every course."""
+        return await self._catalog_cache.get_or_load(
+            "courses", ("all",), lambda: self._fetch_courses()
+        )
 
-    async def get_courses_by_mentor_id(self, mentor_id: int) -> Optional[List[Dict]]:
+    async def get_courses_by_mentor_id(self, mentor_id: int) -> Optional[List[Course]]:
         """Get courses by a specific mentor ID."""
+        return await self._catalog_cache.get_or_load(
+            "courses",
+            ("mentor", mentor_id),
+            lambda: self._fetch_courses(mentor_id),
+        )
+
+    async def _fetch_courses(
+        self, mentor_id: Optional[int] = None
+    ) -> Optional[List[Course]]:
         session = await self.get_session()
+        url = f"{self.base_url}/courses/"
+        params = {"mentor": mentor_id} if mentor_id is not None else {}
+        key = self._validator_key("GET", url, params)
+        cached = self._validators.get(key)
+        headers = await self._get_headers()
+        if cached:
+            headers["If-None-Match"] = cached[0]
         try:
-            async with session.get(
-                f"{self.base_url}/courses/", headers=self._get_headers(), timeout=10
-            ) as response:
+            async with session.get(url, params=params, headers=headers) as response:
                 response.raise_for_status()
-                courses = await response.json()
-                return [
-                    course for course in courses if course["mentor"]["id"] == mentor_id
-                ]
+                return parse_many(
+                    Course, await self._read_validated(response, key, cached)
+                )
         except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-            logger.error(f"Error fetching courses for mentor {mentor_id}: {e}")
+            logger.error(f"Error fetching courses (mentor {mentor_id}): {e}")
             return None
 
     async def get_course_by_id(
         self, course_id: int, telegram_id: int
-    ) -> Optional[Dict]:
+    ) -> Optional[Course]:
         """
         Get course details by ID.
 
@@ -472,9 +812,17 @@ class APIClient:
             logger.error("telegram_id is required for get_course_by_id")
             return None
 
+        async def load_course():
+            course = await self.make_authenticated_request(
+                "GET",
+                f"{self.base_url}/courses/{course_id}/",
+                telegram_id=telegram_id,
+            )
+            return Course.from_api(course) if course else None
+
         try:
-            return await self.make_authenticated_request(
-                "GET", f"{self.base_url}/courses/{course_id}/", telegram_id=telegram_id
+            return await self._catalog_cache.get_or_load(
+                "courses", course_id, load_course
             )
         except Exception as e:
             logger.error(f"Error fetching course {course_id}: {e}")
@@ -482,11 +830,20 @@ class APIClient:
 
     async def get_lessons_by_course_id(
         self, course_id: int, telegram_id: int
-    ) -> List[Dict]:
+    ) -> List[Lesson]:
         """Fetch lessons by course ID."""
-        try:
+
+        async def load_lessons():
             course = await self.get_course_by_id(course_id, telegram_id)
-            return course.get("lessons", []) if course else []
+            return list(course.lessons) if course else None
+
+        try:
+            return (
+                await self._catalog_cache.get_or_load(
+                    "lessons", course_id, load_lessons
+                )
+                or []
+            )
         except Exception as e:
             logger.error(f"Error fetching lessons for course {course_id}: {e}")
             return []
@@ -578,11 +935,13 @@ class APIClient:
             async with session.patch(
                 f"{self.base_url}/mentors/{mentor_id}/",
                 json=update_data,
-                headers=self._get_headers(telegram_id),
-                timeout=10,
+                headers=await self._get_headers(telegram_id),
             ) as response:
                 response.raise_for_status()
-                return await response.json()
+                # Webinars embed mentor details, so drop both catalogs
+                self._catalog_cache.invalidate("mentors")
+                self._catalog_cache.invalidate("webinars")
+                return await response.json(loads=json_loads)
         except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Error updating mentor {mentor_id}: {e}")
             return None
@@ -596,18 +955,20 @@ class APIClient:
             async with session.patch(
                 f"{self.base_url}/lessons/{lesson_id}/",
                 json=update_data,
-                headers=self._get_headers(telegram_id),
-                timeout=10,
+                headers=await self._get_headers(telegram_id),
             ) as response:
                 response.raise_for_status()
-                return await response.json()
+                # Course responses embed their lessons
+                self._catalog_cache.invalidate("lessons")
+                self._catalog_cache.invalidate("courses")
+                return await response.json(loads=json_loads)
         except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Error updating lesson {lesson_id}: {e}")
             return None
 
     async def get_webinars(
         self, telegram_id: int, mentor_id: int = None
-    ) -> Optional[List[Dict]]:
+    ) -> Optional[List[Webinar]]:
         """
         Get webinars with optional mentor filter.
 
@@ -616,50 +977,130 @@ class APIClient:
             mentor_id: Optional mentor ID to filter webinars
 
         Returns:
-            List of webinar dictionaries
+            List of webinars
         """
         try:
-            params = {}
-            if mentor_id:
-                params["mentor"] = mentor_id
-
-            result = await self.make_authenticated_request(
-                "GET",
-                f"{self.base_url}/webinars/",
-                telegram_id=telegram_id,
-                params=params,
+            return await self._catalog_cache.get_or_load(
+                "webinars",
+                mentor_id,
+                lambda: self._fetch_webinars(telegram_id, mentor_id),
             )
-
-            if isinstance(result, dict):
-                # Handle paginated response
-                return result.get("results", [])
-            elif isinstance(result, list):
-                # Handle non-paginated response
-                return result
-            return None
-
         except Exception as e:
             logger.error(f"Error fetching webinars: {e}")
             return None
 
-    async def get_all_users(self) -> List[Dict]:
+    async def _fetch_webinars(
+        self, telegram_id: int, mentor_id: int = None
+    ) -> Optional[List[Webinar]]:
+        params = {}
+        if mentor_id:
+            params["mentor"] = mentor_id
+
+        result = await self.make_authenticated_request(
+            "GET",
+            f"{self.base_url}/webinars/",
+            telegram_id=telegram_id,
+            params=params,
+        )
+
+        if isinstance(result, dict):
+            # Handle paginated response
+            return parse_many(Webinar, result.get("results", []))
+        elif isinstance(result, list):
+            # Handle non-paginated response
+            return parse_many(Webinar, result)
+        return None
+
+    async def iter_users(
+        self,
+        page_size: int = 500,
+        after: Optional[int] = None,
+        audience: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Student]:
+        """
+        Stream users page by page, in id order, from the cursor-paginated
+        ``/students/compact/`` endpoint, optionally starting past student
+        id ``after``. With ``audience`` (filters such as ``language`` or
+        ``course``) only matching students are streamed, filtered by the
+        server via ``/students/audience/``.
+
+        Only one page is held in memory at a time, so callers can start
+        working after the first page arrives. Only ``id``, ``telegram_id``
+        and ``language`` are set on the yielded students. Page fetches are
+        retried and go through the endpoint's circuit breaker.
+
+        Raises:
+            RequestFailedError: If a page still cannot be fetched, so a
+                stream cut short is never mistaken for the end.
+        """
+        if audience:
+            url = f"{self.base_url}/students/audience/"
+            params = {**audience, "page_size": page_size}
+        else:
+            url = f"{self.base_url}/students/compact/"
+            params = {"page_size": page_size}
+        if after is not None:
+            params["after"] = after
+        while url:
+            page = await self._call_resilient(
+                "GET", url, lambda: self._fetch_page(url, params)
+            )
+            # The next link already carries the cursor and page size
+            url, params = page.get("next"), None
+            for user in page.get("results", []):
+                yield Student.from_api(user)
+
+    async def _fetch_page(self, url: str, params: Optional[dict]) -> dict:
         """
-        Fetch all users from the database.
+        Fetch one page of a paginated endpoint.
 
-        Returns:
-            A list of user dictionaries, each containing user details.
+        Raises:
+            RetryableError: On timeouts, connection errors and 5xx responses.
+            RequestFailedError: On any other non-200 response.
         """
+        session = await self.get_session()
+        try:
+            async with session.get(url, params=params) as response:
+                if response.status >= 500:
+                    raise RetryableError(f"{response.status} - {await response.text()}")
+                if response.status != 200:
+                    raise RequestFailedError(
+                        f"{response.status} - {await response.text()}"
+                    )
+                return await response.json(loads=json_loads)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            raise RetryableError(str(e) or type(e).__name__) from e
+
+    async def count_audience(
+        self, audience: Optional[Dict[str, Any]] = None
+    ) -> Optional[int]:
+        """Number of students matching ``audience``; None if the request fails."""
+        url = f"{self.base_url}/students/audience/count/"
         try:
             session = await self.get_session()
-            url = f"{self.base_url}/students/"  # Replace with the correct endpoint
-            async with session.get(url, timeout=10) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data
-                logger.error(
-                    f"Failed to fetch users: {response.status} - {await response.text()}"
-                )
-                return []
+            async with session.get(url, params=audience or {}) as response:
+                if response.status != 200:
+                    logger.error(
+                        f"Failed to count audience {audience}: "
+                        f"{response.status} - {await response.text()}"
+                    )
+                    return None
+                return (await response.json(loads=json_loads))["count"]
         except Exception as e:
-            logger.error(f"Error fetching users: {e}")
-            return []
\ No newline at end of file
+            logger.error(f"Error counting audience {audience}: {e}")
+            return None
+
+
+_client: Optional[APIClient] = None
+
+
+def get_api_client() -> APIClient:
+    """
+    Return the process-wide APIClient, created on first use. Its catalog
+    cache, ETag validators and token store are per instance, so every
+    module shares this one.
+    """
+    global _client
+    if _client is None:
+        _client = APIClient()
+    return _client
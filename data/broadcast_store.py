@@ -0,0 +1,225 @@
+# data/broadcast_store.py
+import asyncio
+import logging
+import os
+import sqlite3
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from dotenv import load_dotenv
+
+from data import jsonlib
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+RUNNING = "running"
+PAUSED = "paused"
+CANCELLED = "cancelled"
+DONE = "done"
+
+SENT = "sent"
+BLOCKED = "blocked"
+FAILED = "failed"
+OUTCOMES = (SENT, BLOCKED, FAILED)
+
+
+@dataclass
+class BroadcastJob:
+    id: int
+    text: str
+    status: str
+    admin_chat_id: int
+    status_message_id: Optional[int] = None
+    cursor: Optional[int] = None  # every student up to this id is done
+    sent: int = 0
+    blocked: int = 0
+    failed: int = 0
+    audience: Optional[Dict[str, Any]] = None  # None means every student
+
+    @classmethod
+    def from_row(cls, row) -> "BroadcastJob":
+        *fields, audience = row
+        return cls(*fields, audience=jsonlib.loads(audience) if audience else None)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (CANCELLED, DONE)
+
+
+class BroadcastStore:
+    """
+    Broadcast jobs persisted to a local SQLite file.
+
+    A job stores its text, status, a checkpoint cursor (the student id
+    up to which every recipient has been handled) and one outcome row per
+    recipient, written as soon as the send finishes. After a restart a
+    job resumes streaming students past the cursor and skips recipients
+    that already have an outcome, so nobody gets the message twice.
+
+    Outcomes and checkpoints, written for every recipient of a running
+    broadcast, go through ``save`` to a dedicated writer thread with its
+    own connection, so the event loop never waits on a commit. Writes
+    run in submission order, so a cursor is never stored ahead of the
+    outcomes it covers. Job bookkeeping (create, status) stays on the
+    caller's connection.
+    """
+
+    def __init__(self, path: str = "broadcasts.sqlite3"):
+        self.path = path
+        self._conn = sqlite3.connect(path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS broadcast_jobs ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, text TEXT NOT NULL, "
+            "status TEXT NOT NULL, admin_chat_id INTEGER NOT NULL, "
+            "status_message_id INTEGER, cursor INTEGER, "
+            "sent INTEGER NOT NULL DEFAULT 0, blocked INTEGER NOT NULL DEFAULT 0, "
+            "failed INTEGER NOT NULL DEFAULT 0, audience TEXT, "
+            "created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
+        columns = {
+            row[1] for row in self._conn.execute("PRAGMA table_info(broadcast_jobs)")
+        }
+        if "audience" not in columns:  # files created before segmentation
+            self._conn.execute("ALTER TABLE broadcast_jobs ADD COLUMN audience TEXT")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS broadcast_recipients ("
+            "job_id INTEGER NOT NULL, chat_id INTEGER NOT NULL, "
+            "outcome TEXT NOT NULL, PRIMARY KEY (job_id, chat_id))"
+        )
+        # One worker thread owns every use of the writer connection
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="broadcast-store"
+        )
+        self._writer = sqlite3.connect(
+            path, isolation_level=None, check_same_thread=False
+        )
+
+    def create_job(
+        self,
+        text: str,
+        admin_chat_id: int,
+        audience: Optional[Dict[str, Any]] = None,
+    ) -> BroadcastJob:
+        now = time.time()
+        cursor = self._conn.execute(
+            "INSERT INTO broadcast_jobs (text, status, admin_chat_id, audience, "
+            "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                text,
+                RUNNING,
+                admin_chat_id,
+                jsonlib.dumps(audience) if audience else None,
+                now,
+                now,
+            ),
+        )
+        return BroadcastJob(
+            id=cursor.lastrowid,
+            text=text,
+            status=RUNNING,
+            admin_chat_id=admin_chat_id,
+            audience=audience,
+        )
+
+    def get_job(self, job_id: int) -> Optional[BroadcastJob]:
+        row = self._conn.execute(
+            "SELECT id, text, status, admin_chat_id, status_message_id, cursor, "
+            "sent, blocked, failed, audience FROM broadcast_jobs WHERE id = ?",
+            (job_id,),
+        ).fetchone()
+        return BroadcastJob.from_row(row) if row else None
+
+    def unfinished_jobs(self) -> List[BroadcastJob]:
+        """Running and paused jobs, oldest first"""
+        rows = self._conn.execute(
+            "SELECT id, text, status, admin_chat_id, status_message_id, cursor, "
+            "sent, blocked, failed, audience FROM broadcast_jobs "
+            "WHERE status IN (?, ?) ORDER BY id",
+            (RUNNING, PAUSED),
+        ).fetchall()
+        return [BroadcastJob.from_row(row) for row in rows]
+
+    def _update(self, job_id: int, **fields):
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        self._conn.execute(
+            f"UPDATE broadcast_jobs SET {assignments}, updated_at = ? WHERE id = ?",
+            (*fields.values(), time.time(), job_id),
+        )
+
+    def set_status(self, job_id: int, status: str):
+        self._update(job_id, status=status)
+
+    def set_status_message(self, job_id: int, message_id: int):
+        self._update(job_id, status_message_id=message_id)
+
+    def save(
+        self,
+        job_id: int,
+        outcomes: List[Tuple[int, str]],
+        cursor: Optional[int] = None,
+    ) -> Future:
+        """
+        Queue ``(chat_id, outcome)`` pairs, the counter updates and, if
+        given, a new cursor, to be written in one transaction on the
+        writer thread. Returns the write's Future; failures are logged.
+        """
+        for _, outcome in outcomes:
+            if outcome not in OUTCOMES:
+                raise ValueError(f"Unknown broadcast outcome {outcome!r}")
+        return self._executor.submit(self._save, job_id, outcomes, cursor)
+
+    def _save(self, job_id: int, outcomes: List[Tuple[int, str]], cursor):
+        fields = dict(Counter(outcome for _, outcome in outcomes))
+        assignments = [f"{outcome} = {outcome} + ?" for outcome in fields]
+        values = list(fields.values())
+        if cursor is not None:
+            assignments.append("cursor = ?")
+            values.append(cursor)
+        try:
+            self._writer.execute("BEGIN")
+            self._writer.executemany(
+                "INSERT OR REPLACE INTO broadcast_recipients (job_id, chat_id, outcome) "
+                "VALUES (?, ?, ?)",
+                [(job_id, chat_id, outcome) for chat_id, outcome in outcomes],
+            )
+            if assignments:
+                self._writer.execute(
+                    f"UPDATE broadcast_jobs SET {', '.join(assignments)}, "
+                    "updated_at = ? WHERE id = ?",
+                    (*values, time.time(), job_id),
+                )
+            self._writer.execute("COMMIT")
+        except sqlite3.Error as e:
+            if self._writer.in_transaction:
+                self._writer.execute("ROLLBACK")
+            logger.error(f"Failed to save broadcast {job_id} progress: {e}")
+
+    def record(self, job_id: int, chat_id: int, outcome: str):
+        """Store a recipient's outcome and bump the job's counter; blocks"""
+        self.save(job_id, [(chat_id, outcome)]).result()
+
+    async def completed(self, job_id: int) -> Set[int]:
+        """Chats that already have an outcome, read once when a job resumes"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._completed, job_id)
+
+    def _completed(self, job_id: int) -> Set[int]:
+        rows = self._writer.execute(
+            "SELECT chat_id FROM broadcast_recipients WHERE job_id = ?", (job_id,)
+        )
+        return {chat_id for (chat_id,) in rows}
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self._writer.close()
+        self._conn.close()
+
+
+def create_broadcast_store() -> BroadcastStore:
+    """Build the store at BROADCAST_STORE_PATH"""
+    return BroadcastStore(path=os.getenv("BROADCAST_STORE_PATH", "broadcasts.sqlite3"))
@@ -0,0 +1,140 @@
+# data/cache.py
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Seconds a catalog entry is served as fresh, per resource
+DEFAULT_CATALOG_TTLS = {
+    "mentors": int(os.getenv("CATALOG_TTL_MENTORS", 300)),
+    "webinars": int(os.getenv("CATALOG_TTL_WEBINARS", 120)),
+    "courses": int(os.getenv("CATALOG_TTL_COURSES", 300)),
+    "lessons": int(os.getenv("CATALOG_TTL_LESSONS", 300)),
+}
+
+
+class _CacheEntry:
+    __slots__ = ("value", "fresh_until", "stale_until")
+
+    def __init__(self, value: Any, fresh_until: float, stale_until: float):
+        self.value = value
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class CatalogCache:
+    """
+    Bounded read-through cache for public catalog resources.
+
+    Entries are fresh for the resource TTL. After that they are served
+    as stale for up to ``stale_ttl`` more seconds while a single
+    background task reloads them (stale-while-revalidate). Only
+    non-None loader results are cached, so failed requests are retried.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = int(os.getenv("CATALOG_CACHE_MAXSIZE", 512)),
+        ttls: Optional[Dict[str, int]] = None,
+        default_ttl: int = 60,
+        stale_ttl: int = int(os.getenv("CATALOG_STALE_TTL", 600)),
+    ):
+        self.maxsize = maxsize
+        self.ttls = {**DEFAULT_CATALOG_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self._entries: "OrderedDict[tuple, _CacheEntry]" = OrderedDict()
+        self._refreshing: Set[tuple] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.evictions = 0
+
+    def _ttl(self, resource: str) -> int:
+        return self.ttls.get(resource, self.default_ttl)
+
+    def _set(self, key: tuple, value: Any):
+        now = time.monotonic()
+        fresh_until = now + self._ttl(key[0])
+        self._entries[key] = _CacheEntry(
+            value, fresh_until, fresh_until + self.stale_ttl
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def _refresh(self, key: tuple, loader: Callable[[], Awaitable[Any]]):
+        try:
+            value = await loader()
+            if value is not None:
+                self._set(key, value)
+                self.refreshes += 1
+        except Exception as e:
+            logger.error(f"Background refresh failed for {key}: {e}")
+        finally:
+            self._refreshing.discard(key)
+
+    async def get_or_load(
+        self,
+        resource: str,
+        params: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Return the cached value for ``(resource, params)``, loading it on a miss.
+
+        Args:
+            resource: Catalog resource name, used to pick the TTL.
+            params: Hashable lookup parameters (e.g. a mentor or course ID).
+            loader: Coroutine factory fetching the value from the API.
+        """
+        key = (resource, params)
+        entry = self._entries.get(key)
+        now = time.monotonic()
+
+        if entry is not None:
+            if now < entry.fresh_until:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+            if now < entry.stale_until:
+                self.stale_hits += 1
+                self._entries.move_to_end(key)
+                if key not in self._refreshing:
+                    self._refreshing.add(key)
+                    task = asyncio.create_task(self._refresh(key, loader))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                return entry.value
+            del self._entries[key]
+
+        self.misses += 1
+        value = await loader()
+        if value is not None:
+            self._set(key, value)
+        return value
+
+    def invalidate(self, resource: Optional[str] = None):
+        """Drop all entries, or only those of one resource."""
+        if resource is None:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if k[0] == resource]:
+            del self._entries[key]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+        }
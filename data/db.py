@@ -1,10 +1,12 @@
 # datas/db.py
-from data.api_client import APIClient
+from data.api_client import get_api_client
 from typing import List, Dict, Optional
+from data.models import Mentor
 import logging
 
 logger = logging.getLogger(__name__)
-api_client = APIClient()
+# The process-wide client, so caches and tokens are shared with the bot
+api_client = get_api_client()
 
 async def fetch_mentors(telegram_id: int = None) -> List[str]:
     """
@@ -17,14 +19,13 @@ async def fetch_mentors(telegram_id: int = None) -> List[str]:
         List of mentor names
     """
     try:
-        api_client = APIClient()
-        mentors = await api_client.get_mentors()
-        return [mentor["name"] for mentor in mentors if mentor.get("name")]
+        mentors = await api_client.get_mentors(telegram_id=telegram_id)
+        return [mentor.name for mentor in mentors if mentor.name]
     except Exception as e:
         logger.error(f"Error fetching mentors: {e}")
         return []
 
-async def fetch_mentor_details(mentor_name: str) -> Optional[Dict]:
+async def fetch_mentor_details(mentor_name: str) -> Optional[Mentor]:
     """
     Fetches detailed information about a mentor by name.
     """
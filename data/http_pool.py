@@ -0,0 +1,97 @@
+# data/http_pool.py
+import logging
+import os
+from typing import Dict, Optional
+
+import aiohttp
+from dotenv import load_dotenv
+
+from data import jsonlib, tracing
+from data.metrics import get_metrics
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+
+class ConnectionPool:
+    """
+    Process-wide aiohttp session with a tuned, keep-alive connector.
+
+    All APIClient instances share it, so TCP/TLS connections to the API
+    are reused across handlers, filters and ``data/db.py`` helpers. The
+    session is created lazily and recreated if it was closed.
+    """
+
+    def __init__(
+        self,
+        limit: int = int(os.getenv("HTTP_POOL_LIMIT", 100)),
+        limit_per_host: int = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", 50)),
+        keepalive_timeout: float = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", 30)),
+        dns_ttl: int = int(os.getenv("HTTP_DNS_TTL", 300)),
+        connect_timeout: float = float(os.getenv("HTTP_CONNECT_TIMEOUT", 3)),
+        read_timeout: float = float(os.getenv("HTTP_READ_TIMEOUT", 10)),
+        total_timeout: float = float(os.getenv("HTTP_TOTAL_TIMEOUT", 15)),
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_ttl = dns_ttl
+        self.timeout = aiohttp.ClientTimeout(
+            total=total_timeout, connect=connect_timeout, sock_read=read_timeout
+        )
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._connector: Optional[aiohttp.TCPConnector] = None
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_ttl,
+                use_dns_cache=True,
+            )
+            # aiohttp advertises gzip (and br when brotli is installed)
+            # and transparently decodes compressed API responses
+            self._session = aiohttp.ClientSession(
+                connector=self._connector,
+                timeout=self.timeout,
+                auto_decompress=True,
+                json_serialize=jsonlib.dumps,
+                trace_configs=[get_metrics().trace_config(), tracing.trace_config()],
+            )
+            logger.info(
+                f"Opened HTTP pool (limit={self.limit}, per_host={self.limit_per_host})"
+            )
+        return self._session
+
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+            logger.info("Closed HTTP pool")
+
+    def stats(self) -> Dict[str, int]:
+        """Open, in-use, idle and waiting connection counts"""
+        connector = self._connector
+        if connector is None or connector.closed:
+            return {"open": 0, "in_use": 0, "idle": 0, "waiting": 0}
+        # aiohttp exposes no public pool counters, so read connector state
+        in_use = len(getattr(connector, "_acquired", ()))
+        idle = sum(len(conns) for conns in getattr(connector, "_conns", {}).values())
+        waiting = sum(
+            len(waiters) for waiters in getattr(connector, "_waiters", {}).values()
+        )
+        return {
+            "open": in_use + idle,
+            "in_use": in_use,
+            "idle": idle,
+            "waiting": waiting,
+        }
+
+
+_pool = ConnectionPool()
+
+
+def get_pool() -> ConnectionPool:
+    """Return the process-wide connection pool"""
+    return _pool
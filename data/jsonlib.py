@@ -0,0 +1,28 @@
+# data/jsonlib.py
+"""
+JSON backend for the bot's API traffic: orjson when installed, the stdlib
+``json`` module otherwise. Both produce the same Python objects.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data):
+    """Parse JSON from ``str`` or ``bytes``"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj) -> str:
+    """Serialize ``obj`` to a compact JSON string (aiohttp's json_serialize)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
@@ -0,0 +1,285 @@
+# data/metrics.py
+import bisect
+import logging
+import os
+import time
+from collections import Counter
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+from aiohttp import web
+from dotenv import load_dotenv
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Path prefix of the API (``/api`` for http://web:8000/api), stripped from
+# endpoint names
+API_PATH = urlsplit(os.getenv("TEST_API_URL", "")).path.rstrip("/")
+
+
+def endpoint_name(method: str, path: str) -> str:
+    """Logical endpoint, e.g. ``GET /courses/{id}/``"""
+    if API_PATH and path.startswith(API_PATH):
+        path = path[len(API_PATH) :]
+    segments = ["{id}" if seg.isdigit() else seg for seg in path.split("/")]
+    return f"{method.upper()} {'/'.join(segments)}"
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram; quantiles are interpolated within a bucket"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        lower = 0.0
+        for i, n in enumerate(self.counts):
+            upper = self.buckets[i] if i < len(self.buckets) else self.max
+            if n and cumulative + n >= rank:
+                estimate = lower + (upper - lower) * (rank - cumulative) / n
+                return min(estimate, self.max)
+            cumulative += n
+            lower = upper
+        return self.max
+
+
+def _label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class APIMetrics:
+    """
+    Per-endpoint request instrumentation for the API client.
+
+    Latency (time to response headers), status codes, transport errors and
+    request/response body bytes are recorded for every request sent through
+    the shared HTTP pool by ``trace_config``. Retries and token refreshes
+    are recorded by APIClient.
+    """
+
+    def __init__(self):
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self.statuses: Counter = Counter()  # (endpoint, status)
+        self.errors: Counter = Counter()  # (endpoint, exception name)
+        self.retries: Counter = Counter()  # endpoint
+        self.refreshes: Counter = Counter()  # outcome
+        self.bytes_sent: Counter = Counter()  # endpoint
+        self.bytes_received: Counter = Counter()  # endpoint
+
+    def observe(self, endpoint: str, seconds: float, status: Optional[int] = None):
+        if endpoint not in self.latency:
+            self.latency[endpoint] = LatencyHistogram()
+        self.latency[endpoint].observe(seconds)
+        if status is not None:
+            self.statuses[(endpoint, status)] += 1
+
+    def record_error(self, endpoint: str, seconds: float, error: BaseException):
+        self.observe(endpoint, seconds)
+        self.errors[(endpoint, type(error).__name__)] += 1
+
+    def record_retry(self, endpoint: str):
+        self.retries[endpoint] += 1
+
+    def record_refresh(self, outcome: str):
+        """``outcome`` is one of success, failure or reused"""
+        self.refreshes[outcome] += 1
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """aiohttp hooks that feed every request of a session into these metrics"""
+
+        async def on_request_start(session, ctx, params):
+            ctx.endpoint = endpoint_name(params.method, params.url.path)
+            ctx.started = time.perf_counter()
+            ctx.body_length_known = False
+
+        async def on_request_chunk_sent(session, ctx, params):
+            self.bytes_sent[ctx.endpoint] += len(params.chunk)
+
+        async def on_request_end(session, ctx, params):
+            elapsed = time.perf_counter() - ctx.started
+            self.observe(ctx.endpoint, elapsed, params.response.status)
+            # Content-Length is the on-the-wire (possibly compressed) size
+            if params.response.content_length is not None:
+                ctx.body_length_known = True
+                self.bytes_received[ctx.endpoint] += params.response.content_length
+
+        async def on_response_chunk_received(session, ctx, params):
+            if not ctx.body_length_known:
+                self.bytes_received[ctx.endpoint] += len(params.chunk)
+
+        async def on_request_exception(session, ctx, params):
+            elapsed = time.perf_counter() - ctx.started
+            self.record_error(ctx.endpoint, elapsed, params.exception)
+
+        config = aiohttp.TraceConfig()
+        config.on_request_start.append(on_request_start)
+        config.on_request_chunk_sent.append(on_request_chunk_sent)
+        config.on_request_end.append(on_request_end)
+        config.on_response_chunk_received.append(on_response_chunk_received)
+        config.on_request_exception.append(on_request_exception)
+        return config
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Per-endpoint counters and p50/p90/p99 latency in seconds"""
+        endpoints = {}
+        for endpoint, histogram in sorted(self.latency.items()):
+            endpoints[endpoint] = {
+                "count": histogram.count,
+                "mean": histogram.sum / histogram.count if histogram.count else 0.0,
+                "p50": histogram.quantile(0.5),
+                "p90": histogram.quantile(0.9),
+                "p99": histogram.quantile(0.99),
+                "max": histogram.max,
+                "statuses": {
+                    status: n
+                    for (name, status), n in self.statuses.items()
+                    if name == endpoint
+                },
+                "errors": {
+                    error: n
+                    for (name, error), n in self.errors.items()
+                    if name == endpoint
+                },
+                "retries": self.retries[endpoint],
+                "bytes_sent": self.bytes_sent[endpoint],
+                "bytes_received": self.bytes_received[endpoint],
+            }
+        return {"endpoints": endpoints, "token_refreshes": dict(self.refreshes)}
+
+    def to_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format"""
+        lines = [
+            "# HELP api_client_request_duration_seconds Time to response headers.",
+            "# TYPE api_client_request_duration_seconds histogram",
+        ]
+        for endpoint, histogram in sorted(self.latency.items()):
+            labels = f'endpoint="{_label(endpoint)}"'
+            cumulative = 0
+            for bound, n in zip(histogram.buckets, histogram.counts):
+                cumulative += n
+                lines.append(
+                    f"api_client_request_duration_seconds_bucket"
+                    f'{{{labels},le="{bound}"}} {cumulative}'
+                )
+            lines.append(
+                f"api_client_request_duration_seconds_bucket"
+                f'{{{labels},le="+Inf"}} {histogram.count}'
+            )
+            lines.append(
+                f"api_client_request_duration_seconds_sum{{{labels}}} {histogram.sum}"
+            )
+            lines.append(
+                f"api_client_request_duration_seconds_count{{{labels}}} {histogram.count}"
+            )
+
+        def counter(name: str, help_text: str, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for labels, value in samples:
+                rendered = ",".join(f'{k}="{_label(v)}"' for k, v in labels)
+                lines.append(f"{name}{{{rendered}}} {value}")
+
+        counter(
+            "api_client_responses_total",
+            "Responses by endpoint and HTTP status.",
+            (
+                ((("endpoint", e), ("status", s)), n)
+                for (e, s), n in sorted(self.statuses.items())
+            ),
+        )
+        counter(
+            "api_client_request_errors_total",
+            "Requests that failed without a response.",
+            (
+                ((("endpoint", e), ("error", err)), n)
+                for (e, err), n in sorted(self.errors.items())
+            ),
+        )
+        counter(
+            "api_client_retries_total",
+            "Retried requests.",
+            (((("endpoint", e),), n) for e, n in sorted(self.retries.items())),
+        )
+        counter(
+            "api_client_token_refreshes_total",
+            "Token refreshes by outcome.",
+            (((("outcome", o),), n) for o, n in sorted(self.refreshes.items())),
+        )
+        counter(
+            "api_client_request_bytes_total",
+            "Request body bytes sent.",
+            (((("endpoint", e),), n) for e, n in sorted(self.bytes_sent.items())),
+        )
+        counter(
+            "api_client_response_bytes_total",
+            "Response body bytes received.",
+            (((("endpoint", e),), n) for e, n in sorted(self.bytes_received.items())),
+        )
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """
+    Serve ``GET /metrics`` in Prometheus text format on ``port``.
+    Disabled when the port is 0 (the default).
+    """
+
+    def __init__(
+        self,
+        metrics: APIMetrics,
+        host: str = os.getenv("METRICS_HOST", "0.0.0.0"),
+        port: int = int(os.getenv("METRICS_PORT", 0)),
+    ):
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self._runner: Optional[web.AppRunner] = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        return web.Response(
+            text=self.metrics.to_prometheus(),
+            content_type="text/plain",
+            charset="utf-8",
+        )
+
+    async def start(self):
+        if not self.port or self._runner is not None:
+            return
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logger.info(f"Serving metrics on {self.host}:{self.port}/metrics")
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+_metrics = APIMetrics()
+
+
+def get_metrics() -> APIMetrics:
+    """Return the process-wide API metrics"""
+    return _metrics
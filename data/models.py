@@ -0,0 +1,124 @@
+# data/models.py
+"""
+Compact, read-only views of API payloads.
+
+Each model keeps only the fields the handlers use and is built with
+``from_api`` from the serializer output; everything else in the response
+(nested availability, quizzes, timestamps, ...) is dropped. Instances are
+shared through the catalog cache, so they are frozen.
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Iterable, List, Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class Mentor:
+    id: int
+    name: str
+    bio: Optional[str] = None
+    profile_picture_id: Optional[str] = None
+
+    @classmethod
+    def from_api(cls, data: dict) -> "Mentor":
+        return cls(
+            id=data["id"],
+            name=data.get("name") or "",
+            bio=data.get("bio"),
+            profile_picture_id=data.get("profile_picture_id"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Webinar:
+    id: int
+    title: str
+    mentor_id: Optional[int] = None
+    mentor_name: Optional[str] = None
+    video_telegram_id: Optional[str] = None
+
+    @classmethod
+    def from_api(cls, data: dict) -> "Webinar":
+        mentor = data.get("mentor_details") or {}
+        return cls(
+            id=data["id"],
+            title=data.get("title") or "",
+            mentor_id=data.get("mentor"),
+            mentor_name=mentor.get("name"),
+            video_telegram_id=data.get("video_telegram_id"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Lesson:
+    id: int
+    title: str
+    course_id: Optional[int] = None
+    content: Optional[str] = None
+    is_free: bool = False
+    telegram_video_id: Optional[str] = None
+
+    @classmethod
+    def from_api(cls, data: dict) -> "Lesson":
+        return cls(
+            id=data["id"],
+            title=data.get("title") or "",
+            course_id=data.get("course"),
+            content=data.get("content"),
+            is_free=bool(data.get("is_free")),
+            telegram_video_id=data.get("telegram_video_id"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Course:
+    id: int
+    title: str
+    mentor_id: Optional[int] = None
+    description: Optional[str] = None
+    price: Decimal = Decimal(0)
+    total_students: int = 0
+    lessons: Tuple[Lesson, ...] = ()
+
+    @classmethod
+    def from_api(cls, data: dict) -> "Course":
+        return cls(
+            id=data["id"],
+            title=data.get("title") or "",
+            mentor_id=data.get("mentor"),
+            description=data.get("description"),
+            price=Decimal(data.get("price") or 0),
+            total_students=data.get("total_students") or 0,
+            lessons=tuple(Lesson.from_api(item) for item in data.get("lessons", ())),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Student:
+    id: int
+    telegram_id: str
+    name: Optional[str] = None
+    phone_number: Optional[str] = None
+    language: Optional[str] = None
+    purchased_course_ids: Tuple[int, ...] = ()
+
+    @classmethod
+    def from_api(cls, data: dict) -> "Student":
+        return cls(
+            id=data["id"],
+            telegram_id=str(data["telegram_id"]),
+            name=data.get("name"),
+            phone_number=data.get("phone_number"),
+            language=data.get("language"),
+            purchased_course_ids=tuple(
+                course["id"] for course in data.get("purchased_courses", ())
+            ),
+        )
+
+
+def parse_many(model, items: Optional[Iterable[dict]]) -> Optional[List]:
+    """Parse a list response; None (a failed request) stays None"""
+    if items is None:
+        return None
+    return [model.from_api(item) for item in items]
@@ -0,0 +1,201 @@
+# data/rate_limit.py
+"""
+Per-key rate limiting with the generic cell rate algorithm (GCRA).
+
+GCRA is a token bucket that stores a single number per key, the
+"theoretical arrival time" of the next request, so every check is O(1) in
+time and memory no matter how many requests a user sends. Backends share
+one interface, ``await backend.hit(key, limit)``, which returns 0 when the
+request is allowed and otherwise the number of seconds to wait; a Redis
+or other networked backend only needs to implement that coroutine.
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from dotenv import load_dotenv
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    Allow ``limit`` requests per ``period`` seconds. Up to ``limit``
+    requests may arrive at once; after that one is allowed every
+    ``period / limit`` seconds.
+    """
+
+    limit: int
+    period: float
+
+    @property
+    def interval(self) -> float:
+        return self.period / self.limit
+
+    @property
+    def tolerance(self) -> float:
+        return self.period - self.interval
+
+    @classmethod
+    def parse(cls, spec: str) -> "RateLimit":
+        """Parse ``"5/10"`` as 5 requests per 10 seconds"""
+        limit, _, period = spec.partition("/")
+        return cls(int(limit), float(period or 1))
+
+    def apply(self, tat: Optional[float], now: float) -> Tuple[float, float]:
+        """
+        Return ``(new_tat, retry_after)`` for a request at ``now``. A
+        rejected request leaves the stored arrival time unchanged.
+        """
+        tat = max(tat or now, now)
+        retry_after = tat - self.tolerance - now
+        if retry_after > 0:
+            return tat, retry_after
+        return tat + self.interval, 0.0
+
+    def reserve(self, tat: Optional[float], now: float) -> Tuple[float, float]:
+        """
+        Like ``apply`` but always takes the next free slot: return
+        ``(new_tat, delay)`` where ``delay`` is how long the caller must
+        wait before using it.
+        """
+        tat = max(tat or now, now)
+        return tat + self.interval, max(0.0, tat - self.tolerance - now)
+
+
+class MemoryRateLimitBackend:
+    """
+    In-process GCRA state, LRU-bounded to ``maxsize`` keys. Only limits a
+    single bot process.
+    """
+
+    def __init__(self, maxsize: int = 100000):
+        self.maxsize = maxsize
+        self._tat: "OrderedDict[str, float]" = OrderedDict()
+
+    async def hit(self, key: str, limit: RateLimit) -> float:
+        now = time.monotonic()
+        tat, retry_after = limit.apply(self._tat.get(key), now)
+        self._tat[key] = tat
+        self._tat.move_to_end(key)
+        if len(self._tat) > self.maxsize:
+            self._tat.popitem(last=False)
+        return retry_after
+
+    def __len__(self) -> int:
+        return len(self._tat)
+
+
+class SQLiteRateLimitBackend:
+    """
+    GCRA state in a SQLite file, shared by every bot process on the host.
+
+    Each check is a single-row read and upsert inside an immediate
+    transaction, so concurrent processes cannot both spend the last slot.
+    Arrival times are wall-clock seconds so all processes agree on them.
+    Checks run on a dedicated thread, so waiting for another process's
+    lock never blocks the event loop.
+    """
+
+    def __init__(self, path: str = "ratelimit.sqlite3", sweep_interval: int = 300):
+        self.path = path
+        self.sweep_interval = sweep_interval
+        # One worker thread owns every use of the connection
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="rate-limit"
+        )
+        self._conn = sqlite3.connect(
+            path, isolation_level=None, timeout=1.0, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limits ("
+            "key TEXT PRIMARY KEY, tat REAL NOT NULL)"
+        )
+        self._last_sweep = 0.0
+
+    async def hit(self, key: str, limit: RateLimit) -> float:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._hit, key, limit)
+
+    def _hit(self, key: str, limit: RateLimit) -> float:
+        now = time.time()
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+            row = self._conn.execute(
+                "SELECT tat FROM rate_limits WHERE key = ?", (key,)
+            ).fetchone()
+            tat, retry_after = limit.apply(row[0] if row else None, now)
+            if not retry_after:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO rate_limits (key, tat) VALUES (?, ?)",
+                    (key, tat),
+                )
+            self._conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            # Fail open: a locked or broken file must not block the bot
+            logger.error(f"Rate limit check failed for {key}: {e}")
+            return 0.0
+        if now - self._last_sweep >= self.sweep_interval:
+            self.sweep(now)
+        return retry_after
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """Drop keys whose arrival time has passed; they carry no state"""
+        now = time.time() if now is None else now
+        self._last_sweep = now
+        cursor = self._conn.execute("DELETE FROM rate_limits WHERE tat <= ?", (now,))
+        return cursor.rowcount
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self._conn.close()
+
+
+# Limits by route. Every message counts against "message" and every callback
+# query against "callback"; handlers add a route with
+# ``flags={"rate_limit": ...}``.
+DEFAULT_LIMITS: Dict[str, RateLimit] = {
+    "message": RateLimit(5, 5),
+    "callback": RateLimit(10, 5),
+    "payment": RateLimit(3, 60),
+}
+
+
+def load_limits() -> Dict[str, RateLimit]:
+    """
+    DEFAULT_LIMITS updated from RATE_LIMITS, e.g.
+    ``RATE_LIMITS="message=5/5,callback=10/5,payment=3/60"``
+    """
+    limits = dict(DEFAULT_LIMITS)
+    for item in filter(None, os.getenv("RATE_LIMITS", "").split(",")):
+        route, _, spec = item.partition("=")
+        try:
+            limits[route.strip()] = RateLimit.parse(spec.strip())
+        except ValueError:
+            logger.error(f"Ignoring invalid rate limit {item!r}")
+    return limits
+
+
+def create_rate_limit_backend():
+    """Build the backend selected by the RATE_LIMIT_BACKEND env var"""
+    backend = os.getenv("RATE_LIMIT_BACKEND", "memory")
+    if backend == "sqlite":
+        try:
+            return SQLiteRateLimitBackend(
+                path=os.getenv("RATE_LIMIT_PATH", "ratelimit.sqlite3")
+            )
+        except sqlite3.Error as e:
+            logger.error(f"Falling back to in-memory rate limits: {e}")
+    return MemoryRateLimitBackend(maxsize=int(os.getenv("RATE_LIMIT_MAXSIZE", 100000)))
@@ -0,0 +1,93 @@
+# data/resilience.py
+import os
+import random
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class RetryableError(Exception):
+    """A request failed in a way that may succeed if retried (timeout, 5xx)"""
+
+
+class RequestFailedError(Exception):
+    """A request failed for good: retries used up, circuit open or a bad response"""
+
+
+class RetryPolicy:
+    """Bounded retries with exponential backoff and full jitter"""
+
+    def __init__(
+        self,
+        max_attempts: int = int(os.getenv("API_RETRY_ATTEMPTS", 3)),
+        base_delay: float = float(os.getenv("API_RETRY_BASE_DELAY", 0.2)),
+        max_delay: float = float(os.getenv("API_RETRY_MAX_DELAY", 2.0)),
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int) -> float:
+        """Sleep before retry number ``attempt`` (0-based)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests fail fast. Once ``reset_timeout`` seconds have passed a single
+    half-open probe is let through: success closes the circuit, failure
+    opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = int(os.getenv("API_BREAKER_THRESHOLD", 5)),
+        reset_timeout: float = float(os.getenv("API_BREAKER_RESET_TIMEOUT", 30)),
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def allow_request(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            self._probe_in_flight = False
+        if self._probe_in_flight:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def release(self):
+        """
+        End a call without an outcome, e.g. when it was cancelled, so a
+        half-open circuit lets the next probe through
+        """
+        self._probe_in_flight = False
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._probe_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
@@ -0,0 +1,123 @@
+# data/token_renewal.py
+import asyncio
+import logging
+import os
+import random
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+
+class TokenRenewalScheduler:
+    """
+    Renew tokens of recently active users shortly before they expire.
+
+    Every ``interval`` seconds (plus jitter) the scheduler picks users
+    active within ``active_window`` whose token expires within
+    ``renew_before`` seconds (but has not expired yet) and refreshes them
+    with bounded concurrency.
+    At most ``max_per_minute`` renewals are started per rolling minute,
+    so user-facing requests rarely hit a 401 + refresh + retry.
+    """
+
+    def __init__(
+        self,
+        api_client,
+        interval: float = float(os.getenv("TOKEN_RENEW_INTERVAL", 60)),
+        renew_before: float = float(os.getenv("TOKEN_RENEW_BEFORE", 1800)),
+        active_window: float = float(os.getenv("TOKEN_RENEW_ACTIVE_WINDOW", 86400)),
+        concurrency: int = int(os.getenv("TOKEN_RENEW_CONCURRENCY", 5)),
+        max_per_minute: int = int(os.getenv("TOKEN_RENEW_MAX_PER_MINUTE", 120)),
+        jitter: float = 5.0,
+    ):
+        self.api_client = api_client
+        self.interval = interval
+        self.renew_before = renew_before
+        self.active_window = active_window
+        self.concurrency = concurrency
+        self.max_per_minute = max_per_minute
+        self.jitter = jitter
+        self._recent_renewals: deque = deque()
+        self._task: Optional[asyncio.Task] = None
+        self.renewed = 0
+        self.failed = 0
+        self.deferred = 0
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info("Token renewal scheduler started")
+
+    async def stop(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            logger.info("Token renewal scheduler stopped")
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval + random.uniform(0, self.jitter))
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Token renewal pass failed: {e}")
+
+    def _budget(self) -> int:
+        """Renewals still allowed in the current rolling minute"""
+        cutoff = time.monotonic() - 60
+        while self._recent_renewals and self._recent_renewals[0] < cutoff:
+            self._recent_renewals.popleft()
+        return max(0, self.max_per_minute - len(self._recent_renewals))
+
+    async def run_once(self) -> int:
+        """Run a single renewal pass and return the number of tokens renewed"""
+        now = time.time()
+        deadline = now + self.renew_before
+        due = []
+        for telegram_id in self.api_client.recently_active_users(self.active_window):
+            expires_at = await self.api_client.token_expires_at(telegram_id)
+            # Already expired tokens are left to the store's sweep; the user
+            # authenticates again on their next update
+            if expires_at is not None and now < expires_at <= deadline:
+                due.append((expires_at, telegram_id))
+        if not due:
+            return 0
+
+        # Soonest-expiring first; the rest wait for the next pass
+        due.sort()
+        budget = self._budget()
+        self.deferred += max(0, len(due) - budget)
+        due = due[:budget]
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def renew(telegram_id) -> bool:
+            await asyncio.sleep(random.uniform(0, self.jitter))
+            async with semaphore:
+                self._recent_renewals.append(time.monotonic())
+                return await self.api_client.refresh_token(telegram_id)
+
+        results = await asyncio.gather(
+            *(renew(telegram_id) for _, telegram_id in due), return_exceptions=True
+        )
+        renewed = sum(1 for result in results if result is True)
+        self.renewed += renewed
+        self.failed += len(results) - renewed
+        if renewed:
+            logger.info(f"Proactively renewed {renewed} tokens")
+        return renewed
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "renewed": self.renewed,
+            "failed": self.failed,
+            "deferred": self.deferred,
+        }
@@ -0,0 +1,196 @@
+# data/token_store.py
+import asyncio
+import logging
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from dotenv import load_dotenv
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+
+class MemoryTokenStore:
+    """
+    In-process LRU store of auth tokens with a size cap.
+
+    Expiry times are wall-clock epoch seconds so they stay meaningful
+    when persisted. Expired tokens are dropped on read and by a sweep
+    that runs at most once per ``sweep_interval`` seconds on write.
+    The public methods are coroutines so a store may do I/O.
+    """
+
+    def __init__(self, maxsize: int = 10000, sweep_interval: int = 300):
+        self.maxsize = maxsize
+        self.sweep_interval = sweep_interval
+        self._tokens: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._last_sweep = time.time()
+
+    async def get(self, telegram_id) -> Optional[str]:
+        return self._get(telegram_id)
+
+    async def set(self, telegram_id, token: str, expires_at: float):
+        self._set(telegram_id, token, expires_at)
+
+    async def delete(self, telegram_id):
+        self._delete(telegram_id)
+
+    async def expires_at(self, telegram_id) -> Optional[float]:
+        return self._expires_at(telegram_id)
+
+    def _get(self, telegram_id) -> Optional[str]:
+        key = str(telegram_id)
+        entry = self._tokens.get(key)
+        if entry is None:
+            return None
+        token, expires_at = entry
+        if time.time() >= expires_at:
+            logger.debug(f"Token expired for user {telegram_id}")
+            self._delete(telegram_id)
+            return None
+        self._tokens.move_to_end(key)
+        return token
+
+    def _set(self, telegram_id, token: str, expires_at: float):
+        key = str(telegram_id)
+        self._tokens[key] = (token, expires_at)
+        self._tokens.move_to_end(key)
+        while len(self._tokens) > self.maxsize:
+            self._tokens.popitem(last=False)
+        self._maybe_sweep()
+
+    def _delete(self, telegram_id):
+        self._tokens.pop(str(telegram_id), None)
+
+    def _expires_at(self, telegram_id) -> Optional[float]:
+        entry = self._tokens.get(str(telegram_id))
+        return entry[1] if entry else None
+
+    def sweep(self) -> int:
+        """Remove expired tokens and return how many were dropped"""
+        now = time.time()
+        expired = [k for k, (_, exp) in self._tokens.items() if now >= exp]
+        for key in expired:
+            del self._tokens[key]
+        self._last_sweep = now
+        return len(expired)
+
+    def _maybe_sweep(self):
+        if time.time() - self._last_sweep >= self.sweep_interval:
+            removed = self.sweep()
+            if removed:
+                logger.debug(f"Swept {removed} expired tokens")
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+
+class SQLiteTokenStore(MemoryTokenStore):
+    """
+    Token store persisted to a local SQLite file.
+
+    The in-memory LRU stays in front for hot reads; misses fall through
+    to the file, so tokens issued before a restart are reused instead of
+    re-authenticating every active user. File access runs on a dedicated
+    thread, so a slow disk never blocks the event loop.
+    """
+
+    def __init__(
+        self,
+        path: str = "tokens.sqlite3",
+        maxsize: int = 10000,
+        sweep_interval: int = 300,
+    ):
+        super().__init__(maxsize=maxsize, sweep_interval=sweep_interval)
+        self.path = path
+        # One worker thread owns every use of the connection
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="token-store"
+        )
+        self._conn = sqlite3.connect(
+            path, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tokens ("
+            "telegram_id TEXT PRIMARY KEY, token TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._sweep_file()
+
+    async def _run(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    async def get(self, telegram_id) -> Optional[str]:
+        token = self._get(telegram_id)
+        if token is not None:
+            return token
+        row = await self._run(self._select, str(telegram_id))
+        if row is None:
+            return None
+        token, expires_at = row
+        if time.time() >= expires_at:
+            await self.delete(telegram_id)
+            return None
+        super()._set(telegram_id, token, expires_at)
+        return token
+
+    async def set(self, telegram_id, token: str, expires_at: float):
+        super()._set(telegram_id, token, expires_at)
+        await self._run(self._write, str(telegram_id), token, expires_at)
+
+    async def delete(self, telegram_id):
+        super()._delete(telegram_id)
+        await self._run(self._remove, str(telegram_id))
+
+    async def expires_at(self, telegram_id) -> Optional[float]:
+        if (expires_at := self._expires_at(telegram_id)) is not None:
+            return expires_at
+        row = await self._run(self._select, str(telegram_id))
+        return row[1] if row else None
+
+    def sweep(self) -> int:
+        removed = super().sweep()
+        # Runs in the background; the in-memory sweep is what callers see
+        self._executor.submit(self._sweep_file)
+        return removed
+
+    def _select(self, key: str) -> Optional[Tuple[str, float]]:
+        return self._conn.execute(
+            "SELECT token, expires_at FROM tokens WHERE telegram_id = ?", (key,)
+        ).fetchone()
+
+    def _write(self, key: str, token: str, expires_at: float):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO tokens (telegram_id, token, expires_at) VALUES (?, ?, ?)",
+            (key, token, expires_at),
+        )
+
+    def _remove(self, key: str):
+        self._conn.execute("DELETE FROM tokens WHERE telegram_id = ?", (key,))
+
+    def _sweep_file(self):
+        self._conn.execute("DELETE FROM tokens WHERE expires_at <= ?", (time.time(),))
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self._conn.close()
+
+
+def create_token_store() -> MemoryTokenStore:
+    """Build the token store selected by the TOKEN_STORE env var"""
+    backend = os.getenv("TOKEN_STORE", "sqlite")
+    maxsize = int(os.getenv("TOKEN_STORE_MAXSIZE", 10000))
+    if backend == "memory":
+        return MemoryTokenStore(maxsize=maxsize)
+    try:
+        return SQLiteTokenStore(
+            path=os.getenv("TOKEN_STORE_PATH", "tokens.sqlite3"), maxsize=maxsize
+        )
+    except sqlite3.Error as e:
+        logger.error(f"Falling back to in-memory token store: {e}")
+        return MemoryTokenStore(maxsize=maxsize)
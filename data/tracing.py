@@ -0,0 +1,153 @@
+# data/tracing.py
+"""
+Per-handler latency tracing.
+
+TracingMiddleware opens a HandlerTrace for every update and keeps it in a
+context variable, so code further down the same task (the shared HTTP
+pool, the Bot session) can charge its I/O time to the handler without
+being passed anything. API and Bot API time are measured as the time at
+least one request of that kind was in flight, so concurrent requests are
+not counted twice and the shares never exceed the handler's wall time.
+"""
+
+import os
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Deque, Dict, Optional, Tuple
+
+import aiohttp
+from dotenv import load_dotenv
+
+load_dotenv()
+
+API = "api"
+BOT = "bot"
+
+_current: ContextVar[Optional["HandlerTrace"]] = ContextVar(
+    "handler_trace", default=None
+)
+
+
+class HandlerTrace:
+    __slots__ = ("handler", "started", "finished", "busy", "_inflight", "_since")
+
+    def __init__(self):
+        self.handler: Optional[str] = None
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+        self.busy = {API: 0.0, BOT: 0.0}
+        self._inflight = {API: 0, BOT: 0}
+        self._since = {API: 0.0, BOT: 0.0}
+
+    def begin(self, kind: str):
+        if not self._inflight[kind]:
+            self._since[kind] = time.perf_counter()
+        self._inflight[kind] += 1
+
+    def end(self, kind: str):
+        self._inflight[kind] -= 1
+        if not self._inflight[kind]:
+            self.busy[kind] += time.perf_counter() - self._since[kind]
+
+    def finish(self) -> float:
+        self.finished = time.perf_counter()
+        # Requests still running (e.g. shielded cache loads) count up to now
+        for kind, inflight in self._inflight.items():
+            if inflight:
+                self.busy[kind] += self.finished - self._since[kind]
+                self._since[kind] = self.finished
+        return self.wall
+
+    @property
+    def wall(self) -> float:
+        return (self.finished or time.perf_counter()) - self.started
+
+
+def current_trace() -> Optional[HandlerTrace]:
+    return _current.get()
+
+
+def start_trace() -> Tuple[HandlerTrace, object]:
+    """Open a trace for the current task; pass the token to ``end_trace``"""
+    trace = HandlerTrace()
+    return trace, _current.set(trace)
+
+
+def end_trace(token):
+    _current.reset(token)
+
+
+def _percentile(ordered, q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class HandlerStats:
+    """
+    Rolling per-handler samples of (wall, API, Bot API) seconds. Each
+    handler keeps its last ``window`` updates; percentiles are computed
+    from those on demand.
+    """
+
+    def __init__(self, window: int = int(os.getenv("HANDLER_STATS_WINDOW", 1000))):
+        self.window = window
+        self._samples: Dict[str, Deque[Tuple[float, float, float]]] = {}
+        self.counts: Dict[str, int] = {}
+
+    def record(self, trace: HandlerTrace):
+        name = trace.handler or "unhandled"
+        samples = self._samples.get(name)
+        if samples is None:
+            samples = self._samples[name] = deque(maxlen=self.window)
+            self.counts[name] = 0
+        samples.append((trace.wall, trace.busy[API], trace.busy[BOT]))
+        self.counts[name] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Per handler: total count, p50/p90/p99 wall time and I/O shares"""
+        result = {}
+        for name, samples in self._samples.items():
+            walls = sorted(sample[0] for sample in samples)
+            total = sum(walls) or 1.0
+            result[name] = {
+                "count": self.counts[name],
+                "p50": _percentile(walls, 0.5),
+                "p90": _percentile(walls, 0.9),
+                "p99": _percentile(walls, 0.99),
+                "api_share": sum(sample[1] for sample in samples) / total,
+                "bot_share": sum(sample[2] for sample in samples) / total,
+            }
+        return result
+
+    def reset(self):
+        self._samples.clear()
+        self.counts.clear()
+
+
+def trace_config() -> aiohttp.TraceConfig:
+    """aiohttp hooks that charge backend requests to the current handler"""
+
+    async def on_request_start(session, ctx, params):
+        ctx.handler_trace = current_trace()
+        if ctx.handler_trace is not None:
+            ctx.handler_trace.begin(API)
+
+    async def on_request_done(session, ctx, params):
+        if ctx.handler_trace is not None:
+            ctx.handler_trace.end(API)
+
+    config = aiohttp.TraceConfig()
+    config.on_request_start.append(on_request_start)
+    config.on_request_end.append(on_request_done)
+    config.on_request_exception.append(on_request_done)
+    return config
+
+
+_stats = HandlerStats()
+
+
+def get_handler_stats() -> HandlerStats:
+    """Return the process-wide handler stats"""
+    return _stats
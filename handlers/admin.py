@@ -1,12 +1,27 @@
 import asyncio
 import logging
-from aiogram import Bot, types, Router, F
+from typing import Dict, Optional
+from aiogram import Bot, types, Router, F, html
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message, CallbackQuery
 from data.api_client import APIClient
+from data.tracing import get_handler_stats
 from aiogram.fsm.state import State, StatesGroup
 from loader import bot, i18n
+from data.broadcast_store import (
+    CANCELLED,
+    RUNNING,
+    BroadcastJob,
+    BroadcastStore,
+    create_broadcast_store,
+)
+from keyboards.broadcast_keyboard import (
+    audience_course_keyboard,
+    audience_keyboard,
+    broadcast_control_keyboard,
+)
+from utils.broadcast import Broadcast, audience_from_choice, describe_audience
 from config import ADMIN_IDS
 
 # Setup logger
@@ -19,100 +34,233 @@ ADMIN_IDS = [int(id) for id in ADMIN_IDS.split(",")]
 
 # State for broadcast
 class BroadcastState(StatesGroup):
+    CHOOSING_AUDIENCE = State()
     WAITING_FOR_MESSAGE = State()
 
 
-# Get all users from the database
-async def get_users(api_client: APIClient):
-    """
-    Return a list of all users from the database.
-    """
-    try:
-        users = await api_client.get_all_users()
-        return [user["telegram_id"] for user in users]
-    except Exception as e:
-        logger.error(f"Error fetching users: {e}")
-        return []
+# Broadcasts running in this process, by job id, and their tasks
+_active: Dict[int, Broadcast] = {}
+_tasks: set = set()
+_store: Optional[BroadcastStore] = None
 
 
-# Safe message sender
-async def send_message(
-    user_id: int, text: str, disable_notification: bool = False
-) -> bool:
-    """
-    Safely send a message to a user.
+def get_broadcast_store() -> BroadcastStore:
+    global _store
+    if _store is None:
+        _store = create_broadcast_store()
+    return _store
 
-    Args:
-        user_id: The user's Telegram ID.
-        text: The message text.
-        disable_notification: Whether to disable notifications.
 
-    Returns:
-        True if the message was sent successfully, otherwise False.
-    """
+def broadcast_status(job_id: int, broadcast: Broadcast) -> str:
+    if broadcast.cancelled:
+        state = "cancelled"
+    elif broadcast.paused:
+        state = "paused"
+    elif broadcast.finished:
+        state = "completed"
+    else:
+        state = "running"
+    return (
+        f"Broadcast #{job_id} to {describe_audience(broadcast.job.audience)} "
+        f"{state}. {broadcast.processed} processed: {broadcast.summary()}"
+    )
+
+
+async def update_broadcast_status(broadcast: Broadcast, final: bool = False):
+    """Edit the admin's status message; drop the buttons once finished."""
+    job = broadcast.job
+    if job.status_message_id is None:
+        return
+    await bot.edit_message_text(
+        broadcast_status(job.id, broadcast),
+        chat_id=job.admin_chat_id,
+        message_id=job.status_message_id,
+        reply_markup=(
+            None if final else broadcast_control_keyboard(job.id, broadcast.paused)
+        ),
+    )
+
+
+async def run_broadcast(broadcast: Broadcast):
+    """Run a broadcast job, keeping the admin's status message up to date."""
+    job = broadcast.job
+    reported = -1
+
+    async def report(progress: Broadcast):
+        nonlocal reported
+        # Telegram rejects edits that don't change the text
+        if progress.processed == reported:
+            return
+        reported = progress.processed
+        await update_broadcast_status(progress)
+
     try:
-        await bot.send_message(user_id, text, disable_notification=disable_notification)
-        logger.info(f"Target [ID:{user_id}]: success")
-        return True
+        await broadcast.run(on_progress=report)
+        await update_broadcast_status(broadcast, final=True)
+        outcome = "cancelled" if broadcast.cancelled else "completed"
+        await bot.send_message(
+            job.admin_chat_id, f"Broadcast {outcome}. {broadcast.summary()}"
+        )
+    except asyncio.CancelledError:
+        # Shutting down: the job stays resumable from its checkpoint
+        raise
     except Exception as e:
-        logger.error(f"Target [ID:{user_id}]: failed - {e}")
-        return False
+        logger.error(f"Error during broadcast #{job.id}: {e}")
+        if broadcast.error is None:
+            await bot.send_message(
+                job.admin_chat_id,
+                f"An error occurred during the broadcast. {broadcast.summary()}",
+            )
+            return
+        # The recipients could not be fetched; the job is paused, not done
+        try:
+            await update_broadcast_status(broadcast)
+        except Exception as status_error:
+            logger.debug(f"Broadcast #{job.id} status not updated: {status_error}")
+        reason = html.quote(str(e))
+        await bot.send_message(
+            job.admin_chat_id,
+            f"Broadcast #{job.id} failed: could not fetch recipients ({reason}). "
+            f"It is paused at its last checkpoint; press Resume to continue. "
+            f"{broadcast.summary()}",
+        )
+    finally:
+        _active.pop(job.id, None)
 
 
-# Broadcast handler
-async def broadcast_message(text: str, api_client: APIClient) -> int:
-    """
-    Broadcast a message to all users.
+def start_broadcast(job: BroadcastJob, api_client: APIClient) -> Broadcast:
+    """Start (or continue from its checkpoint) a job in the background."""
+    broadcast = Broadcast(
+        bot,
+        api_client.iter_users(after=job.cursor, audience=job.audience),
+        job.text,
+        job=job,
+        store=get_broadcast_store(),
+    )
+    _active[job.id] = broadcast
+    task = asyncio.create_task(run_broadcast(broadcast))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return broadcast
 
-    Args:
-        text: The message to broadcast.
-        api_client: The API client to fetch users.
 
-    Returns:
-        The number of messages successfully sent.
+async def resume_broadcasts(api_client: APIClient):
     """
-    count = 0
-    try:
-        for user_id in await get_users(api_client):
-            if await send_message(user_id, text):
-                count += 1
-            await asyncio.sleep(
-                0.05
-            )  # 20 messages per second (Limit: 30 messages per second)
-    finally:
-        logger.info(f"{count} messages successfully sent.")
-    return count
+    Continue the jobs that were running when the bot stopped. Paused jobs
+    wait for an admin to press Resume on their status message.
+    """
+    for job in get_broadcast_store().unfinished_jobs():
+        if job.status != RUNNING or job.id in _active:
+            continue
+        logger.info(f"Resuming broadcast #{job.id} after student {job.cursor}")
+        start_broadcast(job, api_client)
+        try:
+            await bot.send_message(
+                job.admin_chat_id,
+                f"Broadcast #{job.id} resumed after a restart "
+                f"({job.sent + job.blocked + job.failed} already processed).",
+            )
+        except Exception as e:
+            logger.error(f"Failed to notify admin about broadcast #{job.id}: {e}")
 
 
 # /broadcast command
-@router.message(Command("broadcast"))
+@router.message(Command("broadcast"), flags={"auth": False})
 async def command_broadcast(message: Message, state: FSMContext):
-    """Start the broadcast process."""
+    """Start the broadcast process by picking its audience."""
     # Check if the user is an admin
     if message.from_user.id not in ADMIN_IDS:
         await message.answer("You are not authorized to use this command.")
         return
 
-    # Ask the admin for the broadcast message
-    await message.answer("What do you want to broadcast to users?")
+    if _active or get_broadcast_store().unfinished_jobs():
+        await message.answer(
+            "A broadcast is already running or paused. "
+            "Resume or cancel it from its status message first."
+        )
+        return
+
+    # Ask the admin who should receive the broadcast
+    await message.answer(
+        "Who should receive the broadcast?", reply_markup=audience_keyboard()
+    )
+    await state.set_state(BroadcastState.CHOOSING_AUDIENCE)
+
+
+# Handle the audience picker
+@router.callback_query(
+    BroadcastState.CHOOSING_AUDIENCE,
+    F.data.startswith("audience_"),
+    flags={"auth": False},
+)
+async def process_broadcast_audience(
+    callback: CallbackQuery, state: FSMContext, api_client: APIClient
+):
+    """Store the chosen audience and ask for the broadcast message."""
+    if callback.from_user.id not in ADMIN_IDS:
+        await callback.answer("You are not authorized to do this.", show_alert=True)
+        return
+
+    choice = callback.data.removeprefix("audience_")
+    if choice == "course":
+        courses = await api_client.get_courses()
+        if not courses:
+            await callback.answer("No courses found.", show_alert=True)
+            return
+        await callback.message.edit_text(
+            "Buyers of which course?",
+            reply_markup=audience_course_keyboard(courses),
+        )
+        await callback.answer()
+        return
+
+    audience = audience_from_choice(choice)
+    if audience is None:
+        await callback.answer("Unknown audience.", show_alert=True)
+        return
+
+    # The server filters and counts; nothing is pulled into the bot
+    count = await api_client.count_audience(audience)
+    if count == 0:
+        await callback.answer("No students match this audience.", show_alert=True)
+        return
+
+    await state.update_data(audience=audience)
     await state.set_state(BroadcastState.WAITING_FOR_MESSAGE)
+    size = "an unknown number of" if count is None else count
+    await callback.message.edit_text(
+        f"Audience: {describe_audience(audience)} ({size} students).\n"
+        "What do you want to broadcast to them?"
+    )
+    await callback.answer()
 
 
 # Handle broadcast message
-@router.message(BroadcastState.WAITING_FOR_MESSAGE)
+@router.message(BroadcastState.WAITING_FOR_MESSAGE, flags={"auth": False})
 async def process_broadcast_message(
     message: Message, state: FSMContext, api_client: APIClient
 ):
-    """Process the broadcast message and send it to all users."""
+    """Create a broadcast job and start sending it in the background."""
     try:
-        # Get the broadcast message
-        broadcast_text = message.text
+        store = get_broadcast_store()
+        if _active or store.unfinished_jobs():
+            await message.answer(
+                "A broadcast is already running or paused. "
+                "Resume or cancel it from its status message first."
+            )
+            return
 
-        # Broadcast the message
-        count = await broadcast_message(broadcast_text, api_client)
+        audience = (await state.get_data()).get("audience")
+        job = store.create_job(message.text, message.chat.id, audience)
+        status = await message.answer(
+            f"Broadcast #{job.id} started...",
+            reply_markup=broadcast_control_keyboard(job.id),
+        )
+        store.set_status_message(job.id, status.message_id)
+        job.status_message_id = status.message_id
 
-        # Notify the admin
-        await message.answer(f"Broadcast completed. {count} messages sent.")
+        # Run in the background so the admin's handler returns right away
+        start_broadcast(job, api_client)
     except Exception as e:
         logger.error(f"Error during broadcast: {e}")
         await message.answer("An error occurred during the broadcast.")
@@ -121,6 +269,82 @@ async def process_broadcast_message(
         await state.clear()
 
 
+# Pause, resume or cancel a broadcast from its status message
+@router.callback_query(F.data.startswith("broadcast_"), flags={"auth": False})
+async def handle_broadcast_control(callback: CallbackQuery, api_client: APIClient):
+    """Handle the buttons under a broadcast's status message."""
+    if callback.from_user.id not in ADMIN_IDS:
+        await callback.answer("You are not authorized to do this.", show_alert=True)
+        return
+
+    _, action, job_id = callback.data.split("_")
+    job_id = int(job_id)
+    store = get_broadcast_store()
+    job = store.get_job(job_id)
+    if job is None or job.finished:
+        await callback.answer("This broadcast has already finished.")
+        return
+
+    broadcast = _active.get(job_id)
+    if action == "pause" and broadcast is not None:
+        broadcast.pause()
+    elif action == "resume":
+        if broadcast is not None:
+            broadcast.resume()
+        else:
+            # Paused before a restart: continue from the checkpoint
+            store.set_status(job_id, RUNNING)
+            job.status = RUNNING
+            broadcast = start_broadcast(job, api_client)
+    elif action == "cancel":
+        if broadcast is not None:
+            broadcast.cancel()
+        else:
+            store.set_status(job_id, CANCELLED)
+            await callback.message.edit_reply_markup(reply_markup=None)
+            await callback.answer("Broadcast cancelled.")
+            return
+
+    await callback.answer(f"Broadcast #{job_id}: {action}")
+    if broadcast is not None and not broadcast.cancelled:
+        try:
+            await update_broadcast_status(broadcast)
+        except Exception as e:
+            logger.debug(f"Broadcast #{job_id} status not updated: {e}")
+
+
+def format_handler_stats(snapshot: dict, limit: int = 20) -> str:
+    """Render handler stats, slowest p90 first, as a monospace table."""
+    rows = sorted(snapshot.items(), key=lambda item: item[1]["p90"], reverse=True)
+    lines = [
+        f"{'handler':32} {'n':>6} {'p50':>6} {'p90':>6} {'p99':>6} {'api':>4} {'bot':>4}"
+    ]
+    for name, stats in rows[:limit]:
+        lines.append(
+            f"{name[:32]:32} {stats['count']:>6}"
+            f" {stats['p50'] * 1000:>6.0f} {stats['p90'] * 1000:>6.0f}"
+            f" {stats['p99'] * 1000:>6.0f}"
+            f" {stats['api_share']:>4.0%} {stats['bot_share']:>4.0%}"
+        )
+    return "\n".join(lines)
+
+
+# /stats command
+@router.message(Command("stats"), flags={"auth": False})
+async def command_stats(message: Message):
+    """Show per-handler latency percentiles (ms) and API/Bot API time shares."""
+    if message.from_user.id not in ADMIN_IDS:
+        await message.answer("You are not authorized to use this command.")
+        return
+
+    snapshot = get_handler_stats().snapshot()
+    if not snapshot:
+        await message.answer("No handler stats yet.")
+        return
+    table = html.quote(format_handler_stats(snapshot))
+    await message.answer(f"<pre>{table}</pre>")
+
+
 # Handle payment confirmation
 @router.callback_query(lambda c: c.data.startswith("confirm_payment_"))
 async def handle_payment_confirmation(callback: CallbackQuery, api_client: APIClient):
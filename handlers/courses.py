@@ -17,7 +17,7 @@ logger = logging.getLogger(__name__)
 router = Router()
 
 
-@router.message(F.text.in_(["📚 Courses", "📚 Kurslar"]))
+@router.message(F.text.in_(["📚 Courses", "📚 Kurslar"]), flags={"auth": False})
 async def list_courses(message: Message, state: FSMContext, api_client: APIClient):
     """Display available courses in a keyboard"""
     await message.answer(i18n.get_text(message.from_user.id, "coming_soon"),
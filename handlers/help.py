@@ -6,7 +6,7 @@ from aiogram.filters import Command
 router = Router()
 
 
-@router.message(Command("help"))
+@router.message(Command("help"), flags={"auth": False})
 async def send_help(message: Message):
     await message.answer("This is the help message!")
 
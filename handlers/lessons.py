@@ -17,7 +17,7 @@ logger = logging.getLogger(__name__)
 router = Router()
 
 
-@router.message(F.text.in_(["📖 Lessons", "📖 Darslar"]))
+@router.message(F.text.in_(["📖 Lessons", "📖 Darslar"]), flags={"auth": False})
 async def list_lessons(message: Message, state: FSMContext, api_client: APIClient):
     """Display available lessons in a keyboard"""
     try:
@@ -52,7 +52,7 @@ async def list_lessons(message: Message, state: FSMContext, api_client: APIClien
         await message.answer(i18n.get_text(message.from_user.id, "error_occurred"))
 
 
-@router.message(F.text.startswith("📖"))
+@router.message(F.text.startswith("📖"), flags={"auth": False})
 async def handle_lesson_selection(message: Message, state: FSMContext, api_client: APIClient):
     """Handle lesson selection and display details"""
     try:
@@ -72,7 +72,7 @@ async def handle_lesson_selection(message: Message, state: FSMContext, api_clien
 
         # Find the selected lesson
         selected_lesson = next(
-            (lesson for lesson in lessons if lesson["title"] == lesson_title),
+            (lesson for lesson in lessons if lesson.title == lesson_title),
             None,
         )
 
@@ -82,8 +82,8 @@ async def handle_lesson_selection(message: Message, state: FSMContext, api_clien
 
         # Display lesson details
         lesson_details = (
-            f"📖 *{selected_lesson['title']}*\n"
-            f"📝 {i18n.get_text(message.from_user.id, 'content')}: {selected_lesson.get('content', i18n.get_text(message.from_user.id, 'no_content_available'))}"
+            f"📖 *{selected_lesson.title}*\n"
+            f"📝 {i18n.get_text(message.from_user.id, 'content')}: {selected_lesson.content or i18n.get_text(message.from_user.id, 'no_content_available')}"
         )
 
         await message.answer(
@@ -97,7 +97,9 @@ async def handle_lesson_selection(message: Message, state: FSMContext, api_clien
         await message.answer(i18n.get_text(message.from_user.id, "error_occurred"))
 
 
-@router.message(F.text.in_(["⬅️ Darslarga qaytish", "⬅️ Back to Lessons"]))
+@router.message(
+    F.text.in_(["⬅️ Darslarga qaytish", "⬅️ Back to Lessons"]), flags={"auth": False}
+)
 async def handle_back_to_lessons(message: Message, state: FSMContext, api_client: APIClient):
     """Handle the back button and return to the lesson list"""
     await list_lessons(message, state, api_client)
\ No newline at end of file
@@ -17,7 +17,7 @@ logger = logging.getLogger(__name__)
 router = Router()
 
 
-@router.message(F.text.in_(["🧑‍🏫 Mentors", "🧑‍🏫 Mentorlar"]))
+@router.message(F.text.in_(["🧑‍🏫 Mentors", "🧑‍🏫 Mentorlar"]), flags={"auth": False})
 async def list_mentors(message: Message, state: FSMContext, api_client: APIClient):
     """Display available mentors in a keyboard"""
     try:
@@ -44,7 +44,7 @@ async def list_mentors(message: Message, state: FSMContext, api_client: APIClien
         await message.answer(i18n.get_text(message.from_user.id, "error_occurred"))
 
 
-@router.message(F.text.startswith("👤"))
+@router.message(F.text.startswith("👤"), flags={"auth": False})
 async def handle_mentor_selection(
     message: Message, state: FSMContext, api_client: APIClient
 ):
@@ -54,14 +54,9 @@ async def handle_mentor_selection(
         mentor_name = message.text.replace("👤 ", "").strip()
         logger.info(f"User Selected mentor: {mentor_name}")
 
-        # Fetch mentors from the API
-        mentors = await api_client.get_mentors(telegram_id=message.from_user.id)
-        # logger.info(f"Mentors: {mentors}")
-
-        # Find the selected mentor
-        selected_mentor = next(
-            (mentor for mentor in mentors if mentor["name"] == mentor_name),
-            None,
+        # Resolve the mentor through the cached name index
+        selected_mentor = await api_client.get_mentor_by_name(
+            mentor_name, telegram_id=message.from_user.id
         )
         # logger.info(f"Selected mentor: {selected_mentor}")
 
@@ -73,11 +68,11 @@ async def handle_mentor_selection(
 
         # Display mentor details using HTML formatting
         mentor_details = (
-            f"👤 <b>{selected_mentor['name']}</b>\n"
-            f"📝 {i18n.get_text(message.from_user.id, 'bio')}: {selected_mentor.get('bio', i18n.get_text(message.from_user.id, 'no_bio_available'))}\n"
+            f"👤 <b>{selected_mentor.name}</b>\n"
+            f"📝 {i18n.get_text(message.from_user.id, 'bio')}: {selected_mentor.bio or i18n.get_text(message.from_user.id, 'no_bio_available')}\n"
         )
 
-        mentor_photo_id = selected_mentor.get("profile_picture_id")
+        mentor_photo_id = selected_mentor.profile_picture_id
         if mentor_photo_id:
             await message.answer_photo(
                 photo=mentor_photo_id,
@@ -99,7 +94,9 @@ async def handle_mentor_selection(
         await message.answer(i18n.get_text(message.from_user.id, "error_occurred"))
 
 
-@router.message(F.text.in_(["ℹ️ Loyiha haqida", "ℹ️ About Project"]))
+@router.message(
+    F.text.in_(["ℹ️ Loyiha haqida", "ℹ️ About Project"]), flags={"auth": False}
+)
 async def handle_about_project(message: Message):
     """Handle the about project button"""
     await message.answer(
@@ -108,7 +105,9 @@ async def handle_about_project(message: Message):
     )
 
 
-@router.message(F.text.in_(["⬅️ Mentorlarga qaytish", "⬅️ Back to Mentors"]))
+@router.message(
+    F.text.in_(["⬅️ Mentorlarga qaytish", "⬅️ Back to Mentors"]), flags={"auth": False}
+)
 async def handle_back_to_mentors(
     message: Message, state: FSMContext, api_client: APIClient
 ):
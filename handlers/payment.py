@@ -17,7 +17,9 @@ logger = logging.getLogger(__name__)
 router = Router()
 
 
-@router.message(F.text.in_(["💳 Payment", "💳 To'lov"]))
+@router.message(
+    F.text.in_(["💳 Payment", "💳 To'lov"]), flags={"rate_limit": "payment"}
+)
 async def initiate_payment(message: Message, state: FSMContext, api_client: APIClient):
     """Initiate payment flow"""
     try:
@@ -21,7 +21,7 @@ logger = logging.getLogger(__name__)
 router = Router()
 
 
-@router.message(RegistrationStates.NAME)
+@router.message(RegistrationStates.NAME, flags={"auth": False})
 async def process_name(message: Message, state: FSMContext, api_client: APIClient):
     """Process the user's name and ask for their contact information."""
     try:
@@ -49,7 +49,7 @@ async def process_name(message: Message, state: FSMContext, api_client: APIClien
         await message.answer(i18n.get_text(message.from_user.id, "error_occurred"))
 
 
-@router.message(RegistrationStates.CONTACT)
+@router.message(RegistrationStates.CONTACT, flags={"auth": False})
 async def process_contact(message: Message, state: FSMContext, api_client: APIClient):
     """Process the user's contact information and save it to the database."""
     try:
@@ -100,13 +100,22 @@ async def process_contact(message: Message, state: FSMContext, api_client: APICl
             "name": name,
             "phone_number": formatted_phone,
         }
+        # Chosen before the student existed, so bootstrap could not store it
+        language = i18n.user_languages.get(message.from_user.id)
+        if language:
+            user_data["language"] = language
         # logger.info(f"Saving user data: {user_data}")
 
-        # Check if the user already exists
-        student = await api_client.get_student_by_telegram_id(str(message.from_user.id))
-        if student:
+        # Check if the user already exists (known from language selection)
+        student_id = state_data.get("student_id")
+        if not student_id:
+            student = await api_client.get_student_by_telegram_id(
+                str(message.from_user.id)
+            )
+            student_id = student.id if student else None
+        if student_id:
             # Update existing user
-            success = await api_client.update_student(student["id"], user_data)
+            success = await api_client.update_student(student_id, user_data)
         else:
             # Create new user
             success = await api_client.create_user(user_data)
@@ -39,7 +39,7 @@ def get_language_kb() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
-@router.message(Command("start"))
+@router.message(Command("start"), flags={"auth": False})
 async def command_start(
     message: Message, state: FSMContext, api_client: APIClient
 ) -> None:
@@ -48,10 +48,15 @@ async def command_start(
         # Clear any existing states
         await state.clear()
 
-        # Check if the user is already registered
-        student = await api_client.get_student_by_telegram_id(str(user_id))
+        # Profile, token and language in a single request. A language
+        # picked in this session wins over the stored one (and is saved).
+        bootstrap = await api_client.bootstrap(
+            user_id, language=i18n.user_languages.get(user_id)
+        )
+        student = bootstrap.get("student") if bootstrap else None
         logger.info(f"Student: {student}")
         if student:
+            i18n.set_user_language(user_id, student.language)
             # If the user is already registered, skip registration
             await message.answer(
                 i18n.get_text(user_id, "welcome_back"),
@@ -70,7 +75,7 @@ async def command_start(
         await message.answer("⚠️ An error occurred. Please try again later.")
 
 
-@router.callback_query(F.data.startswith("lang_"))
+@router.callback_query(F.data.startswith("lang_"), flags={"auth": False})
 async def handle_language_selection(
     callback: CallbackQuery, state: FSMContext, api_client: APIClient
 ) -> None:
@@ -92,12 +97,14 @@ async def handle_language_selection(
         # Edit message with new language confirmation
         await callback.message.edit_text(welcome_text, reply_markup=None)
 
-        # Check if the user is already registered
-        student = await api_client.get_student_by_telegram_id(str(user_id))
+        # Check if the user is already registered and store the language
+        bootstrap = await api_client.bootstrap(user_id, language=language)
+        student = bootstrap.get("student") if bootstrap else None
         if student:
             # Check if all required fields are present
-            if not student.get("name") or not student.get("contact"):
+            if not student.name or not student.phone_number:
                 # If any information is missing, start re-registration
+                await state.update_data(student_id=student.id)
                 await state.set_state(RegistrationStates.NAME)
                 await callback.message.answer(
                     i18n.get_text(user_id, "ask_name"),
@@ -105,9 +112,9 @@ async def handle_language_selection(
                 )
             else:
                 # Store auth data in state
-                token = api_client._get_cached_token(user_id)
+                token = await api_client._get_cached_token(user_id)
                 await state.update_data(
-                    user_id=user_id, student_id=student["id"], auth_token=token
+                    user_id=user_id, student_id=student.id, auth_token=token
                 )
 
                 # Send menu keyboard in a new message
@@ -127,7 +134,7 @@ async def handle_language_selection(
         await callback.message.answer("An error occurred. Please try again.")
 
 
-@router.message(Command("language"))
+@router.message(Command("language"), flags={"auth": False})
 async def command_language(message: Message, state: FSMContext) -> None:
     """Handle /language command"""
     try:
@@ -146,7 +153,7 @@ async def command_language(message: Message, state: FSMContext) -> None:
         await message.answer("An error occurred. Please try again.")
 
 
-@router.message(Command("help"))
+@router.message(Command("help"), flags={"auth": False})
 async def command_help(message: Message) -> None:
     """Handle /help command"""
     try:
@@ -157,7 +164,7 @@ async def command_help(message: Message) -> None:
         await message.answer("An error occurred. Please try again.")
 
 
-@router.message(Command("image"))
+@router.message(Command("image"), flags={"auth": False})
 async def command_image(message: Message, state: FSMContext) -> None:
     """Handle /image command"""
     try:
@@ -168,7 +175,7 @@ async def command_image(message: Message, state: FSMContext) -> None:
         await message.answer("⚠️ An error occurred. Please try again.")
 
 
-@router.message(MediaState.waiting_for_photo, F.photo)
+@router.message(MediaState.waiting_for_photo, F.photo, flags={"auth": False})
 async def handle_photo(message: Message, state: FSMContext) -> None:
     """Handle received photo"""
     try:
@@ -188,7 +195,7 @@ async def handle_photo(message: Message, state: FSMContext) -> None:
         await state.clear()
 
 
-@router.message(Command("video"))
+@router.message(Command("video"), flags={"auth": False})
 async def command_video(message: Message, state: FSMContext) -> None:
     """Handle /video command"""
     try:
@@ -199,7 +206,7 @@ async def command_video(message: Message, state: FSMContext) -> None:
         await message.answer("⚠️ An error occurred. Please try again.")
 
 
-@router.message(MediaState.waiting_for_video, F.video)
+@router.message(MediaState.waiting_for_video, F.video, flags={"auth": False})
 async def handle_video(message: Message, state: FSMContext) -> None:
     """Handle received video"""
     try:
@@ -219,7 +226,7 @@ async def handle_video(message: Message, state: FSMContext) -> None:
         await state.clear()
 
 
-@router.message(Command("test"))
+@router.message(Command("test"), flags={"auth": False})
 async def command_test(message: Message) -> None:
     """Handle /test command"""
     try:
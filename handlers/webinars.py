@@ -15,7 +15,7 @@ logger = logging.getLogger(__name__)
 router = Router()
 
 
-@router.message(F.text.in_(["📂 Webinars", "📂 Vebinarlar"]))
+@router.message(F.text.in_(["📂 Webinars", "📂 Vebinarlar"]), flags={"auth": False})
 async def list_webinars(message: Message, state: FSMContext, api_client: APIClient):
     """Display available webinars in a keyboard"""
     try:
@@ -42,7 +42,7 @@ async def list_webinars(message: Message, state: FSMContext, api_client: APIClie
         await message.answer("⚠️ An error occurred. Please try again later.")
 
 
-@router.message(F.text.startswith("📅"))
+@router.message(F.text.startswith("📅"), flags={"auth": False})
 async def handle_webinar_selection(
     message: Message, state: FSMContext, api_client: APIClient
 ):
@@ -56,7 +56,7 @@ async def handle_webinar_selection(
 
         # Find the selected webinar
         selected_webinar = next(
-            (webinar for webinar in webinars if webinar["title"] == webinar_title),
+            (webinar for webinar in webinars if webinar.title == webinar_title),
             None,
         )
 
@@ -66,11 +66,11 @@ async def handle_webinar_selection(
 
         # Display webinar details
         webinar_details = (
-            f"📅 *{selected_webinar['title']}*\n"
-            f"🧑‍🏫 {i18n.get_text(message.from_user.id, 'mentor')}: {selected_webinar['mentor_details']['name']}\n"
+            f"📅 *{selected_webinar.title}*\n"
+            f"🧑‍🏫 {i18n.get_text(message.from_user.id, 'mentor')}: {selected_webinar.mentor_name}\n"
             
         )
-        webinar_video_id = selected_webinar.get("video_telegram_id")
+        webinar_video_id = selected_webinar.video_telegram_id
         logger.info(f"Webinar details: {webinar_video_id}")
 
         if webinar_video_id:
@@ -92,7 +92,10 @@ async def handle_webinar_selection(
         await message.answer("⚠️ An error occurred. Please try again.")
 
 
-@router.message(F.text.in_(["⬅️ Asosiy menyuga qaytish", "⬅️ Back to Main Menu"]))
+@router.message(
+    F.text.in_(["⬅️ Asosiy menyuga qaytish", "⬅️ Back to Main Menu"]),
+    flags={"auth": False},
+)
 async def handle_back_to_menu(message: Message, state: FSMContext):
     """Handle the back button and return to the main menu"""
     from keyboards.menu import menu_keyboard
@@ -103,7 +106,10 @@ async def handle_back_to_menu(message: Message, state: FSMContext):
     )
 
 
-@router.message(F.text.in_(["⬅️ Vebinarlarga qaytish", "⬅️ Back to Webinars"]))
+@router.message(
+    F.text.in_(["⬅️ Vebinarlarga qaytish", "⬅️ Back to Webinars"]),
+    flags={"auth": False},
+)
 async def handle_back_to_webinars(
     message: Message, state: FSMContext, api_client: APIClient
 ):
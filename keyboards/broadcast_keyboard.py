@@ -0,0 +1,78 @@
+# keyboards/broadcast_keyboard.py
+from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
+
+
+def broadcast_control_keyboard(job_id: int, paused: bool = False):
+    """Create pause/resume and cancel buttons for a running broadcast"""
+    toggle = (
+        InlineKeyboardButton(
+            text="▶️ Resume", callback_data=f"broadcast_resume_{job_id}"
+        )
+        if paused
+        else InlineKeyboardButton(
+            text="⏸ Pause", callback_data=f"broadcast_pause_{job_id}"
+        )
+    )
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                toggle,
+                InlineKeyboardButton(
+                    text="❌ Cancel", callback_data=f"broadcast_cancel_{job_id}"
+                ),
+            ]
+        ]
+    )
+
+
+def audience_keyboard():
+    """Create the audience (segment) picker for a new broadcast"""
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                InlineKeyboardButton(
+                    text="👥 All students", callback_data="audience_all"
+                )
+            ],
+            [
+                InlineKeyboardButton(
+                    text="🇺🇿 O'zbek", callback_data="audience_lang_uz"
+                ),
+                InlineKeyboardButton(
+                    text="🇬🇧 English", callback_data="audience_lang_en"
+                ),
+            ],
+            [
+                InlineKeyboardButton(
+                    text="🎓 Buyers of a course", callback_data="audience_course"
+                )
+            ],
+            [
+                InlineKeyboardButton(
+                    text="⏳ Pending payments", callback_data="audience_pending"
+                )
+            ],
+            [
+                InlineKeyboardButton(
+                    text="🆕 Joined in 7 days", callback_data="audience_new_7"
+                ),
+                InlineKeyboardButton(
+                    text="🆕 Joined in 30 days", callback_data="audience_new_30"
+                ),
+            ],
+        ]
+    )
+
+
+def audience_course_keyboard(courses):
+    """Create one button per course for picking its buyers"""
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                InlineKeyboardButton(
+                    text=course.title, callback_data=f"audience_course_{course.id}"
+                )
+            ]
+            for course in courses
+        ]
+    )
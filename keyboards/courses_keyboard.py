@@ -1,18 +1,19 @@
 # keyboards/courses_keyboard.py
 from aiogram.types import ReplyKeyboardMarkup, KeyboardButton
-from typing import List, Dict
+from typing import List
+from data.models import Course
 from loader import i18n
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-def create_courses_keyboard(courses: List[Dict], user_id: int) -> ReplyKeyboardMarkup:
+def create_courses_keyboard(courses: List[Course], user_id: int) -> ReplyKeyboardMarkup:
     """
     Create a keyboard with course titles.
 
     Args:
-        courses: List of course dictionaries containing 'title' and 'id'.
+        courses: List of Course models.
         user_id: Telegram user ID for localization.
 
     Returns:
@@ -20,7 +21,7 @@ def create_courses_keyboard(courses: List[Dict], user_id: int) -> ReplyKeyboardM
     """
     try:
         # Create buttons for each course with an emoji
-        buttons = [[KeyboardButton(text=f"📚 {course['title']}")] for course in courses]
+        buttons = [[KeyboardButton(text=f"📚 {course.title}")] for course in courses]
 
         # Add a back button
         buttons.append(
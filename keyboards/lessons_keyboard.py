@@ -12,7 +12,7 @@ async def create_lessons_keyboard(
     Create keyboard with lesson titles
 
     Args:
-        lessons: List of lesson dictionaries
+        lessons: List of Lesson models
         user_id: Telegram user ID for i18n
         has_purchased: Whether user has purchased the course
     """
@@ -20,11 +20,11 @@ async def create_lessons_keyboard(
 
     # Add lesson buttons
     for lesson in lessons:
-        if lesson["is_free"] or has_purchased:
-            indicator = "🆓 " if lesson["is_free"] else "📖 "
+        if lesson.is_free or has_purchased:
+            indicator = "🆓 " if lesson.is_free else "📖 "
         else:
             indicator = "🔒 "
-        buttons.append([KeyboardButton(text=f"{indicator}{lesson['title']}")])
+        buttons.append([KeyboardButton(text=f"{indicator}{lesson.title}")])
 
     # Add navigation buttons
     buttons.extend(
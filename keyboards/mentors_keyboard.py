@@ -1,18 +1,19 @@
 # keyboards/mentors_keyboard.py
 from aiogram.types import ReplyKeyboardMarkup, KeyboardButton
-from typing import List, Dict
+from typing import List
+from data.models import Mentor
 from loader import i18n
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-def create_mentor_keyboard(mentors: List[Dict], user_id: int) -> ReplyKeyboardMarkup:
+def create_mentor_keyboard(mentors: List[Mentor], user_id: int) -> ReplyKeyboardMarkup:
     """
     Create a keyboard with mentor names.
 
     Args:
-        mentors: List of mentor dictionaries containing 'name' and 'id'.
+        mentors: List of Mentor models.
         user_id: Telegram user ID for localization.
 
     Returns:
@@ -22,9 +23,9 @@ def create_mentor_keyboard(mentors: List[Dict], user_id: int) -> ReplyKeyboardMa
         # Create pairs of mentor buttons
         buttons = []
         for i in range(0, len(mentors), 2):
-            row = [KeyboardButton(text=f"👤 {mentors[i]['name']}")]
+            row = [KeyboardButton(text=f"👤 {mentors[i].name}")]
             if i + 1 < len(mentors):  # Check if there's a second mentor for the row
-                row.append(KeyboardButton(text=f"👤 {mentors[i + 1]['name']}"))
+                row.append(KeyboardButton(text=f"👤 {mentors[i + 1].name}"))
             buttons.append(row)
 
         # Add a back button
@@ -1,18 +1,19 @@
 # keyboards/webinar_keyboard.py
 from aiogram.types import ReplyKeyboardMarkup, KeyboardButton
-from typing import List, Dict
+from typing import List
+from data.models import Webinar
 from loader import i18n
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-def create_webinar_keyboard(webinars: List[Dict], user_id: int) -> ReplyKeyboardMarkup:
+def create_webinar_keyboard(webinars: List[Webinar], user_id: int) -> ReplyKeyboardMarkup:
     """
     Create a keyboard with webinar titles.
 
     Args:
-        webinars: List of webinar dictionaries containing 'title' and 'id'.
+        webinars: List of Webinar models.
         user_id: Telegram user ID for localization.
 
     Returns:
@@ -21,7 +22,7 @@ def create_webinar_keyboard(webinars: List[Dict], user_id: int) -> ReplyKeyboard
     try:
         # Create buttons for each webinar
         buttons = [
-            [KeyboardButton(text=f"📅 {webinar['title']}")] for webinar in webinars
+            [KeyboardButton(text=f"📅 {webinar.title}")] for webinar in webinars
         ]
 
         # Add a back button
@@ -1,7 +1,13 @@
-from aiogram import Dispatcher
-from loader import dp
+from .auth import AuthMiddleware
+from .rate_governor import TelegramRateGovernor
 from .throttling import ThrottlingMiddleware
+from .tracing import BotAPITimer, HandlerLabelMiddleware, TracingMiddleware
 
-if __name__ == "middlewares":
-    # New way to setup middleware in aiogram 3.x
-    dp.message.middleware(ThrottlingMiddleware())
\ No newline at end of file
+__all__ = [
+    "AuthMiddleware",
+    "BotAPITimer",
+    "HandlerLabelMiddleware",
+    "TelegramRateGovernor",
+    "ThrottlingMiddleware",
+    "TracingMiddleware",
+]
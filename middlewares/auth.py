@@ -1,15 +1,37 @@
+import os
 from typing import Any, Callable, Dict, Awaitable
 from aiogram import BaseMiddleware
+from aiogram.dispatcher.flags import get_flag
 from aiogram.types import Message, CallbackQuery
-from aiogram.filters import Command
+from cachetools import TTLCache
 import logging
 
 logger = logging.getLogger(__name__)
 
 
 class AuthMiddleware(BaseMiddleware):
-    def __init__(self, api_client):
+    """
+    Make sure the user has a backend token before handlers that need one.
+
+    Handlers that only touch public catalog endpoints or local state opt
+    out with ``flags={"auth": False}`` and skip authentication entirely.
+    Users whose authentication failed are remembered for
+    ``failure_ttl`` seconds and rejected without calling the backend,
+    unless a token has been cached for them since (e.g. by /start).
+    """
+
+    def __init__(
+        self,
+        api_client,
+        failure_ttl: float = float(os.getenv("AUTH_FAILURE_TTL", 30)),
+        max_failures: int = 10000,
+    ):
         self.api_client = api_client
+        self._failed = TTLCache(maxsize=max_failures, ttl=failure_ttl)
+        self.skipped = 0
+        self.negative_hits = 0
+        self.authenticated = 0
+        self.failed = 0
         super().__init__()
 
     async def __call__(
@@ -18,33 +40,34 @@ class AuthMiddleware(BaseMiddleware):
         event: Message | CallbackQuery,
         data: Dict[str, Any],
     ) -> Any:
-        # Skip auth for /start and /broadcast commands
-        if isinstance(event, Message) and event.text:
-            if event.text.startswith("/start") or event.text.startswith("/broadcast"):
-                data["api_client"] = self.api_client  # Add api_client to data
-                return await handler(event, data)
+        data["api_client"] = self.api_client
+
+        if not get_flag(data, "auth", default=True):
+            self.skipped += 1
+            return await handler(event, data)
 
         try:
             user_id = event.from_user.id
 
+            if user_id in self._failed:
+                if not await self.api_client.has_token(user_id):
+                    self.negative_hits += 1
+                    await self._reject(event)
+                    return
+                self._failed.pop(user_id, None)
+
             # Ensure the user is authenticated
             authenticated = await self.api_client.ensure_authenticated(
                 telegram_id=user_id, name=event.from_user.full_name
             )
 
             if not authenticated:
-                if isinstance(event, Message):
-                    await event.answer(
-                        "⚠️ Authentication failed. Please try /start again."
-                    )
-                else:
-                    await event.message.answer(
-                        "⚠️ Authentication failed. Please try /start again."
-                    )
+                self.failed += 1
+                self._failed[user_id] = True
+                await self._reject(event)
                 return
 
-            # Add api_client to handler data
-            data["api_client"] = self.api_client
+            self.authenticated += 1
             return await handler(event, data)
         except Exception as e:
             logger.error(f"Auth middleware error: {e}")
@@ -54,3 +77,19 @@ class AuthMiddleware(BaseMiddleware):
                 await event.message.answer(
                     "Authentication error. Please try /start again."
                 )
+
+    @staticmethod
+    async def _reject(event: Message | CallbackQuery):
+        text = "⚠️ Authentication failed. Please try /start again."
+        if isinstance(event, Message):
+            await event.answer(text)
+        else:
+            await event.message.answer(text)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "skipped": self.skipped,
+            "authenticated": self.authenticated,
+            "failed": self.failed,
+            "negative_hits": self.negative_hits,
+        }
@@ -0,0 +1,192 @@
+# middlewares/rate_governor.py
+import asyncio
+import contextlib
+import heapq
+import itertools
+import logging
+import os
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Dict, List, Optional, Tuple
+
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware
+from aiogram.exceptions import TelegramRetryAfter
+from dotenv import load_dotenv
+
+from data.rate_limit import RateLimit
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Bot API methods that deliver or change messages and count against
+# Telegram's flood limits; everything else (answerCallbackQuery, getMe,
+# setMyCommands, ...) passes straight through.
+GOVERNED_PREFIXES = ("Send", "Copy", "Forward", "Edit")
+
+
+class Priority(IntEnum):
+    """Lower values are released first"""
+
+    INTERACTIVE = 0
+    BULK = 10
+
+
+_priority: ContextVar[Priority] = ContextVar(
+    "telegram_priority", default=Priority.INTERACTIVE
+)
+
+
+@contextlib.contextmanager
+def bulk():
+    """Send Bot API calls made inside the block with bulk priority"""
+    token = _priority.set(Priority.BULK)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class TelegramRateGovernor(BaseRequestMiddleware):
+    """
+    Bot session middleware that paces outbound messages to stay inside
+    Telegram's limits instead of tripping flood control.
+
+    Every governed call first waits for a slot in its chat's budget
+    (``chat_limit`` for private chats, ``group_limit`` for groups), then
+    queues for the global budget of ``global_rate`` messages per second,
+    where interactive calls are released ahead of bulk ones (see
+    ``bulk``). A waiting chat never holds up other chats. When Telegram
+    still answers with RetryAfter, the chat is paused for the requested
+    time, bulk traffic is held back for the same period (Telegram does not
+    say which limit was hit) and an interactive call is retried up to
+    ``max_retries`` times. Bulk calls are not retried here: the RetryAfter
+    is raised straight away so the sender (e.g. ``Broadcast``) owns the
+    retry and each flood-control answer is attempted and counted once.
+    """
+
+    def __init__(
+        self,
+        global_rate: float = float(os.getenv("TELEGRAM_GLOBAL_RATE", 30)),
+        chat_limit: RateLimit = RateLimit.parse(
+            os.getenv("TELEGRAM_CHAT_LIMIT", "3/3")
+        ),
+        group_limit: RateLimit = RateLimit.parse(
+            os.getenv("TELEGRAM_GROUP_LIMIT", "20/60")
+        ),
+        max_retries: int = int(os.getenv("TELEGRAM_MAX_RETRIES", 3)),
+        max_chats: int = 100000,
+    ):
+        # No burst allowance: a burst on top of the rate would exceed it
+        self.global_limit = RateLimit(1, 1 / global_rate)
+        self.chat_limit = chat_limit
+        self.group_limit = group_limit
+        self.max_retries = max_retries
+        self.max_chats = max_chats
+        self._chat_tat: "OrderedDict[int, float]" = OrderedDict()
+        self._global_tat: Optional[float] = None
+        self._bulk_paused_until = 0.0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._changed = asyncio.Event()
+        self._pump_task: Optional[asyncio.Task] = None
+        self.sent = 0
+        self.retry_after = 0
+        self.waited = 0.0
+
+    async def __call__(self, make_request, bot, method):
+        chat_id = getattr(method, "chat_id", None)
+        if chat_id is None or not type(method).__name__.startswith(GOVERNED_PREFIXES):
+            return await make_request(bot, method)
+
+        priority = _priority.get()
+        max_retries = self.max_retries if priority < Priority.BULK else 0
+        attempt = 0
+        while True:
+            started = time.monotonic()
+            await self._acquire_chat(chat_id)
+            await self._acquire_global(priority)
+            self.waited += time.monotonic() - started
+            try:
+                response = await make_request(bot, method)
+                self.sent += 1
+                return response
+            except TelegramRetryAfter as e:
+                self.retry_after += 1
+                attempt += 1
+                self._pause(chat_id, e.retry_after)
+                if attempt > max_retries:
+                    raise
+                logger.warning(
+                    f"Flood control in chat {chat_id}, retrying in {e.retry_after}s "
+                    f"(attempt {attempt}/{max_retries})"
+                )
+
+    def _chat_budget(self, chat_id) -> RateLimit:
+        # Group and channel IDs are negative (or @usernames for channels)
+        if isinstance(chat_id, str) or chat_id < 0:
+            return self.group_limit
+        return self.chat_limit
+
+    async def _acquire_chat(self, chat_id):
+        now = time.monotonic()
+        tat, delay = self._chat_budget(chat_id).reserve(
+            self._chat_tat.get(chat_id), now
+        )
+        self._chat_tat[chat_id] = tat
+        self._chat_tat.move_to_end(chat_id)
+        if len(self._chat_tat) > self.max_chats:
+            self._chat_tat.popitem(last=False)
+        if delay:
+            await asyncio.sleep(delay)
+
+    async def _acquire_global(self, priority: Priority):
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        if self._pump_task is None:
+            self._pump_task = asyncio.create_task(self._pump())
+        else:
+            self._changed.set()
+        await future
+
+    async def _pump(self):
+        """Release queued calls one global slot at a time, by priority"""
+        try:
+            while self._waiters:
+                priority, _, future = self._waiters[0]
+                if future.done():  # caller was cancelled
+                    heapq.heappop(self._waiters)
+                    continue
+                now = time.monotonic()
+                wait = 0.0
+                if priority >= Priority.BULK:
+                    wait = self._bulk_paused_until - now
+                if wait <= 0:
+                    tat, wait = self.global_limit.apply(self._global_tat, now)
+                    if not wait:
+                        self._global_tat = tat
+                        heapq.heappop(self._waiters)
+                        future.set_result(None)
+                        continue
+                # Sleep until the slot frees up or a new call is queued
+                self._changed.clear()
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._changed.wait(), wait)
+        finally:
+            self._pump_task = None
+
+    def _pause(self, chat_id, seconds: float):
+        until = time.monotonic() + seconds
+        # Shift by the burst tolerance so the next reserve waits until ``until``
+        tat = until + self._chat_budget(chat_id).tolerance
+        self._chat_tat[chat_id] = max(self._chat_tat.get(chat_id, 0.0), tat)
+        self._bulk_paused_until = max(self._bulk_paused_until, until)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "sent": self.sent,
+            "retry_after": self.retry_after,
+            "waited": self.waited,
+            "queued": len(self._waiters),
+        }
@@ -1,36 +1,100 @@
 # middlewares/throttling.py
-from typing import Any, Callable, Dict
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
 from aiogram import BaseMiddleware
-from aiogram.types import Message
+from aiogram.dispatcher.flags import get_flag
+from aiogram.types import CallbackQuery, Message
 from cachetools import TTLCache
-import time
+
+from data.rate_limit import RateLimit, create_rate_limit_backend, load_limits
+
+logger = logging.getLogger(__name__)
 
 
 class ThrottlingMiddleware(BaseMiddleware):
-    def __init__(self, rate_limit: float = 0.5, max_requests: int = 3) -> None:
-        self.cache = TTLCache(maxsize=10000, ttl=rate_limit)
-        self.max_requests = max_requests
+    """
+    Rate-limit users before filters, auth or handlers run.
+
+    Register it as an outer middleware on both ``dp.message`` and
+    ``dp.callback_query``: outer middlewares run before filters, so a
+    flooding user never reaches a filter or handler that calls the API.
+    Every update counts against the "message" or "callback" route.
+    Handlers matched later can add a stricter route with the
+    ``rate_limit`` flag (e.g. ``flags={"rate_limit": "payment"}``); those
+    are checked by ``route_middleware``, registered as an inner middleware
+    ahead of AuthMiddleware. A throttled user is told to slow down at most
+    once per ``warning_interval`` seconds, so flooding does not turn into
+    a flood of Bot API replies either.
+    """
+
+    def __init__(
+        self,
+        backend=None,
+        limits: Optional[Dict[str, RateLimit]] = None,
+        warning_interval: float = 10.0,
+    ) -> None:
+        self.backend = backend or create_rate_limit_backend()
+        self.limits = limits if limits is not None else load_limits()
+        self._warned = TTLCache(maxsize=10000, ttl=warning_interval)
+        self.allowed = 0
+        self.throttled = 0
+        self.route_middleware = RouteThrottlingMiddleware(self)
+        super().__init__()
 
     async def __call__(
-        self, handler: Callable, event: Message, data: Dict[str, Any]
+        self,
+        handler: Callable[[Any, Dict[str, Any]], Awaitable[Any]],
+        event: Message | CallbackQuery,
+        data: Dict[str, Any],
     ) -> Any:
-        user_id = event.from_user.id
-        now = time.time()
-
-        if user_id not in self.cache:
-            self.cache[user_id] = []
+        route = "callback" if isinstance(event, CallbackQuery) else "message"
+        if await self.check(route, event):
+            return await handler(event, data)
+        return None
 
-        user_requests = self.cache[user_id]
+    async def check(self, route: str, event: Message | CallbackQuery) -> bool:
+        """Count the event against ``route``; False (after warning) if throttled"""
+        limit = self.limits.get(route)
+        if limit is None or event.from_user is None:
+            return True
 
-        # Remove old requests
-        user_requests = [
-            req_time for req_time in user_requests if now - req_time < self.cache.ttl
-        ]
+        key = f"{route}:{event.from_user.id}"
+        retry_after = await self.backend.hit(key, limit)
+        if not retry_after:
+            self.allowed += 1
+            return True
 
-        if len(user_requests) >= self.max_requests:
+        self.throttled += 1
+        if key not in self._warned:
+            self._warned[key] = True
+            logger.info(f"Throttled {key} for {retry_after:.1f}s")
+            # Message.answer replies in chat; CallbackQuery.answer shows a toast
             await event.answer("Too many requests! Please slow down!")
-            return None
+        return False
 
-        user_requests.append(now)
-        self.cache[user_id] = user_requests
+    def stats(self) -> Dict[str, int]:
+        return {"allowed": self.allowed, "throttled": self.throttled}
+
+
+class RouteThrottlingMiddleware(BaseMiddleware):
+    """
+    Inner middleware applying the matched handler's ``rate_limit`` route
+    on top of the outer per-kind limit. Use
+    ``ThrottlingMiddleware.route_middleware`` rather than building one.
+    """
+
+    def __init__(self, throttling: ThrottlingMiddleware) -> None:
+        self.throttling = throttling
+        super().__init__()
+
+    async def __call__(
+        self,
+        handler: Callable[[Any, Dict[str, Any]], Awaitable[Any]],
+        event: Message | CallbackQuery,
+        data: Dict[str, Any],
+    ) -> Any:
+        route = get_flag(data, "rate_limit")
+        if isinstance(route, str) and not await self.throttling.check(route, event):
+            return None
         return await handler(event, data)
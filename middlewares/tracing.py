@@ -0,0 +1,83 @@
+# middlewares/tracing.py
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware
+from aiogram.dispatcher.event.handler import HandlerObject
+from aiogram.types import CallbackQuery, Message
+
+from data.tracing import (
+    BOT,
+    HandlerStats,
+    current_trace,
+    end_trace,
+    get_handler_stats,
+    start_trace,
+)
+
+
+def handler_name(handler: HandlerObject) -> str:
+    """``mentors.list_mentors`` for handlers.mentors.list_mentors"""
+    callback = handler.callback
+    module = getattr(callback, "__module__", "") or ""
+    name = getattr(callback, "__qualname__", type(callback).__name__)
+    return f"{module.removeprefix('handlers.')}.{name}" if module else name
+
+
+class TracingMiddleware(BaseMiddleware):
+    """
+    Outer middleware timing every update end to end; the trace is recorded
+    in ``stats`` when the update is done. Updates no handler matched are
+    recorded as "unhandled".
+    """
+
+    def __init__(self, stats: HandlerStats = None):
+        self.stats = stats or get_handler_stats()
+        super().__init__()
+
+    async def __call__(
+        self,
+        handler: Callable[[Any, Dict[str, Any]], Awaitable[Any]],
+        event: Message | CallbackQuery,
+        data: Dict[str, Any],
+    ) -> Any:
+        trace, token = start_trace()
+        try:
+            return await handler(event, data)
+        finally:
+            trace.finish()
+            end_trace(token)
+            self.stats.record(trace)
+
+
+class HandlerLabelMiddleware(BaseMiddleware):
+    """
+    Inner middleware naming the current trace after the matched handler.
+    Register it before the other inner middlewares so updates they reject
+    are still attributed.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[Any, Dict[str, Any]], Awaitable[Any]],
+        event: Message | CallbackQuery,
+        data: Dict[str, Any],
+    ) -> Any:
+        trace = current_trace()
+        if trace is not None and "handler" in data:
+            trace.handler = handler_name(data["handler"])
+        return await handler(event, data)
+
+
+class BotAPITimer(BaseRequestMiddleware):
+    """Bot session middleware charging Bot API calls to the current handler"""
+
+    async def __call__(self, make_request, bot, method):
+        trace = current_trace()
+        if trace is None:
+            return await make_request(bot, method)
+        trace.begin(BOT)
+        try:
+            return await make_request(bot, method)
+        finally:
+            trace.end(BOT)
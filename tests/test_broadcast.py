@@ -0,0 +1,139 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import SendMessage
+
+from data.broadcast_store import BLOCKED, DONE, PAUSED, SENT, BroadcastStore
+from data.models import Student
+from utils.broadcast import Broadcast
+
+
+class FakeBot:
+    def __init__(self, flood=0):
+        self.flood = flood
+        self.sent = []
+
+    async def send_message(self, chat_id, text):
+        await asyncio.sleep(0)
+        if self.flood:
+            self.flood -= 1
+            method = SendMessage(chat_id=chat_id, text=text)
+            raise TelegramRetryAfter(method, "Too Many Requests", retry_after=0)
+        self.sent.append(chat_id)
+
+
+def chat_id(student_id: int) -> int:
+    return 1000 + student_id
+
+
+async def students(ids, fail_after=None):
+    """Stream students in id order; raise after ``fail_after`` of them"""
+    for n, student_id in enumerate(ids):
+        if n == fail_after:
+            raise RuntimeError("page failed")
+        yield Student(id=student_id, telegram_id=str(chat_id(student_id)))
+
+
+class BroadcastStoreTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store = BroadcastStore(os.path.join(directory.name, "broadcasts.db"))
+        self.addCleanup(self.store.close)
+        self.job = self.store.create_job("Hello", admin_chat_id=1)
+
+    async def test_save_writes_a_batch_and_the_cursor(self):
+        outcomes = [(1, SENT), (2, SENT), (3, BLOCKED)]
+        self.store.save(self.job.id, outcomes, cursor=3).result()
+        job = self.store.get_job(self.job.id)
+        self.assertEqual((job.sent, job.blocked, job.failed), (2, 1, 0))
+        self.assertEqual(job.cursor, 3)
+        self.assertEqual(await self.store.completed(self.job.id), {1, 2, 3})
+
+    async def test_writes_run_in_order(self):
+        self.store.save(self.job.id, [(1, SENT)], cursor=1)
+        self.store.save(self.job.id, [], cursor=2)
+        await self.store.completed(self.job.id)  # queued behind both writes
+        self.assertEqual(self.store.get_job(self.job.id).cursor, 2)
+
+    def test_unknown_outcome_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.store.save(self.job.id, [(1, "lost")])
+
+
+class BroadcastResumeTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store = BroadcastStore(os.path.join(directory.name, "broadcasts.db"))
+        self.addCleanup(self.store.close)
+        self.bot = FakeBot()
+        self.job = self.store.create_job("Hello", admin_chat_id=1)
+
+    def broadcast(self, recipients):
+        job = self.store.get_job(self.job.id)
+        return Broadcast(
+            self.bot, recipients, job.text, workers=4, job=job, store=self.store
+        )
+
+    async def test_sends_to_everyone_and_finishes(self):
+        broadcast = await self.broadcast(students(range(1, 21))).run()
+        job = self.store.get_job(self.job.id)
+        self.assertEqual(sorted(self.bot.sent), [chat_id(i) for i in range(1, 21)])
+        self.assertEqual((job.status, job.sent, job.cursor), (DONE, 20, 20))
+        self.assertEqual(broadcast.sent, 20)
+
+    async def test_skips_recipients_that_already_have_an_outcome(self):
+        # Handled before a restart, but past the last checkpoint
+        for student_id in (1, 2, 5):
+            self.store.record(self.job.id, chat_id(student_id), SENT)
+
+        await self.broadcast(students(range(1, 11))).run()
+        job = self.store.get_job(self.job.id)
+        self.assertEqual(
+            sorted(self.bot.sent), [chat_id(i) for i in (3, 4, 6, 7, 8, 9, 10)]
+        )
+        self.assertEqual((job.sent, job.cursor), (10, 10))
+
+    async def test_stream_failure_pauses_the_job(self):
+        with self.assertRaises(RuntimeError):
+            await self.broadcast(students(range(1, 21), fail_after=12)).run()
+
+        job = self.store.get_job(self.job.id)
+        self.assertEqual(job.status, PAUSED)
+        self.assertEqual((job.sent, job.cursor), (12, 12))
+        self.assertEqual(
+            [unfinished.id for unfinished in self.store.unfinished_jobs()],
+            [self.job.id],
+        )
+
+    async def test_resumes_past_the_cursor_without_duplicates(self):
+        with self.assertRaises(RuntimeError):
+            await self.broadcast(students(range(1, 21), fail_after=12)).run()
+
+        cursor = self.store.get_job(self.job.id).cursor
+        await self.broadcast(students(range(cursor + 1, 21))).run()
+        job = self.store.get_job(self.job.id)
+        self.assertEqual(sorted(self.bot.sent), [chat_id(i) for i in range(1, 21)])
+        self.assertEqual((job.status, job.sent), (DONE, 20))
+
+
+class BroadcastRetryTests(unittest.IsolatedAsyncioTestCase):
+    async def test_flood_control_is_retried_once_per_answer(self):
+        bot = FakeBot(flood=2)
+        broadcast = await Broadcast(bot, students(range(1, 4)), "Hi", workers=1).run()
+        self.assertEqual(sorted(bot.sent), [chat_id(i) for i in range(1, 4)])
+        self.assertEqual((broadcast.sent, broadcast.retry_after), (3, 2))
+
+    async def test_gives_up_after_max_attempts(self):
+        bot = FakeBot(flood=3)
+        broadcast = Broadcast(bot, students([1]), "Hi", workers=1, max_attempts=3)
+        await broadcast.run()
+        self.assertEqual((broadcast.sent, broadcast.failed), (0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
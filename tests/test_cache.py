@@ -0,0 +1,99 @@
+import asyncio
+import unittest
+
+from data.cache import CatalogCache
+
+
+class Loader:
+    """Counts calls and returns the next value"""
+
+    def __init__(self, *values):
+        self.values = list(values)
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return self.values.pop(0)
+
+
+class CatalogCacheTests(unittest.IsolatedAsyncioTestCase):
+    def cache(self, **kwargs):
+        kwargs.setdefault("ttls", {"courses": 0.05})
+        kwargs.setdefault("stale_ttl", 0.2)
+        return CatalogCache(**kwargs)
+
+    async def test_fresh_entries_are_served_from_cache(self):
+        cache = self.cache()
+        loader = Loader("a", "b")
+        self.assertEqual(await cache.get_or_load("courses", 1, loader), "a")
+        self.assertEqual(await cache.get_or_load("courses", 1, loader), "a")
+        self.assertEqual(loader.calls, 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    async def test_params_are_cached_separately(self):
+        cache = self.cache()
+        await cache.get_or_load("courses", 1, Loader("a"))
+        self.assertEqual(await cache.get_or_load("courses", 2, Loader("b")), "b")
+
+    async def test_stale_entry_is_served_while_one_refresh_runs(self):
+        cache = self.cache()
+        loader = Loader("a", "b")
+        await cache.get_or_load("courses", 1, loader)
+        await asyncio.sleep(0.06)
+
+        # Both reads get the stale value; only one refresh is started
+        first = await cache.get_or_load("courses", 1, loader)
+        second = await cache.get_or_load("courses", 1, loader)
+        self.assertEqual((first, second), ("a", "a"))
+        await asyncio.gather(*cache._tasks)
+
+        self.assertEqual(loader.calls, 2)
+        self.assertEqual(cache.stale_hits, 2)
+        self.assertEqual(cache.refreshes, 1)
+        self.assertEqual(await cache.get_or_load("courses", 1, loader), "b")
+
+    async def test_entries_past_the_stale_window_are_reloaded(self):
+        cache = self.cache(stale_ttl=0)
+        loader = Loader("a", "b")
+        await cache.get_or_load("courses", 1, loader)
+        await asyncio.sleep(0.06)
+        self.assertEqual(await cache.get_or_load("courses", 1, loader), "b")
+        self.assertEqual(cache.misses, 2)
+
+    async def test_failed_loads_are_not_cached(self):
+        cache = self.cache()
+        loader = Loader(None, "a")
+        self.assertIsNone(await cache.get_or_load("courses", 1, loader))
+        self.assertEqual(await cache.get_or_load("courses", 1, loader), "a")
+
+    async def test_failed_refresh_keeps_the_stale_value(self):
+        cache = self.cache()
+        loader = Loader("a", None)
+        await cache.get_or_load("courses", 1, loader)
+        await asyncio.sleep(0.06)
+        await cache.get_or_load("courses", 1, loader)
+        await asyncio.gather(*cache._tasks)
+        self.assertEqual(await cache.get_or_load("courses", 1, loader), "a")
+
+    async def test_least_recently_used_entry_is_evicted(self):
+        cache = self.cache(maxsize=2)
+        await cache.get_or_load("courses", 1, Loader("a"))
+        await cache.get_or_load("courses", 2, Loader("b"))
+        await cache.get_or_load("courses", 1, Loader())  # touch 1
+        await cache.get_or_load("courses", 3, Loader("c"))
+
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(await cache.get_or_load("courses", 1, Loader()), "a")
+        self.assertEqual(await cache.get_or_load("courses", 2, Loader("b2")), "b2")
+
+    async def test_invalidate_one_resource(self):
+        cache = self.cache(ttls={"courses": 60, "mentors": 60})
+        await cache.get_or_load("courses", 1, Loader("a"))
+        await cache.get_or_load("mentors", 1, Loader("m"))
+        cache.invalidate("courses")
+        self.assertEqual(await cache.get_or_load("courses", 1, Loader("a2")), "a2")
+        self.assertEqual(await cache.get_or_load("mentors", 1, Loader()), "m")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import asyncio
+import time
+import unittest
+
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import AnswerCallbackQuery, SendMessage
+
+from data.rate_limit import RateLimit
+from middlewares.rate_governor import TelegramRateGovernor, bulk
+
+
+class FakeApi:
+    """``make_request`` that records chats and raises RetryAfter on demand"""
+
+    def __init__(self, flood=0):
+        self.flood = flood
+        self.calls = []
+
+    async def __call__(self, bot, method):
+        self.calls.append(getattr(method, "chat_id", None))
+        if self.flood:
+            self.flood -= 1
+            raise TelegramRetryAfter(method, "Too Many Requests", retry_after=0)
+        return True
+
+
+def send(chat_id):
+    return SendMessage(chat_id=chat_id, text="hi")
+
+
+class TelegramRateGovernorTests(unittest.IsolatedAsyncioTestCase):
+    def governor(self, **kwargs):
+        kwargs.setdefault("global_rate", 1000)
+        kwargs.setdefault("chat_limit", RateLimit(100, 1))
+        return TelegramRateGovernor(**kwargs)
+
+    async def test_ungoverned_methods_pass_through(self):
+        governor = self.governor()
+        api = FakeApi()
+        await governor(api, None, AnswerCallbackQuery(callback_query_id="1"))
+        self.assertEqual(governor.stats()["sent"], 0)
+        self.assertEqual(len(api.calls), 1)
+
+    async def test_chat_budget_spaces_sends(self):
+        governor = self.governor(chat_limit=RateLimit(1, 0.05))
+        api = FakeApi()
+        started = time.monotonic()
+        await governor(api, None, send(1))
+        await governor(api, None, send(1))
+        self.assertGreaterEqual(time.monotonic() - started, 0.04)
+        self.assertEqual(governor.stats()["sent"], 2)
+
+    async def test_interactive_calls_go_before_bulk(self):
+        governor = self.governor(global_rate=20)
+        api = FakeApi()
+
+        async def bulk_send(chat_id):
+            with bulk():
+                await governor(api, None, send(chat_id))
+
+        await asyncio.gather(bulk_send(1), bulk_send(2), governor(api, None, send(3)))
+        self.assertLess(api.calls.index(3), api.calls.index(2))
+
+    async def test_interactive_calls_are_retried(self):
+        governor = self.governor(max_retries=2)
+        api = FakeApi(flood=2)
+        self.assertTrue(await governor(api, None, send(1)))
+        self.assertEqual(len(api.calls), 3)
+        self.assertEqual(governor.stats()["retry_after"], 2)
+
+    async def test_retries_are_bounded(self):
+        governor = self.governor(max_retries=1)
+        api = FakeApi(flood=5)
+        with self.assertRaises(TelegramRetryAfter):
+            await governor(api, None, send(1))
+        self.assertEqual(len(api.calls), 2)
+
+    async def test_bulk_calls_are_left_to_the_sender_to_retry(self):
+        governor = self.governor(max_retries=3)
+        api = FakeApi(flood=1)
+        with bulk(), self.assertRaises(TelegramRetryAfter):
+            await governor(api, None, send(1))
+        self.assertEqual(len(api.calls), 1)
+        self.assertEqual(governor.stats()["retry_after"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
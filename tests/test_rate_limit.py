@@ -0,0 +1,122 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from data.rate_limit import MemoryRateLimitBackend, RateLimit, SQLiteRateLimitBackend
+from middlewares.throttling import ThrottlingMiddleware
+
+
+class RateLimitTests(unittest.TestCase):
+    def test_parse(self):
+        self.assertEqual(RateLimit.parse("5/10"), RateLimit(5, 10.0))
+        self.assertEqual(RateLimit.parse("3"), RateLimit(3, 1.0))
+        with self.assertRaises(ValueError):
+            RateLimit.parse("x/10")
+
+    def test_burst_then_one_per_interval(self):
+        limit = RateLimit(3, 3)
+        tat = None
+        for _ in range(3):
+            tat, retry_after = limit.apply(tat, 0.0)
+            self.assertEqual(retry_after, 0)
+
+        rejected, retry_after = limit.apply(tat, 0.0)
+        self.assertEqual((rejected, retry_after), (tat, 1.0))
+        self.assertEqual(limit.apply(tat, 1.0)[1], 0)
+
+    def test_reserve_always_takes_a_slot(self):
+        limit = RateLimit(2, 2)
+        tat = None
+        delays = []
+        for _ in range(4):
+            tat, delay = limit.reserve(tat, 0.0)
+            delays.append(delay)
+        self.assertEqual(delays, [0.0, 0.0, 1.0, 2.0])
+
+
+class MemoryBackendTests(unittest.IsolatedAsyncioTestCase):
+    async def test_keys_are_limited_separately(self):
+        backend = MemoryRateLimitBackend()
+        limit = RateLimit(2, 60)
+        self.assertEqual(await backend.hit("a", limit), 0)
+        self.assertEqual(await backend.hit("a", limit), 0)
+        self.assertGreater(await backend.hit("a", limit), 0)
+        self.assertEqual(await backend.hit("b", limit), 0)
+
+    async def test_least_recently_used_key_is_evicted(self):
+        backend = MemoryRateLimitBackend(maxsize=2)
+        limit = RateLimit(1, 60)
+        for key in ("a", "b", "c"):
+            await backend.hit(key, limit)
+        self.assertEqual(len(backend), 2)
+        # "a" was forgotten, so it starts with a fresh burst
+        self.assertEqual(await backend.hit("a", limit), 0)
+        self.assertGreater(await backend.hit("c", limit), 0)
+
+
+class SQLiteBackendTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "ratelimit.db")
+
+    def backend(self) -> SQLiteRateLimitBackend:
+        backend = SQLiteRateLimitBackend(self.path)
+        self.addCleanup(backend.close)
+        return backend
+
+    async def test_processes_share_the_limit(self):
+        limit = RateLimit(2, 60)
+        first, second = self.backend(), self.backend()
+        self.assertEqual(await first.hit("a", limit), 0)
+        self.assertEqual(await second.hit("a", limit), 0)
+        self.assertGreater(await first.hit("a", limit), 0)
+        self.assertGreater(await second.hit("a", limit), 0)
+
+
+class FakeMessage:
+    def __init__(self, user_id=1):
+        self.from_user = SimpleNamespace(id=user_id)
+        self.answers = []
+
+    async def answer(self, text):
+        self.answers.append(text)
+
+
+class ThrottlingMiddlewareTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.throttling = ThrottlingMiddleware(
+            backend=MemoryRateLimitBackend(),
+            limits={"message": RateLimit(2, 60), "payment": RateLimit(1, 60)},
+        )
+        self.handled = 0
+
+    async def handler(self, event, data):
+        self.handled += 1
+
+    async def test_drops_updates_over_the_limit_and_warns_once(self):
+        message = FakeMessage()
+        for _ in range(4):
+            await self.throttling(self.handler, message, {})
+        self.assertEqual(self.handled, 2)
+        self.assertEqual(len(message.answers), 1)
+        self.assertEqual(self.throttling.stats(), {"allowed": 2, "throttled": 2})
+
+    async def test_route_flag_adds_a_limit(self):
+        data = {"handler": SimpleNamespace(flags={"rate_limit": "payment"})}
+        message = FakeMessage()
+        route = self.throttling.route_middleware
+        await route(self.handler, message, data)
+        await route(self.handler, message, data)
+        self.assertEqual(self.handled, 1)
+
+    async def test_unflagged_handlers_pass_the_route_middleware(self):
+        data = {"handler": SimpleNamespace(flags={})}
+        for _ in range(3):
+            await self.throttling.route_middleware(self.handler, FakeMessage(), data)
+        self.assertEqual(self.handled, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import time
+import unittest
+
+from data.token_renewal import TokenRenewalScheduler
+
+
+class FakeClient:
+    def __init__(self, expiries):
+        self.expiries = expiries
+        self.refreshed = []
+
+    def recently_active_users(self, window):
+        return list(self.expiries)
+
+    async def token_expires_at(self, telegram_id):
+        return self.expiries[telegram_id]
+
+    async def refresh_token(self, telegram_id):
+        self.refreshed.append(telegram_id)
+        return True
+
+
+class TokenRenewalTests(unittest.IsolatedAsyncioTestCase):
+    async def test_renews_tokens_about_to_expire(self):
+        now = time.time()
+        client = FakeClient(
+            {
+                1: now + 60,  # due
+                2: now + 7200,  # not yet
+                3: now - 60,  # already expired
+                4: None,  # no token
+            }
+        )
+        scheduler = TokenRenewalScheduler(client, renew_before=1800, jitter=0)
+        self.assertEqual(await scheduler.run_once(), 1)
+        self.assertEqual(client.refreshed, [1])
+
+    async def test_budget_defers_the_latest_expiring(self):
+        now = time.time()
+        client = FakeClient({1: now + 300, 2: now + 60, 3: now + 600})
+        scheduler = TokenRenewalScheduler(
+            client, renew_before=1800, max_per_minute=2, jitter=0
+        )
+        await scheduler.run_once()
+        self.assertEqual(sorted(client.refreshed), [1, 2])
+        self.assertEqual(scheduler.deferred, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+
+from data.token_store import MemoryTokenStore, SQLiteTokenStore
+
+
+class MemoryTokenStoreTests(unittest.IsolatedAsyncioTestCase):
+    async def test_get_returns_unexpired_tokens(self):
+        store = MemoryTokenStore()
+        expires_at = time.time() + 60
+        await store.set(1, "token", expires_at)
+        self.assertEqual(await store.get(1), "token")
+        self.assertEqual(await store.get("1"), "token")
+        self.assertEqual(await store.expires_at(1), expires_at)
+        self.assertIsNone(await store.get(2))
+
+    async def test_expired_tokens_are_dropped_on_read(self):
+        store = MemoryTokenStore()
+        await store.set(1, "token", time.time() - 1)
+        self.assertIsNone(await store.get(1))
+        self.assertEqual(len(store), 0)
+
+    async def test_least_recently_used_token_is_evicted(self):
+        store = MemoryTokenStore(maxsize=2)
+        expires_at = time.time() + 60
+        await store.set(1, "a", expires_at)
+        await store.set(2, "b", expires_at)
+        await store.get(1)
+        await store.set(3, "c", expires_at)
+        self.assertEqual(await store.get(1), "a")
+        self.assertIsNone(await store.get(2))
+
+    async def test_sweep_removes_expired_tokens(self):
+        store = MemoryTokenStore()
+        await store.set(1, "old", time.time() - 1)
+        await store.set(2, "new", time.time() + 60)
+        self.assertEqual(store.sweep(), 1)
+        self.assertEqual(len(store), 1)
+
+    async def test_delete(self):
+        store = MemoryTokenStore()
+        await store.set(1, "token", time.time() + 60)
+        await store.delete(1)
+        self.assertIsNone(await store.get(1))
+
+
+class SQLiteTokenStoreTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "tokens.db")
+
+    def store(self, **kwargs) -> SQLiteTokenStore:
+        store = SQLiteTokenStore(self.path, **kwargs)
+        self.addCleanup(store.close)
+        return store
+
+    async def test_tokens_survive_a_restart(self):
+        expires_at = time.time() + 60
+        first = self.store()
+        await first.set(1, "token", expires_at)
+        first.close()
+
+        second = self.store()
+        self.assertEqual(len(second), 0)
+        self.assertEqual(await second.expires_at(1), expires_at)
+        self.assertEqual(await second.get(1), "token")
+        self.assertEqual(len(second), 1)  # now cached in memory
+
+    async def test_evicted_tokens_are_read_back_from_the_file(self):
+        store = self.store(maxsize=1)
+        await store.set(1, "a", time.time() + 60)
+        await store.set(2, "b", time.time() + 60)
+        self.assertEqual(await store.get(1), "a")
+
+    async def test_expired_tokens_in_the_file_are_deleted(self):
+        store = self.store()
+        await store.set(1, "token", time.time() - 1)
+        self.assertIsNone(await store.get(1))
+        row = sqlite3.connect(self.path).execute("SELECT COUNT(*) FROM tokens")
+        self.assertEqual(row.fetchone()[0], 0)
+
+    async def test_delete_removes_the_file_entry(self):
+        store = self.store()
+        await store.set(1, "token", time.time() + 60)
+        await store.delete(1)
+        store.close()
+        self.assertIsNone(await self.store().get(1))
+
+    async def test_expired_tokens_are_swept_on_open(self):
+        first = self.store()
+        await first.set(1, "old", time.time() - 1)
+        await first.set(2, "new", time.time() + 60)
+        first.close()
+
+        self.store()
+        rows = sqlite3.connect(self.path).execute("SELECT telegram_id FROM tokens")
+        self.assertEqual(rows.fetchall(), [("2",)])
+
+
+if __name__ == "__main__":
+    unittest.main()
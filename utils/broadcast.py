@@ -0,0 +1,324 @@
+# utils/broadcast.py
+import asyncio
+import contextlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import date, timedelta
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramForbiddenError, TelegramRetryAfter
+
+from data.broadcast_store import (
+    BLOCKED,
+    CANCELLED,
+    DONE,
+    FAILED,
+    PAUSED,
+    RUNNING,
+    SENT,
+    BroadcastJob,
+    BroadcastStore,
+)
+from data.models import Student
+from middlewares.rate_governor import bulk
+
+logger = logging.getLogger(__name__)
+
+
+def audience_from_choice(choice: str) -> Optional[Dict[str, Any]]:
+    """
+    Audience filters for a picker choice (the part of the callback data
+    after ``audience_``); None if the choice needs a further step or is
+    unknown. Relative dates are fixed at pick time, so a resumed job keeps
+    the same audience.
+    """
+    kind, _, value = choice.partition("_")
+    if kind == "all":
+        return {}
+    if kind == "lang" and value:
+        return {"language": value}
+    if kind == "course" and value.isdigit():
+        return {"course": int(value)}
+    if kind == "pending":
+        return {"payment_status": "pending"}
+    if kind == "new" and value.isdigit():
+        since = date.today() - timedelta(days=int(value))
+        return {"registered_after": since.isoformat()}
+    return None
+
+
+def describe_audience(audience: Optional[Dict[str, Any]]) -> str:
+    if not audience:
+        return "all students"
+    return ", ".join(f"{name}={value}" for name, value in audience.items())
+
+
+class Broadcast:
+    """
+    Send one text to a stream of students with a bounded pool of workers.
+
+    Recipients are read lazily into a small queue, so memory stays flat
+    however many students there are. All sends run with bulk priority:
+    the Bot session's rate governor paces them at Telegram's global rate
+    and lets interactive replies go first, and ``workers`` only needs to
+    be large enough to keep that rate saturated despite request latency.
+    The governor does not retry bulk sends, so a RetryAfter reaches
+    ``_send``, which pauses every worker for the requested time and
+    retries the chat up to ``max_attempts`` sends in total.
+
+    With a ``job`` and ``store`` every outcome is persisted as it happens
+    and the job's cursor advances past students (in id order) once they
+    and everyone before them are handled; recipients that already have an
+    outcome (loaded once when the run starts) are skipped, so a job
+    restarted from its cursor never sends twice. Writes go to the store's
+    writer thread; outcomes that finish while a write is in flight are
+    committed together with the next one. If the recipient stream fails, whoever was already queued is
+    still served, then the job is paused at its checkpoint and ``run``
+    raises the error, so the job can be resumed rather than ending early.
+
+    Args:
+        bot: Bot used to send.
+        recipients: Async iterator of students, in id order.
+        text: Message text (HTML, like the rest of the bot).
+        workers: Concurrent senders.
+        max_attempts: Sends per chat before it is counted as failed.
+        job: Persisted job this run belongs to.
+        store: Store the job lives in.
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        recipients: AsyncIterator[Student],
+        text: str,
+        workers: int = int(os.getenv("BROADCAST_WORKERS", 20)),
+        max_attempts: int = 3,
+        job: Optional[BroadcastJob] = None,
+        store: Optional[BroadcastStore] = None,
+    ):
+        self.bot = bot
+        self.recipients = recipients
+        self.text = text
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.job = job
+        self.store = store if job is not None else None
+        self.sent = job.sent if job else 0
+        self.blocked = job.blocked if job else 0
+        self.failed = job.failed if job else 0
+        self.cursor = job.cursor if job else None
+        self.retry_after = 0
+        self.cancelled = False
+        self.error: Optional[Exception] = None  # why the recipient stream failed
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self._initial = self.processed
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=workers * 4)
+        self._pending: "OrderedDict[int, bool]" = OrderedDict()  # id -> done
+        self._checkpointed = self.cursor
+        self._outcomes: List[Tuple[int, str]] = []  # not yet handed to the store
+        self._write: Optional[Future] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._resume_at = 0.0
+        self._running = asyncio.Event()
+        self._running.set()
+
+    @property
+    def processed(self) -> int:
+        return self.sent + self.blocked + self.failed
+
+    @property
+    def paused(self) -> bool:
+        return not self._running.is_set()
+
+    @property
+    def elapsed(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def rate(self) -> float:
+        """Chats processed per second in this run"""
+        return (self.processed - self._initial) / self.elapsed if self.elapsed else 0.0
+
+    def pause(self):
+        """Stop starting new sends; sends already in flight finish"""
+        self._running.clear()
+        self._set_status(PAUSED)
+        self._flush()
+
+    def resume(self):
+        self._running.set()
+        self._set_status(RUNNING)
+
+    def cancel(self):
+        """Drop the remaining recipients; ``run`` returns once in-flight sends end"""
+        self.cancelled = True
+        self._running.set()
+        self._set_status(CANCELLED)
+
+    async def run(
+        self,
+        on_progress: Optional[Callable[["Broadcast"], Awaitable[None]]] = None,
+        progress_interval: float = float(os.getenv("BROADCAST_PROGRESS_INTERVAL", 5)),
+    ) -> "Broadcast":
+        """
+        Send to every recipient and return self. ``on_progress`` is
+        awaited every ``progress_interval`` seconds while running. If the
+        task is cancelled (e.g. on shutdown) the job stays resumable.
+
+        Raises:
+            Exception: The recipient stream's error, after pausing the job.
+        """
+        self.started = time.monotonic()
+        # Tasks copy the current context, so they all inherit bulk priority
+        with bulk():
+            workers = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+            reporter = None
+            if on_progress is not None:
+                reporter = asyncio.create_task(
+                    self._report(on_progress, progress_interval)
+                )
+            try:
+                await self._produce()
+                await self._queue.join()
+                if self.error is not None:
+                    # Not done: keep the job resumable from its checkpoint
+                    self.pause()
+                    raise self.error
+            finally:
+                for task in workers + [reporter]:
+                    if task is not None:
+                        task.cancel()
+                await asyncio.gather(
+                    *workers, *([reporter] if reporter else []), return_exceptions=True
+                )
+                self.finished = time.monotonic()
+                await self._drain()
+                logger.info(
+                    f"Broadcast stopped after {self.elapsed:.1f}s: {self.sent} sent, "
+                    f"{self.blocked} blocked, {self.failed} failed"
+                )
+        if not self.cancelled:
+            self._set_status(DONE)
+        return self
+
+    async def _produce(self):
+        try:
+            done = await self.store.completed(self.job.id) if self.store else set()
+            async for student in self.recipients:
+                if self.cancelled:
+                    return
+                chat_id = int(student.telegram_id)
+                if chat_id in done:
+                    # Handled before a restart; only move the cursor past it
+                    self._pending[student.id] = True
+                    self._advance()
+                    continue
+                self._pending[student.id] = False
+                await self._queue.put((student.id, chat_id))
+        except Exception as e:
+            # Deliver to whoever was already queued, then fail the run
+            logger.error(f"Broadcast recipient stream failed: {e}")
+            self.error = e
+
+    async def _worker(self):
+        while True:
+            student_id, chat_id = await self._queue.get()
+            try:
+                await self._running.wait()
+                if not self.cancelled:
+                    self._finish(student_id, chat_id, await self._send(chat_id))
+            finally:
+                self._queue.task_done()
+
+    async def _send(self, chat_id: int) -> str:
+        for _ in range(self.max_attempts):
+            delay = self._resume_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                await self.bot.send_message(chat_id, self.text)
+                return SENT
+            except TelegramRetryAfter as e:
+                self.retry_after += 1
+                self._resume_at = max(self._resume_at, time.monotonic() + e.retry_after)
+                logger.warning(f"Broadcast paused for {e.retry_after}s")
+            except TelegramForbiddenError:
+                # The user blocked the bot or deleted their account
+                return BLOCKED
+            except Exception as e:
+                logger.error(f"Target [ID:{chat_id}]: failed - {e}")
+                return FAILED
+        return FAILED
+
+    def _finish(self, student_id: int, chat_id: int, outcome: str):
+        setattr(self, outcome, getattr(self, outcome) + 1)
+        if self.store:
+            self._outcomes.append((chat_id, outcome))
+        self._pending[student_id] = True
+        self._advance()
+        self._flush()
+
+    def _advance(self):
+        """Move the cursor past the leading run of handled students"""
+        while self._pending:
+            student_id, done = next(iter(self._pending.items()))
+            if not done:
+                return
+            self._pending.popitem(last=False)
+            self.cursor = student_id
+
+    def _flush(self):
+        """
+        Hand buffered outcomes and the cursor to the store. Only one write
+        is in flight at a time; whatever finishes meanwhile goes out with
+        the next one, started when the current write completes.
+        """
+        if not self.store or (self._write is not None and not self._write.done()):
+            return
+        if not self._outcomes and self.cursor == self._checkpointed:
+            return
+        outcomes, self._outcomes = self._outcomes, []
+        # Every student up to the cursor has its outcome in this write or
+        # an earlier one, and the store writes them in order
+        self._write = self.store.save(self.job.id, outcomes, self.cursor)
+        self._checkpointed = self.cursor
+        self._loop = asyncio.get_running_loop()
+        self._write.add_done_callback(self._written)
+
+    def _written(self, future: Future):
+        # Runs on the store's writer thread
+        with contextlib.suppress(RuntimeError):  # loop already closed
+            self._loop.call_soon_threadsafe(self._flush)
+
+    async def _drain(self):
+        """Wait until every outcome and the final cursor are written"""
+        self._flush()
+        while self._write is not None and not self._write.done():
+            await asyncio.wrap_future(self._write)
+            self._flush()
+
+    def _set_status(self, status: str):
+        if self.store:
+            self.store.set_status(self.job.id, status)
+
+    async def _report(self, on_progress, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            self._flush()
+            try:
+                await on_progress(self)
+            except Exception as e:
+                logger.error(f"Broadcast progress report failed: {e}")
+
+    def summary(self) -> str:
+        return (
+            f"{self.sent} sent, {self.blocked} blocked, {self.failed} failed "
+            f"in {self.elapsed:.0f}s ({self.rate:.1f}/s)"
+        )
@@ -12,11 +12,10 @@ class MentorNameFilter(BaseFilter):
             if not api_client:
                 return False
                 
-            mentors = await api_client.get_mentors(telegram_id=message.from_user.id)
-            mentor_names = [mentor["name"].lower() for mentor in mentors]
-            
-            is_mentor = message.text.lower() in mentor_names
-            return {"mentor_name": message.text} if is_mentor else False
+            mentor = await api_client.get_mentor_by_name(
+                message.text, telegram_id=message.from_user.id
+            )
+            return {"mentor_name": message.text} if mentor else False
 
         except Exception as e:
             logger.error(f"Error in MentorNameFilter: {e}")